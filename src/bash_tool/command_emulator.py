@@ -162,20 +162,958 @@ Additional commands can be added by:
 3. Follow existing patterns for flag parsing and output formatting
 """
 import re
+import base64
+import json
+import functools
 from pathlib import Path
 import logging
+import mmap
+import os
 import shlex
+import operator
+import shutil
+import string
 from pathlib import Path
 from typing import Optional, List, Tuple
 
+
+# Long-form flag with inline value: --key=2, --field-separator=:, --skip-fields=1
+_LONG_FLAG_RE = re.compile(r'--([a-z-]+)=(.*)')
+
+# Single-pass escaping for user values embedded in the emitted scripts:
+# - _PS_ESCAPE_TABLE: PowerShell single-quoted literal (sites inside
+#   -Command "..." also escape " for the command line, separately)
+# - _PS_DQ_ESCAPE_TABLE: PowerShell double-quoted string (backtick escapes)
+_PS_ESCAPE_TABLE = str.maketrans({"'": "''"})
+_PS_DQ_ESCAPE_TABLE = str.maketrans({'`': '``', '"': '`"', '$': '`$'})
+
+
+def _ps_quote(value: str) -> str:
+    """Escape value for use inside a PowerShell double-quoted string."""
+    return value.translate(_PS_DQ_ESCAPE_TABLE)
+
+
+# Wrappers emitted around PowerShell scripts (see _ps_encoded / powershell_script)
+# No profile/logo/policy lookup: cuts PowerShell spawn cost on every translation
+_PS_HOST = 'powershell -NoProfile -NonInteractive -NoLogo -ExecutionPolicy Bypass'
+_PS_COMMAND = f'{_PS_HOST} -Command'
+_PS_ENCODED_PREFIX = f'{_PS_HOST} -EncodedCommand '
+_PS_COMMAND_PREFIX = f'{_PS_COMMAND} "'
+# One wrapper = one base64 token / no bare quote inside -Command "..."
+_BASE64_TOKEN_RE = re.compile(r'[A-Za-z0-9+/]+={0,2}')
+_PS_UNESCAPED_QUOTE_RE = re.compile(r'(?<!\\)"')
+
+
+# Zero-work translations: fixed strings, served before the command is even tokenized
+_STATIC_TRANSLATIONS = {
+    'true': 'exit /b 0',
+    'false': 'exit /b 1',
+    'whoami': 'echo %USERNAME%',
+    'hostname': 'hostname',
+}
+
+# seq operand: integer or decimal, optionally negative
+_SEQ_NUMBER_RE = re.compile(r'-?\d+(?:\.\d+)?')
+# Int32.MaxValue: bound on [System.Linq.Enumerable]::Range start, count and last value
+_INT32_MAX = 2147483647
+
+# Commands the emulator can also run in-process (see execute_locally)
+_LOCAL_COMMANDS = frozenset({'strings'})
+
+
+@functools.lru_cache(maxsize=None)
+def _strings_bytes_re(min_len: int):
+    """strings: runs of printable ASCII (32-126), compiled once per length"""
+    return re.compile(rb'[\x20-\x7e]{%d,}' % min_len)
+
+
+# stdin as ONE string (no $input enumerator: one pipeline object per line)
+_PS_READ_STDIN = '$IN = [Console]::In.ReadToEnd()'
+# ... split into lines (final newline dropped, CRLF tolerated)
+_PS_READ_STDIN_LINES = f"{_PS_READ_STDIN} -replace '\\r?\\n\\z'; $lines = if ($IN) {{ $IN -split '\\r?\\n' }} else {{ @() }}"
+# stdin as a raw byte Stream (binary-safe). The persistent host and the
+# batched pipeline swap [Console]::In for a StringReader and set
+# $__stdinSwapped: then the input is that text, and the real stdin handle
+# (the host's command pipe) is not ours. No type check on [Console]::In:
+# SetIn wraps every reader in a SyncTextReader
+_PS_OPEN_STDIN_STREAM = (
+    '$in = if ($__stdinSwapped) '
+    '{ [System.IO.MemoryStream]::new([System.Text.Encoding]::UTF8.GetBytes([Console]::In.ReadToEnd())) } '
+    'else { [Console]::OpenStandardInput() }'
+)
+
+
+def _ps_encoded(script: str) -> str:
+    """
+    Wrap a PowerShell script as -EncodedCommand (base64 of UTF-16LE).
+
+    The script travels as one opaque token: cmd.exe and the PowerShell
+    command-line parser never see its quotes, so it is written as plain
+    PowerShell (values escaped with _ps_quote only).
+    """
+    encoded = base64.b64encode(script.encode('utf-16-le')).decode('ascii')
+    return f'{_PS_ENCODED_PREFIX}{encoded}'
+
+
+# Probed native binaries (tar/sed/awk/...) run from an argv list, never
+# through cmd.exe: no ^ % ( ) & re-parsing of the user's arguments.
+# The translation carries the argv as JSON; CommandEmulator.native_argv unwraps it
+_NATIVE_ARGV_PREFIX = 'native-argv '
+
+
+def _native_command(exe: str, args: List[str]) -> str:
+    """Mark a translation as 'run exe with exactly these args, no shell'."""
+    return _NATIVE_ARGV_PREFIX + json.dumps([exe] + list(args))
+
+
+def _native_args(cmd: str) -> List[str]:
+    """
+    Arguments of cmd as the native binary must receive them.
+
+    Shell quotes removed ('s/a b/c/' → s/a b/c/), backslashes kept
+    literal (Windows paths). Unbalanced quotes: plain whitespace split.
+    """
+    lexer = shlex.shlex(cmd, posix=True)
+    lexer.whitespace_split = True
+    lexer.escape = ''
+    try:
+        return list(lexer)[1:]
+    except ValueError:
+        return cmd.split()[1:]
+
+
+def _ps_native_call(argv: List[str]) -> str:
+    """PowerShell statement running argv directly (& 'exe' 'arg' ...)."""
+    return '& ' + ' '.join("'{}'".format(arg.replace("'", "''")) for arg in argv)
+
+
+def _tr_char_class(chars: str, negate: bool = False) -> str:
+    """
+    .NET regex character class for a tr set, safe in any PowerShell literal.
+
+    Every char is written as \\uXXXX (consecutive codes as ranges): ] \\ ^ -
+    $ ` " ' in the set need no escaping at all.
+    """
+    ranges = []
+    for code in sorted({ord(c) for c in chars if ord(c) <= 0xFFFF}):
+        if ranges and code == ranges[-1][1] + 1:
+            ranges[-1][1] = code
+        else:
+            ranges.append([code, code])
+    if not ranges:
+        # Empty set: matches nothing / (complement) everything
+        return '[\\s\\S]' if negate else '(?!)'
+    body = ''.join(f'\\u{lo:04X}' if lo == hi else f'\\u{lo:04X}-\\u{hi:04X}' for lo, hi in ranges)
+    return f"[{'^' if negate else ''}{body}]"
+
+
+def _tr_replacement(char: str) -> str:
+    """PowerShell expression: [regex]::Replace replacement inserting char literally."""
+    if not char:
+        return "''"
+    if char == '$':
+        return "'$$'"
+    return f'[string][char]{ord(char)}'
+
+
+def _tr_map(set1: str, set2: str) -> str:
+    """$map = @{code = [char]code; ...}: SET1 → SET2 padded with its last char (GNU)."""
+    padded = set2 + set2[-1] * (len(set1) - len(set2))
+    mapping = dict(zip(map(ord, set1), map(ord, padded)))  # repeated SET1 char: last wins
+    return '$map = @{' + '; '.join(f'{f} = [char]{t}' for f, t in mapping.items()) + '}'
+
+
+# MatchEvaluator for _tr_map: one hashtable lookup per matched char
+_TR_MAP_EVALUATOR = '{ param($m) [string]$map[[int]$m.Value[0]] }'
+
+
+# Whole-file byte read for emitted scripts: unbuffered (bufferSize 1 - the
+# destination array IS the buffer), synchronous, SequentialScan cache hint
+_PS_READ_ALL_BYTES_FN = r'''
+function Read-AllBytes([string]$path) {
+    $fs = [System.IO.FileStream]::new($path, 'Open', 'Read', 'Read', 1, [System.IO.FileOptions]::SequentialScan)
+    try {
+        $buf = [byte[]]::new($fs.Length)
+        $n = 0
+        while ($n -lt $buf.Length) {
+            $r = $fs.Read($buf, $n, $buf.Length - $n)
+            if ($r -le 0) { break }
+            $n += $r
+        }
+        ,$buf
+    } finally { $fs.Dispose() }
+}
+'''
+
+# gzip/gunzip and jq: short/long spellings of each flag
+_GZIP_STDOUT_FLAGS = frozenset({'-c', '--stdout'})
+_GZIP_DECOMPRESS_FLAGS = frozenset({'-d', '--decompress'})
+_GZIP_KEEP_FLAGS = frozenset({'-k', '--keep'})
+_GZIP_FORCE_FLAGS = frozenset({'-f', '--force'})
+_GZIP_RECURSIVE_FLAGS = frozenset({'-r', '--recursive'})
+_JQ_RAW_OUTPUT_FLAGS = frozenset({'-r', '--raw-output'})
+_JQ_COMPACT_FLAGS = frozenset({'-c', '--compact-output'})
+_JQ_NULL_INPUT_FLAGS = frozenset({'-n', '--null-input'})
+_JQ_SLURP_FLAGS = frozenset({'-s', '--slurp'})
+
+# gzip/gunzip: GZipStream scripts, filled per command (no per-call building).
+# CopyTo moves 512 KB per call (default 80 KB): fewer GZipStream/FileStream
+# round trips on large files
+# Stream → stdout. GZipStream leaves stdout open (stdout is shared with the host)
+_GZIP_COMPRESS_STDOUT_TMPL = string.Template(r'''
+${OPEN_INPUT}
+$out = [Console]::OpenStandardOutput()
+$gzip = [System.IO.Compression.GZipStream]::new($out, [System.IO.Compression.CompressionMode]::Compress, $true)
+try { $in.CopyTo($gzip, 524288) } finally { $gzip.Dispose(); $in.Dispose() }
+$out.Flush()
+''')
+
+_GZIP_DECOMPRESS_STDOUT_TMPL = string.Template(r'''
+${OPEN_INPUT}
+$gzip = [System.IO.Compression.GZipStream]::new($in, [System.IO.Compression.CompressionMode]::Decompress)
+$out = [Console]::OpenStandardOutput()
+try { $gzip.CopyTo($out, 524288); $out.Flush() } finally { $gzip.Dispose() }
+''')
+
+# File → file (gzip: file.gz, gunzip: file); ${COPY} is one of the two below.
+# [IO.File]::Exists, not the Test-Path cmdlet (same path resolution as OpenRead)
+_GZIP_FILE_TMPL = string.Template(r'''
+$inputPath = "${INPUT}"
+$outputPath = "${OUTPUT}"
+
+if (-not [System.IO.File]::Exists($inputPath)) {
+    [Console]::Error.WriteLine("gzip: ${INPUT}: No such file or directory")
+    exit 1
+}
+${OUTPUT_CHECK}
+
+$in = [System.IO.File]::OpenRead($inputPath)
+try {
+    $out = [System.IO.File]::Create($outputPath)
+    try { ${COPY} } finally { $out.Dispose() }
+} finally { $in.Dispose() }
+${REMOVE}
+''')
+# Without -f an existing output is an error (with -f: no check emitted)
+_GZIP_OUTPUT_CHECK = '''
+if ([System.IO.File]::Exists($outputPath)) {
+    [Console]::Error.WriteLine("gzip: " + $outputPath + " already exists; not overwritten")
+    exit 1
+}
+'''
+_GZIP_COMPRESS_COPY = ("$gzip = [System.IO.Compression.GZipStream]::new($out, [System.IO.Compression.CompressionMode]::Compress); "
+                       "try { $in.CopyTo($gzip, 524288) } finally { $gzip.Dispose() }")
+_GZIP_DECOMPRESS_COPY = ("$gzip = [System.IO.Compression.GZipStream]::new($in, [System.IO.Compression.CompressionMode]::Decompress); "
+                         "try { $gzip.CopyTo($out, 524288) } finally { $gzip.Dispose() }")
+# Unix default: the input is removed once the output is written (-k keeps it);
+# static File.Delete, no cmdlet binding/provider resolution
+_GZIP_REMOVE_INPUT = '[System.IO.File]::Delete($inputPath)'
+
+# jq fallback: literal filters → PowerShell computing $result from $json
+_JQ_SIMPLE_DISPATCH = {
+    '.': '$result = $json\n',
+    'keys': '''
+                if ($json -is [PSCustomObject]) {
+                    $result = $json.PSObject.Properties.Name
+                } else {
+                    $result = @()
+                }
+            ''',
+    'length': '''
+                if ($json -is [array]) {
+                    $result = $json.Count
+                } elseif ($json -is [string]) {
+                    $result = $json.Length
+                } elseif ($json -is [PSCustomObject]) {
+                    $result = ($json.PSObject.Properties | Measure-Object).Count
+                } else {
+                    $result = 0
+                }
+            ''',
+}
+# ... and the field-access family, token by token: .field or [N] / []
+_JQ_ACCESS_TOKEN_RE = re.compile(r'\.(\w+)|\[(\d*)\]')
+
+# jq fallback: output formatting of $result (-r / -c / default pretty)
+_JQ_RAW_OUTPUT_PS = '''
+if ($result -is [string]) {
+    Write-Output $result
+} elseif ($result -is [array]) {
+    $result | ForEach-Object { Write-Output $_ }
+} else {
+    Write-Output $result
+}
+'''
+_JQ_COMPACT_OUTPUT_PS = '''
+$result | ConvertTo-Json -Compress -Depth 100
+'''
+_JQ_PRETTY_OUTPUT_PS = '''
+if ($result -is [string] -or $result -is [int] -or $result -is [bool]) {
+    $result | ConvertTo-Json
+} else {
+    $result | ConvertTo-Json -Depth 100
+}
+'''
+
+# split/jq: compiled once, not per translated command
+_SIZE_RE = re.compile(r'^(\d+)([KMGT])?$', re.IGNORECASE)
+_JQ_SIMPLE_RE = re.compile(r'^\.(\w+|\[\d*\])(\.(\w+|\[\d*\]))*$')
+_JQ_COMPLEX_RE = re.compile(r'\b(?:map|select|if|then|else|def)\b|\|')
+
+# Multi-keyword "any(x in s)" checks as ONE scan: glob metacharacters, and
+# shell operators (| > < 2> && ||) in a find -exec command
+_GLOB_CHARS_RE = re.compile(r'[*?\[\]]')
+_SHELL_OPERATOR_RE = re.compile(r'[|<>]|&&')
+
+_SIZE_MULTIPLIERS = {
+    'K': 1024,
+    'M': 1024 * 1024,
+    'G': 1024 * 1024 * 1024,
+    'T': 1024 * 1024 * 1024 * 1024,
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_size(size_str: str) -> int:
+    """
+    Parse size string like 1K, 2M, 3G.
+    
+    Returns bytes. Memoized: sizes come from a tiny domain (1K, 1M, 10M...).
+    """
+    match = _SIZE_RE.match(size_str)
+    if not match:
+        return int(size_str)  # Plain number
+    
+    value = int(match.group(1))
+    unit = match.group(2)
+    
+    if unit:
+        return value * _SIZE_MULTIPLIERS.get(unit.upper(), 1)
+    
+    return value
+
+
+# split: options taking a value (attached -l100 or separate -l 100; -n/-C
+# are not emulated, only consumed), and the numeric-suffix switches
+_SPLIT_VALUE_OPTIONS = frozenset({'-l', '-b', '-a', '-n', '-C'})
+_SPLIT_FLAG_OPTIONS = frozenset({'-d', '--numeric-suffixes'})
+
+# watch: read-only commands whose output only changes when their path does
+_WATCH_READONLY_COMMANDS = frozenset({'ls', 'cat', 'stat', 'df', 'du', 'head', 'tail'})
+
+# Emitted PowerShell scripts, built once. string.Template placeholders are
+# UPPERCASE ${NAME}: safe_substitute leaves PowerShell's own $vars alone,
+# and script braces need no f-string doubling.
+
+# hexdump: read once, clamp [start, end) to -s / -n
+_HEXDUMP_READ_TMPL = string.Template(r'''
+$file = "${FILE}"
+if (-not (Test-Path $file)) {
+    Write-Error "hexdump: $file`: No such file or directory"
+    exit 1
+}
+$bytes = Read-AllBytes $file
+$start = [Math]::Min(${SKIP}, $bytes.Length)
+$end = $bytes.Length
+if (${LIMIT} -ge 0) { $end = [Math]::Min($end, $start + ${LIMIT}) }
+''')
+
+_HEXDUMP_CANONICAL_PS = r'''
+$printable = [char[]](0..255 | ForEach-Object { if ((($_ - 32) -band 0xFF) -lt 95) { $_ } else { 46 } })
+$sb = [System.Text.StringBuilder]::new(80)
+for ($i = $start; $i -lt $end; $i += 16) {
+    $n = [Math]::Min(16, $end - $i)
+    $hex = [BitConverter]::ToString($bytes, $i, $n).Replace('-', ' ').ToLower()
+    if ($n -gt 8) { $hex = $hex.Insert(23, ' ') }
+    [void]$sb.Clear().Append($i.ToString('x8')).Append('  ').Append($hex.PadRight(48)).Append('  |')
+    for ($j = $i; $j -lt $i + $n; $j++) { [void]$sb.Append($printable[$bytes[$j]]) }
+    $sb.Append('|').ToString()
+}
+if ($end -gt $start) { $end.ToString('x8') }
+'''
+
+# one BitConverter call for the whole range, one byte per output line
+_HEXDUMP_PLAIN_PS = r'''
+if ($end -gt $start) { [BitConverter]::ToString($bytes, $start, $end - $start).ToLower().Split('-') }
+'''
+
+# diff -u fallback: Myers diff (O((N+M)·D), not a lookahead heuristic), GNU hunks
+_DIFF_UNIFIED_TMPL = string.Template(r'''
+$file1 = "${FILE1}"
+$file2 = "${FILE2}"
+$context = ${CONTEXT}
+
+foreach ($f in $file1, $file2) {
+    if (-not (Test-Path $f)) {
+        Write-Host "diff: $f`: No such file or directory"
+        exit 2
+    }
+}
+
+$a = [System.IO.File]::ReadAllLines($file1)
+$b = [System.IO.File]::ReadAllLines($file2)
+$n = $a.Length
+$m = $b.Length
+
+# Forward pass: furthest-reaching x per diagonal k, one V snapshot per D
+$off = $n + $m + 1
+$v = [int[]]::new(2 * $off + 1)
+$trace = [System.Collections.Generic.List[int[]]]::new()
+$done = $false
+for ($d = 0; -not $done; $d++) {
+    $trace.Add($v.Clone())
+    for ($k = -$d; $k -le $d; $k += 2) {
+        if ($k -eq -$d -or ($k -ne $d -and $v[$off + $k - 1] -lt $v[$off + $k + 1])) {
+            $x = $v[$off + $k + 1]
+        } else {
+            $x = $v[$off + $k - 1] + 1
+        }
+        $y = $x - $k
+        while ($x -lt $n -and $y -lt $m -and $a[$x] -ceq $b[$y]) { $x++; $y++ }
+        $v[$off + $k] = $x
+        if ($x -ge $n -and $y -ge $m) { $done = $true; break }
+    }
+}
+
+# Backtrack into edit script: (op, index in a, index in b)
+$edits = [System.Collections.Generic.List[object]]::new()
+$x = $n
+$y = $m
+for ($d = $trace.Count - 1; $d -ge 0; $d--) {
+    $vd = $trace[$d]
+    $k = $x - $y
+    if ($k -eq -$d -or ($k -ne $d -and $vd[$off + $k - 1] -lt $vd[$off + $k + 1])) {
+        $pk = $k + 1
+    } else {
+        $pk = $k - 1
+    }
+    $px = $vd[$off + $pk]
+    $py = $px - $pk
+    while ($x -gt $px -and $y -gt $py) { $x--; $y--; $edits.Add(@(' ', $x, $y)) }
+    if ($d -gt 0) {
+        if ($x -eq $px) { $y--; $edits.Add(@('+', $x, $y)) } else { $x--; $edits.Add(@('-', $x, $y)) }
+    }
+}
+$edits.Reverse()
+
+$changes = @(for ($e = 0; $e -lt $edits.Count; $e++) { if ($edits[$e][0] -ne ' ') { $e } })
+if ($changes.Count -eq 0) { exit 0 }
+
+# Header
+$time1 = (Get-Item $file1).LastWriteTime.ToString("yyyy-MM-dd HH:mm:ss.fff000000 +0000")
+$time2 = (Get-Item $file2).LastWriteTime.ToString("yyyy-MM-dd HH:mm:ss.fff000000 +0000")
+Write-Output "--- $file1`t$time1"
+Write-Output "+++ $file2`t$time2"
+
+# Hunks: changes closer than 2*context equal lines share one hunk
+$h = 0
+while ($h -lt $changes.Count) {
+    $first = $changes[$h]
+    while ($h + 1 -lt $changes.Count -and $changes[$h + 1] - $changes[$h] -le 2 * $context + 1) { $h++ }
+    $last = $changes[$h]
+    $h++
+    $from = [Math]::Max(0, $first - $context)
+    $to = [Math]::Min($edits.Count - 1, $last + $context)
+
+    $count1 = 0
+    $count2 = 0
+    for ($e = $from; $e -le $to; $e++) {
+        if ($edits[$e][0] -ne '+') { $count1++ }
+        if ($edits[$e][0] -ne '-') { $count2++ }
+    }
+    $start1 = $edits[$from][1] + [int]($count1 -gt 0)
+    $start2 = $edits[$from][2] + [int]($count2 -gt 0)
+    $range1 = if ($count1 -eq 1) { "$start1" } else { "$start1,$count1" }
+    $range2 = if ($count2 -eq 1) { "$start2" } else { "$start2,$count2" }
+    Write-Output "@@ -$range1 +$range2 @@"
+
+    for ($e = $from; $e -le $to; $e++) {
+        $op, $i, $j = $edits[$e]
+        if ($op -eq '+') { "+" + $b[$j] } else { $op + $a[$i] }
+    }
+}
+exit 1
+''')
+
+
+# strings: printable runs of >= MIN_LEN bytes, one regex scan
+_STRINGS_TMPL = string.Template(r'''
+$file = "${FILE}"
+
+if (-not (Test-Path $file)) {
+    Write-Error "strings: $file`: No such file or directory"
+    exit 1
+}
+
+$bytes = Read-AllBytes $file
+$text = [System.Text.Encoding]::GetEncoding(28591).GetString($bytes)
+foreach ($m in [regex]::Matches($text, '[\x20-\x7E]{${MIN_LEN},}')) { $m.Value }
+''')
+
+# column -t: parse all rows, pad every column but the last to its max width
+_COLUMN_TMPL = string.Template(r'''
+$lines = ${INPUT}
+# Growable lists (array += copies the whole array every row)
+$rows = [System.Collections.Generic.List[object]]::new()
+$maxWidths = [System.Collections.Generic.List[int]]::new()
+# Separator regex compiled ONCE (not re-parsed by -split on every line)
+$rx = [regex]::new("${SEP}", [System.Text.RegularExpressions.RegexOptions]::Compiled)
+
+# Parse all rows and track max width per column
+foreach ($line in $lines) {
+    if ($line.Trim() -eq "") { continue }
+
+    $fields = $rx.Split($line)
+    $rows.Add($fields)
+
+    while ($maxWidths.Count -lt $fields.Length) { $maxWidths.Add(0) }
+    for ($i = 0; $i -lt $fields.Length; $i++) {
+        if ($maxWidths[$i] -lt $fields[$i].Length) {
+            $maxWidths[$i] = $fields[$i].Length
+        }
+    }
+}
+
+# Output aligned rows: cells into a string[], ONE Concat per row (no $output += copies)
+foreach ($row in $rows) {
+    $out = [string[]]::new($row.Length)
+    for ($i = 0; $i -lt $row.Length; $i++) {
+        if ($i -lt $row.Length - 1) {
+            # Pad all but last column
+            $out[$i] = $row[$i].PadRight($maxWidths[$i] + 2)
+        } else {
+            # Last column: no padding
+            $out[$i] = $row[$i]
+        }
+    }
+    Write-Output ([string]::Concat($out)).TrimEnd()
+}
+''')
+
+# comm: sort-merge walk over two sorted files, ordinal compare
+_COMM_TMPL = string.Template(r'''
+if (-not (Test-Path "${FILE1}")) {
+    Write-Error "comm: ${FILE1}: No such file"
+    exit 1
+}
+if (-not (Test-Path "${FILE2}")) {
+    Write-Error "comm: ${FILE2}: No such file"
+    exit 1
+}
+
+$a = [System.IO.File]::ReadAllLines("${FILE1}")
+$b = [System.IO.File]::ReadAllLines("${FILE2}")
+$show1 = ${SHOW1}
+$show2 = ${SHOW2}
+$show3 = ${SHOW3}
+
+# Sort-merge walk over the (sorted) inputs, ordinal compare
+$i = 0
+$j = 0
+while ($i -lt $a.Length -and $j -lt $b.Length) {
+    $c = [string]::CompareOrdinal($a[$i], $b[$j])
+    if ($c -lt 0) {
+        if ($show1) { $a[$i] }
+        $i++
+    } elseif ($c -gt 0) {
+        if ($show2) { "${COL2_PREFIX}" + $b[$j] }
+        $j++
+    } else {
+        if ($show3) { "${COL3_PREFIX}" + $a[$i] }
+        $i++
+        $j++
+    }
+}
+
+# Tails: only in file1 / only in file2
+if ($show1) { for (; $i -lt $a.Length; $i++) { $a[$i] } }
+if ($show2) { for (; $j -lt $b.Length; $j++) { "${COL2_PREFIX}" + $b[$j] } }
+''')
+
+# join: streaming merge-join of two sorted files
+_JOIN_TMPL = string.Template(r'''
+$sep = "${SEP}"
+# Separator regex compiled ONCE (not re-parsed by -split on every line)
+$rx = [regex]::new($sep, [System.Text.RegularExpressions.RegexOptions]::Compiled)
+$field1 = ${FIELD1} - 1  # Convert to 0-indexed
+$field2 = ${FIELD2} - 1
+$show1 = ${SHOW1}
+$show2 = ${SHOW2}
+
+if (-not (Test-Path "${FILE1}")) {
+    Write-Error "join: ${FILE1}: No such file"
+    exit 1
+}
+if (-not (Test-Path "${FILE2}")) {
+    Write-Error "join: ${FILE2}: No such file"
+    exit 1
+}
+
+# Next line that has the join field: @(fields, key), $null at EOF
+function Read-Keyed($reader, $field) {
+    while ($null -ne ($line = $reader.ReadLine())) {
+        $fields = $rx.Split($line)
+        if ($field -lt $fields.Length) { return ,@($fields, $fields[$field]) }
+    }
+    return $null
+}
+
+# Output: join_field + other_fields_f1 + other_fields_f2 (one reused StringBuilder)
+$sb = [System.Text.StringBuilder]::new()
+function Format-Joined($key, $fa, $fb) {
+    [void]$sb.Clear().Append($key)
+    for ($i = 0; $i -lt $fa.Length; $i++) { if ($i -ne $field1) { [void]$sb.Append(' ').Append($fa[$i]) } }
+    for ($i = 0; $i -lt $fb.Length; $i++) { if ($i -ne $field2) { [void]$sb.Append(' ').Append($fb[$i]) } }
+    $sb.ToString()
+}
+
+$r1 = [System.IO.StreamReader]::new("${FILE1}")
+$r2 = [System.IO.StreamReader]::new("${FILE2}")
+try {
+    $e1 = Read-Keyed $r1 $field1
+    $e2 = Read-Keyed $r2 $field2
+    while ($e1 -and $e2) {
+        $c = [string]::CompareOrdinal($e1[1], $e2[1])
+        if ($c -lt 0) {
+            # Unpaired from file1
+            if ($show1) { [string]::Join(' ', $e1[0]) }
+            $e1 = Read-Keyed $r1 $field1
+        } elseif ($c -gt 0) {
+            # Unpaired from file2
+            if ($show2) { [string]::Join(' ', $e2[0]) }
+            $e2 = Read-Keyed $r2 $field2
+        } else {
+            # Equal keys: buffer file2's run, pair every file1 line of the run with it
+            $key = $e1[1]
+            $run2 = [System.Collections.Generic.List[object]]::new()
+            while ($e2 -and $e2[1] -ceq $key) {
+                $run2.Add($e2[0])
+                $e2 = Read-Keyed $r2 $field2
+            }
+            while ($e1 -and $e1[1] -ceq $key) {
+                foreach ($fb in $run2) { Format-Joined $key $e1[0] $fb }
+                $e1 = Read-Keyed $r1 $field1
+            }
+        }
+    }
+
+    # Tails: one side exhausted, the rest is unpaired
+    if ($show1) { while ($e1) { [string]::Join(' ', $e1[0]); $e1 = Read-Keyed $r1 $field1 } }
+    if ($show2) { while ($e2) { [string]::Join(' ', $e2[0]); $e2 = Read-Keyed $r2 $field2 } }
+} finally {
+    $r1.Dispose()
+    $r2.Dispose()
+}
+''')
+
+# Batched pipeline (emulate_pipeline): each stage reads the previous stage's text
+# both as $input lines and as [Console]::In; all but the last have their output
+# (pipeline objects + [Console]::Out writes) captured into $__p
+_PS_PIPELINE_STAGE_TMPL = string.Template(r'''
+$__lines = if ($__p) { $__p -replace '\r?\n\z' -split '\r?\n' } else { @() }
+$__stdin = [Console]::In; $__stdout = [Console]::Out; $__sw = [System.IO.StringWriter]::new()
+[Console]::SetIn([System.IO.StringReader]::new($__p)); [Console]::SetOut($__sw); $__stdinSwapped = $true
+try {
+    $__objs = $__lines | & {
+${SCRIPT}
+    } | Out-String -Stream -Width 4096
+} finally { [Console]::SetIn($__stdin); [Console]::SetOut($__stdout) }
+$__p = $__sw.ToString() + (-join @($__objs | ForEach-Object { "$_`n" }))
+''')
+
+_PS_PIPELINE_LAST_TMPL = string.Template(r'''
+$__lines = if ($__p) { $__p -replace '\r?\n\z' -split '\r?\n' } else { @() }
+$__stdin = [Console]::In
+[Console]::SetIn([System.IO.StringReader]::new($__p)); $__stdinSwapped = $true
+try {
+    $__lines | & {
+${SCRIPT}
+    }
+} finally { [Console]::SetIn($__stdin) }
+''')
+
+# Stage scripts that cannot run mid-pipeline: exit ends the whole script,
+# raw stdout bytes bypass the capture
+_PS_PIPELINE_UNSAFE_RE = re.compile(r'\bexit\b|OpenStandardOutput')
+
+
+# strftime token → .NET Get-Date -Format token
+_DATE_TOKEN_MAP = {
+    '%Y': 'yyyy',
+    '%y': 'yy',
+    '%m': 'MM',
+    '%d': 'dd',
+    '%H': 'HH',
+    '%M': 'mm',
+    '%S': 'ss',
+    '%A': 'dddd',  # Full weekday
+    '%a': 'ddd',   # Short weekday
+    '%B': 'MMMM',  # Full month
+    '%b': 'MMM',   # Short month
+}
+_DATE_TOKEN_RE = re.compile('|'.join(re.escape(token) for token in _DATE_TOKEN_MAP))
+
+# tar operation flags as bits (only what the translator validates)
+_TAR_CREATE, _TAR_EXTRACT, _TAR_LIST, _TAR_FILE = 1, 2, 4, 8
+_TAR_FLAG_BITS = {'c': _TAR_CREATE, 'x': _TAR_EXTRACT, 't': _TAR_LIST, 'f': _TAR_FILE}
+
+# Canonical tar invocations → minimum argument count (create needs archive + source)
+_TAR_FAST_PATHS = {
+    '-czf': 3, 'czf': 3, '-cvzf': 3, 'cvzf': 3,
+    '-xzf': 2, 'xzf': 2, '-xvzf': 2, 'xvzf': 2,
+    '-tzf': 2, 'tzf': 2,
+}
+# test/[ operators → PowerShell condition templates (operands _ps_quote'd)
+_TEST_UNARY_OPS = {
+    '-f': 'Test-Path -LiteralPath "{0}" -PathType Leaf',
+    '-d': 'Test-Path -LiteralPath "{0}" -PathType Container',
+    '-e': 'Test-Path -LiteralPath "{0}"',
+    '-z': '[string]::IsNullOrEmpty("{0}")',
+    '-n': '-not [string]::IsNullOrEmpty("{0}")',
+}
+_TEST_BINARY_OPS = {
+    '-eq': '[long]"{0}" -eq [long]"{1}"',
+    '-ne': '[long]"{0}" -ne [long]"{1}"',
+    '-lt': '[long]"{0}" -lt [long]"{1}"',
+    '-le': '[long]"{0}" -le [long]"{1}"',
+    '-gt': '[long]"{0}" -gt [long]"{1}"',
+    '-ge': '[long]"{0}" -ge [long]"{1}"',
+    '=': '"{0}" -ceq "{1}"',
+    '==': '"{0}" -ceq "{1}"',
+    '!=': '"{0}" -cne "{1}"',
+}
+# File checks cmd.exe answers natively (no PowerShell startup); "X\" exists only for directories
+_TEST_CMD_UNARY_OPS = {
+    '-f': 'if exist "{0}\\" (exit /b 1) else if exist "{0}" (exit /b 0) else (exit /b 1)',
+    '-d': 'if exist "{0}\\" (exit /b 0) else (exit /b 1)',
+    '-e': 'if exist "{0}" (exit /b 0) else (exit /b 1)',
+    '-s': 'if not exist "{0}" (exit /b 1) else for %A in ("{0}") do @if %~zA gtr 0 (exit /b 0) else (exit /b 1)',
+}
+# Integer comparisons of two literals: decided at translation time
+_TEST_INT_OPS = {
+    '-eq': operator.eq, '-ne': operator.ne, '-lt': operator.lt,
+    '-le': operator.le, '-gt': operator.gt, '-ge': operator.ge,
+}
+_TEST_INT_RE = re.compile(r'[+-]?\d+')
+
+# cmd.exe metacharacter: caret-escaped in echo text
+_CMD_META_RE = re.compile(r'([&|<>^])')
+# ... plus ( ) when the echo sits inside a parenthesized block
+_CMD_BLOCK_META_RE = re.compile(r'([&|<>^()])')
+# ... and characters unsafe inside a quoted cmd.exe operand
+_CMD_UNSAFE_OPERAND_RE = re.compile(r'["%!]')
+
+# sed address prefixes: "5", "1,10", "2,$" / "/re/", "/re1/,/re2/"
+_SED_LINE_ADDR_RE = re.compile(r'^(\d+)(,(\d+|\$))?(.*)$')
+_SED_PATTERN_ADDR_RE = re.compile(r'^/(.+?)/(,/(.+?)/)?(.*)$')
+# awk program structure: BEGIN{...}, END{...}, pattern{...}, bare {...}
+_AWK_BEGIN_RE = re.compile(r'BEGIN\s*{([^}]+)}')
+_AWK_END_RE = re.compile(r'END\s*{([^}]+)}')
+_AWK_PATTERN_BLOCK_RE = re.compile(r'^(/[^/]+/|[^{]+)\s*{([^}]+)}')
+_AWK_BLOCK_RE = re.compile(r'{([^}]+)}')
+
+# awk statements: print EXPR, VAR op= VALUE, field references $N
+_AWK_PRINT_RE = re.compile(r'print\s+(.+)')
+_AWK_ASSIGN_RE = re.compile(r'(\w+)\s*([+\-*/]?=)\s*(.+)')
+# $(NF-k), $NF and $N resolved in ONE pass (see _awk_field_ref)
+_AWK_FIELD_REF_RE = re.compile(r'\$\(NF-(\d+)\)|\$NF(?!\w)|\$(\d+)')
+
+
+def _awk_field_ref(match) -> str:
+    """awk field reference → PowerShell: $0 → $line, $N → $F[N-1], $NF → last field"""
+    nf_offset, field = match.groups()
+    if nf_offset is not None:
+        return f'$F[$NF-{int(nf_offset) + 1}]'
+    if field is None:
+        return '$F[$NF-1]'
+    if field == '0':
+        return '$line'
+    return f'$F[{field}-1]'
+
+
+# Human-numeric key conversion (1K, 2M, 3G); {anchor} is '$' when a field
+# was extracted (unit must end the key) and '' for whole-line keys.
+_SORT_HUMAN_KEY = r'''
+    if ($sortKey -match '(\d+\.?\d*)([KMGT]i?){anchor}') {{
+        $num = [double]$matches[1]
+        $unit = $matches[2]
+        $multiplier = switch ($unit) {{
+            'K' {{ 1000 }}
+            'Ki' {{ 1024 }}
+            'M' {{ 1000000 }}
+            'Mi' {{ 1048576 }}
+            'G' {{ 1000000000 }}
+            'Gi' {{ 1073741824 }}
+            'T' {{ 1000000000000 }}
+            'Ti' {{ 1099511627776 }}
+            default {{ 1 }}
+        }}
+        $sortKey = $num * $multiplier
+    }} else {{
+        try {{ $sortKey = [double]$sortKey }} catch {{ $sortKey = 0 }}
+    }}
+    '''
+
+_SORT_NUMERIC_KEY = '''
+    try { $sortKey = [double]$sortKey } catch { $sortKey = 0 }
+    '''
+
+_SORT_RECORD = '''
+    [PSCustomObject]@{
+        Line = $_
+        SortKey = $sortKey
+    }
+'''
+
+
+def _build_sort_key_scripts():
+    """Precompute sort key fragments for every (numeric, human, has_field) mode."""
+    scripts = {}
+    for numeric in (False, True):
+        for human in (False, True):
+            for has_field in (False, True):
+                if human:
+                    conversion = _SORT_HUMAN_KEY.format(anchor='$' if has_field else '')
+                elif numeric:
+                    conversion = _SORT_NUMERIC_KEY
+                else:
+                    conversion = ''
+                scripts[(numeric, human, has_field)] = conversion + _SORT_RECORD
+    return scripts
+
+
+_SORT_KEY_SCRIPTS = _build_sort_key_scripts()
+
+
+# uniq output fragments per mode: (emit inside the loop, emit for last line)
+_UNIQ_EMIT_SCRIPTS = {
+    'count': (
+        '''
+                    Write-Output ("{0,7} {1}" -f $count, $prevLine)
+            ''',
+        '''
+                Write-Output ("{0,7} {1}" -f $count, $prevLine)
+            ''',
+    ),
+    'repeated': (
+        '''
+                    if ($count -gt 1) {
+                        Write-Output $prevLine
+                    }
+            ''',
+        '''
+                if ($count -gt 1) {
+                    Write-Output $prevLine
+                }
+            ''',
+    ),
+    'unique': (
+        '''
+                    if ($count -eq 1) {
+                        Write-Output $prevLine
+                    }
+            ''',
+        '''
+                if ($count -eq 1) {
+                    Write-Output $prevLine
+                }
+            ''',
+    ),
+    'normal': (
+        '''
+                    Write-Output $prevLine
+            ''',
+        '''
+                Write-Output $prevLine
+            ''',
+    ),
+}
+
+# Option tables for _scan_options: '-X' → (name, takes_value)
+_TAR_OPTIONS = {'-C': ('directory', True)}
+_SED_OPTIONS = {'-i': ('in_place', False), '-n': ('quiet', False), '-e': ('expression', True)}
+_AWK_OPTIONS = {'-F': ('separator', True), '-v': ('assign', True)}
+_UNZIP_OPTIONS = {'-l': ('list', False), '-d': ('directory', True)}
+_CUT_OPTIONS = {
+    '-d': ('delimiter', True),
+    '-f': ('fields', True),
+    '-c': ('characters', True),
+    '-b': ('bytes', True),
+    '--complement': ('complement', False),
+}
+
+
+def _scan_options(parts, table, start=1):
+    """
+    Scan parts once, dispatching each option through an option table.
+
+    Options are looked up whole ('--complement'), then by their 2-char
+    prefix ('-i.bak' → '-i'). Value options accept '-X VALUE' and
+    '-XVALUE'; values are collected in a list (last one wins for callers
+    that want a single value). Unknown options are skipped.
+
+    Returns:
+        (options, operands) - dict keyed by option name, non-option args
+    """
+    options = {}
+    operands = []
+    i = start
+    while i < len(parts):
+        part = parts[i]
+        if part[:1] != '-' or part == '-':
+            operands.append(part)
+            i += 1
+            continue
+        spec = table.get(part) or table.get(part[:2])
+        if spec is not None:
+            name, takes_value = spec
+            if not takes_value:
+                options[name] = True
+            elif part not in table:
+                options.setdefault(name, []).append(part[2:])  # Attached: -d:
+            elif i + 1 < len(parts):
+                options.setdefault(name, []).append(parts[i + 1])
+                i += 1
+        i += 1
+    return options, operands
+
+
+def _cut_range_item(part: str) -> str:
+    """One cut list item → PowerShell 0-based index expression"""
+    if '-' not in part:
+        return str(int(part) - 1)
+    start, _, end = part.partition('-')
+    start = int(start) - 1 if start else 0
+    if not end:
+        # Clamped: a descending range would pick indices below start
+        return f'{start}..([Math]::Max({start}, $F.Length-1))'
+    return f'{start}..{int(end) - 1}'
+
+
 class CommandEmulator:
     """
     Unix→Windows command translation 
     
     """
 
+    # Fixed attribute layout: command_map holds bound translators resolved once
+    __slots__ = ('command_map', 'QUICK_COMMANDS', '_tar_exe', '_sed_exe', '_awk_exe',
+                 '_diff_exe', '_jq_exe', '_translate_cached')
+
     def __init__(self):
         """Initialize SimpleTranslator"""
+        # Native binaries probed ONCE per emulator (not per translated command)
+        self._tar_exe = shutil.which('tar.exe')
+        self._sed_exe = shutil.which('sed.exe')
+        self._awk_exe = shutil.which('awk.exe') or shutil.which('gawk.exe')
+        self._diff_exe = shutil.which('diff.exe')
+        self._jq_exe = shutil.which('jq.exe')
+
+        # Translations are pure functions of the command line (translators read
+        # only the probes above; dates/times are evaluated by the emitted script):
+        # repeated commands (loops, scripts) are served from this LRU cache
+        self._translate_cached = functools.lru_cache(maxsize=1024)(self._emulate_uncached)
+
         # Command map with all translators (73 commands)
 
         self.command_map = {
@@ -296,6 +1234,50 @@ class CommandEmulator:
         """
         return cmd_name in self.QUICK_COMMANDS
 
+    def powershell_script(self, translated: str) -> Optional[str]:
+        """
+        Extract the raw PowerShell script from a translated command.
+
+        Lets the caller run the script in an already-running PowerShell
+        (see ExecutionEngine.execute_powershell_script) instead of
+        spawning the powershell.exe the wrapper would start.
+
+        - powershell ... -EncodedCommand X → decoded script
+        - powershell ... -Command "X"      → X (wrapper-level \\" unescaped)
+
+        Chained wrappers (wrapper && wrapper, e.g. touch a b) are not one
+        script: None, the caller runs the translation as a whole.
+
+        Returns:
+            Script text, or None if translated is not exactly one PowerShell wrapper
+        """
+        if translated.startswith(_PS_ENCODED_PREFIX):
+            encoded = translated[len(_PS_ENCODED_PREFIX):]
+            if not _BASE64_TOKEN_RE.fullmatch(encoded):
+                return None
+            return base64.b64decode(encoded).decode('utf-16-le')
+        if translated.startswith(_PS_COMMAND_PREFIX) and translated.endswith('"'):
+            script = translated[len(_PS_COMMAND_PREFIX):-1]
+            if _PS_UNESCAPED_QUOTE_RE.search(script):
+                return None
+            return script.replace('\\"', '"')
+        return None
+
+    def native_argv(self, translated: str) -> Optional[List[str]]:
+        """
+        Extract the argv of a direct native-binary translation.
+
+        tar.exe/sed.exe/awk.exe/... translations are not command lines:
+        the caller runs the argv as-is, with no shell in between
+        (see ExecutionEngine.execute_native).
+
+        Returns:
+            [exe, arg, ...], or None if translated is not a native invocation
+        """
+        if translated.startswith(_NATIVE_ARGV_PREFIX):
+            return json.loads(translated[len(_NATIVE_ARGV_PREFIX):])
+        return None
+
     def emulate_command(self, unix_command: str):
         """
         Translate Unix command → Windows with operator support.
@@ -309,15 +1291,79 @@ class CommandEmulator:
         Returns:
             - translated_command: Command ready for execution
         """
-    
+        # Key normalized: surrounding whitespace never changes the translation
+        return self._translate_cached(unix_command.strip())
+
+    def emulate_pipeline(self, unix_commands: List[str]) -> Optional[str]:
+        """
+        Translate a pipeline cmd1 | cmd2 | ... → ONE PowerShell invocation.
+
+        Each stage is translated with emulate_command() and must be a
+        PowerShell script. Stage k's output is captured as text and handed
+        to stage k+1 as $input lines and as [Console]::In, so N stages cost
+        one PowerShell run instead of N.
+
+        Args:
+            unix_commands: Pipeline stages in order (no stdin for the first one)
+
+        Returns:
+            Single powershell -EncodedCommand invocation, or None when a stage
+            cannot be batched (cmd.exe / native binary, or exit / raw bytes
+            before the last stage) - caller runs the stages one by one
+        """
+        scripts = []
+        for unix_command in unix_commands:
+            script = self.powershell_script(self.emulate_command(unix_command))
+            if script is None:
+                return None
+            scripts.append(script)
+        if any(_PS_PIPELINE_UNSAFE_RE.search(script) for script in scripts[:-1]):
+            return None
+
+        blocks = ['$__p = ""']
+        blocks += [_PS_PIPELINE_STAGE_TMPL.safe_substitute(SCRIPT=script) for script in scripts[:-1]]
+        blocks.append(_PS_PIPELINE_LAST_TMPL.safe_substitute(SCRIPT=scripts[-1]))
+        return _ps_encoded('\n'.join(blocks))
+
+    def can_execute_locally(self, cmd_name: str) -> bool:
+        """True if execute_locally may handle cmd_name (cheap pre-check)"""
+        return cmd_name in _LOCAL_COMMANDS
+
+    def execute_locally(self, unix_command: str, working_dir) -> Optional[str]:
+        """
+        Run a command in the Python process instead of emitting a script.
+
+        No PowerShell spawn at all: the whole work is one C-level scan.
+        NOT cached (the output depends on file contents, unlike translations).
+
+        Args:
+            unix_command: Command line (paths already translated)
+            working_dir: Base for relative paths
+
+        Returns:
+            The command's stdout, or None when it has no local implementation
+            or its input is not a readable local file (caller falls back to
+            emulate_command, which also reports the error)
+        """
+        parts = unix_command.strip().split()
+        if not parts or parts[0] not in _LOCAL_COMMANDS:
+            return None
+        return self._local_strings(parts, working_dir)
+
+    def _emulate_uncached(self, unix_command: str):
+        """Translate without the cache (see emulate_command)"""
+        static = _STATIC_TRANSLATIONS.get(unix_command)
+        if static is not None:
+            return static
+
         parts = unix_command.strip().split()
 
 
         base_cmd = parts[0]
 
         # Check translator for simple 1:1 translations
-        if base_cmd in self.command_map:
-            translator = self.command_map[base_cmd]
+        translator = self.command_map.get(base_cmd)
+        if translator is not None:
             try:
                 translated = translator(unix_command, parts)
                 return translated
@@ -396,7 +1442,7 @@ class CommandEmulator:
                 # Add classifier (/ for dirs, * for executable, @ for symlinks)
                 ps_cmd += ' | ForEach-Object { if($_.PSIsContainer) {$_.Name + "/"} else {$_.Name} }'
             
-            return f'powershell -Command "{ps_cmd}"'
+            return f'{_PS_COMMAND} "{ps_cmd}"'
         
         # Standard dir command
         cmd_result = f'dir {flag_str} {path_str}'.strip()
@@ -453,7 +1499,7 @@ class CommandEmulator:
                         $lineNum++
                     }
                 '''
-                return f'powershell -Command "{ps_cmd}"'
+                return f'{_PS_COMMAND} "{ps_cmd}"'
             else:
                 # Just pass through stdin
                 # In PowerShell pipeline, this is implicit
@@ -468,7 +1514,7 @@ class CommandEmulator:
         # Detect glob patterns: *, ?, [ ]
         # Use Get-ChildItem to expand, then process expanded files
 
-        has_glob = any(c in ''.join(files) for c in ['*', '?', '[', ']'])
+        has_glob = any(map(_GLOB_CHARS_RE.search, files))
 
         if has_glob:
             # Build glob-aware PowerShell script
@@ -597,7 +1643,7 @@ class CommandEmulator:
                         }}
                     '''.format(','.join(f'"{f}"' for f in files))
 
-        return f'powershell -Command "{ps_script}"'
+        return _ps_encoded(ps_script)
     
     def _translate_echo(self, cmd: str, parts):
         """
@@ -623,14 +1669,14 @@ class CommandEmulator:
             text = text.replace('\n', '`n').replace('\t', '`t').replace('\r', '`r')
 
             if no_newline:
-                return f'powershell -Command "Write-Host -NoNewline \\"{text}\\""'
+                return f'{_PS_COMMAND} "Write-Host -NoNewline \\"{text}\\""'
             else:
-                return f'powershell -Command "Write-Host \\"{text}\\""'
+                return f'{_PS_COMMAND} "Write-Host \\"{text}\\""'
         else:
             # Standard cmd.exe echo
             if no_newline:
                 # cmd.exe doesn't support no-newline, use PowerShell
-                return f'powershell -Command "Write-Host -NoNewline \\"{text}\\""'
+                return f'{_PS_COMMAND} "Write-Host -NoNewline \\"{text}\\""'
             else:
                 # Escape special characters for cmd
                 if text:
@@ -819,7 +1865,7 @@ class CommandEmulator:
                 f'New-Item -ItemType File -Path \\"{win_path}\\" -Force | Out-Null '
                 f'}}'
             )
-            commands.append(f'powershell -Command "{ps_cmd}"')
+            commands.append(f'{_PS_COMMAND} "{ps_cmd}"')
         
         return ' && '.join(commands)
     
@@ -935,7 +1981,7 @@ class CommandEmulator:
                 }}
             '''
             
-            return f'powershell -Command "{ps_script}"'
+            return f'{_PS_COMMAND} "{ps_script}"'
         
         else:
             # HARD LINK (no admin required!)
@@ -1012,7 +2058,7 @@ class CommandEmulator:
                 ps_cmd = f'if (Select-String -Pattern "{pattern}" -Path {files[0]} -Quiet) {{ exit 0 }} else {{ exit 1 }}'
             else:
                 ps_cmd = f'if ($input | Select-String -Pattern "{pattern}" -Quiet) {{ exit 0 }} else {{ exit 1 }}'
-            return f'powershell -Command "{ps_cmd}"'
+            return f'{_PS_COMMAND} "{ps_cmd}"'
 
         if line_numbers:
             # Select-String includes line numbers by default in output
@@ -1058,7 +2104,7 @@ class CommandEmulator:
             else:
                 # For stdin, just use inverted match
                 ps_cmd = f'$input | Where-Object {{ $_ -notmatch "{pattern}" }}'
-            return f'powershell -Command "{ps_cmd}"'
+            return f'{_PS_COMMAND} "{ps_cmd}"'
 
         if count:
             post_process.append('Measure-Object')
@@ -1082,7 +2128,7 @@ class CommandEmulator:
         if post_process:
             ps_cmd += ' | ' + ' | '.join(post_process)
 
-        return f'powershell -Command "{ps_cmd}"'
+        return f'{_PS_COMMAND} "{ps_cmd}"'
     
     def _translate_find(self, cmd: str, parts):
         """
@@ -1133,7 +2179,7 @@ class CommandEmulator:
             if 'sh -c' in exec_cmd or 'bash -c' in exec_cmd:
                 return True
             # Pipe/redirect inside -exec command
-            if any(op in exec_cmd for op in ['|', '>', '<', '2>', '&&', '||']):
+            if _SHELL_OPERATOR_RE.search(exec_cmd):
                 return True
             # Complex quoting (nested quotes)
             single_quotes = exec_cmd.count("'")
@@ -1478,7 +2524,7 @@ class CommandEmulator:
             }
         '''
         
-        return f'powershell -Command "{ps_script}"'
+        return _ps_encoded(ps_script)
     
     def _parse_find_size(self, size_spec: str) -> int:
         """
@@ -1558,7 +2604,7 @@ class CommandEmulator:
             return f'Select-Object -First {line_count}'
 
         # ARTIGIANO: Glob Pattern Expansion (same as cat)
-        has_glob = any(c in ''.join(files) for c in ['*', '?', '[', ']'])
+        has_glob = any(map(_GLOB_CHARS_RE.search, files))
 
         if has_glob:
             files_patterns = ','.join(f'"{f}"' for f in files)
@@ -1626,7 +2672,7 @@ class CommandEmulator:
                     }}
                 '''.format(','.join(f'"{f}"' for f in files), line_count)
 
-        return f'powershell -Command "{ps_script}"'
+        return _ps_encoded(ps_script)
     
     def _translate_tail(self, cmd: str, parts):
         """
@@ -1681,7 +2727,7 @@ class CommandEmulator:
             return f'Select-Object -Last {line_count}'
 
         # ARTIGIANO: Glob Pattern Expansion (same as cat/head)
-        has_glob = any(c in ''.join(files) for c in ['*', '?', '[', ']'])
+        has_glob = any(map(_GLOB_CHARS_RE.search, files))
 
         if has_glob:
             # Glob expansion needed
@@ -1731,23 +2777,12 @@ class CommandEmulator:
         else:
             # No globs - direct access
             if len(files) == 1:
-                # Single file
+                # Single file - follow mode (-f) continuously monitors file
                 file = files[0]
-                if follow:
-                    # Follow mode - continuously monitor file
-                    ps_script = f'''
-                        if (Test-Path "{file}") {{
-                            Get-Content "{file}" -Tail {line_count} -Wait
-                        }} else {{
-                            Write-Error "tail: {file}: No such file or directory"
-                            exit 1
-                        }}
-                    '''
-                else:
-                    # Normal mode - just last N lines
-                    ps_script = f'''
+                wait_flag = ' -Wait' if follow else ''
+                ps_script = f'''
                         if (Test-Path "{file}") {{
-                            Get-Content "{file}" -Tail {line_count}
+                            Get-Content "{file}" -Tail {line_count}{wait_flag}
                         }} else {{
                             Write-Error "tail: {file}: No such file or directory"
                             exit 1
@@ -1778,7 +2813,7 @@ class CommandEmulator:
                     }}
                 '''.format(','.join(f'"{f}"' for f in files), line_count)
 
-        return f'powershell -Command "{ps_script}"'
+        return _ps_encoded(ps_script)
     
     def _translate_wc(self, cmd: str, parts):
         """
@@ -1853,10 +2888,10 @@ class CommandEmulator:
 
             ps_script += '\nWrite-Output ($output -join "  ")'
 
-            return f'powershell -Command "{ps_script}"'
+            return _ps_encoded(ps_script)
 
         # ARTIGIANO: Glob Pattern Expansion (same as cat/head/tail)
-        has_glob = any(c in ''.join(files) for c in ['*', '?', '[', ']'])
+        has_glob = any(map(_GLOB_CHARS_RE.search, files))
 
         if has_glob:
             files_patterns = ','.join(f'"{f}"' for f in files)
@@ -1892,7 +2927,7 @@ class CommandEmulator:
                 $totalChars = 0
 
                 foreach ($file in $expandedFiles) {{
-                    $content = Get-Content $file
+                    $content = Get-Content $file -ReadCount 0
                     $lineCount = $content.Count
                     $wordCount = 0
                     $charCount = 0
@@ -1939,19 +2974,33 @@ class CommandEmulator:
             ps_script += '\n                    Write-Output ($output -join "  ")'
             ps_script += '\n                }'
 
-            return f'powershell -Command "{ps_script}"'
+            return _ps_encoded(ps_script)
 
         # No globs - direct file access
         # Files specified
         if len(files) == 1:
             file = files[0]
+
+            # Single count on a single file - cmd.exe builtins, no PowerShell startup
+            # (" % ! in the name: PowerShell below; echoed name caret-escaped)
+            bytes_only = count_bytes and not (count_lines or count_words or count_chars)
+            lines_only = count_lines and not (count_words or count_bytes or count_chars)
+            if (bytes_only or lines_only) and not _CMD_UNSAFE_OPERAND_RE.search(file):
+                name = _CMD_BLOCK_META_RE.sub(r'^\1', file)
+                missing = f'else (echo wc: {name}: No such file or directory 1>&2 & exit /b 1)'
+                if bytes_only:
+                    # Size from filesystem metadata, no content scan
+                    return f'if exist "{file}" (for %A in ("{file}") do @echo %~zA {name}) {missing}'
+                return (f'if exist "{file}" (for /f %A in (\'type "{file}" ^| find /c /v ""\') do @echo %A {name}) '
+                        f'{missing}')
+
             ps_script = f'''
                 if (-not (Test-Path "{file}")) {{
                     Write-Error "wc: {file}: No such file or directory"
                     exit 1
                 }}
 
-                $content = Get-Content "{file}"
+                $content = Get-Content "{file}" -ReadCount 0
                 $lineCount = $content.Count
                 $wordCount = 0
                 $charCount = 0
@@ -1990,7 +3039,7 @@ class CommandEmulator:
                         continue
                     }}
 
-                    $content = Get-Content $file
+                    $content = Get-Content $file -ReadCount 0
                     $lineCount = $content.Count
                     $wordCount = 0
                     $charCount = 0
@@ -2030,7 +3079,7 @@ class CommandEmulator:
                     ps_script += '\n$output += $totalChars'
                 ps_script += '\n$output += "total"\nWrite-Output ($output -join "  ")'
 
-        return f'powershell -Command "{ps_script}"'
+        return _ps_encoded(ps_script)
     
     def _translate_sort(self, cmd: str, parts):
         """
@@ -2050,10 +3099,11 @@ class CommandEmulator:
           sort -k 2 -t: file → sort by 2nd field, separator ':'
           sort -h file → human numeric (1K < 1M < 1G)
         """
-        numeric = '-n' in parts or '--numeric-sort' in parts
-        reverse = '-r' in parts or '--reverse' in parts
-        unique = '-u' in parts or '--unique' in parts
-        human = '-h' in parts or '--human-numeric-sort' in parts
+        flags = set(parts)
+        numeric = '-n' in flags or '--numeric-sort' in flags
+        reverse = '-r' in flags or '--reverse' in flags
+        unique = '-u' in flags or '--unique' in flags
+        human = '-h' in flags or '--human-numeric-sort' in flags
         
         # Parse field and separator
         field_num = None
@@ -2069,16 +3119,21 @@ class CommandEmulator:
                 # Extract field number (may be "2" or "2,3" or "2.1")
                 field_num = int(field_spec.split(',')[0].split('.')[0])
                 i += 1
-            elif part.startswith('--key='):
-                field_spec = part.split('=')[1]
-                field_num = int(field_spec.split(',')[0].split('.')[0])
             
             # -t separator
             elif part == '-t' and i + 1 < len(parts):
                 separator = parts[i + 1]
                 i += 1
-            elif part.startswith('--field-separator='):
-                separator = part.split('=')[1]
+            
+            # --key=SPEC / --field-separator=SEP
+            else:
+                m = _LONG_FLAG_RE.match(part)
+                if m:
+                    name, value = m.group(1), m.group(2)
+                    if name == 'key':
+                        field_num = int(value.split(',')[0].split('.')[0])
+                    elif name == 'field-separator':
+                        separator = value
             
             i += 1
         
@@ -2104,21 +3159,38 @@ class CommandEmulator:
                     ps_cmd += ' -Descending'
                 if unique:
                     ps_cmd += ' -Unique'
-                return f'powershell -Command "{ps_cmd}"'
+                return f'{_PS_COMMAND} "{ps_cmd}"'
+        
+        if numeric and not human and not field_num:
+            # Plain numeric sort - key by script block, no PSCustomObject per line
+            if files:
+                # Inside -Command "...": " escaped for the command line too
+                path = files[0].translate(_PS_ESCAPE_TABLE).replace('"', '\\"')
+                source = f"[System.IO.File]::ReadAllLines('{path}')"
+            else:
+                source = '$input'
+            ps_cmd = f'{source} | Sort-Object {{ try {{ [double]$_ }} catch {{ 0 }} }}'
+            if reverse:
+                ps_cmd += ' -Descending'
+            if unique:
+                ps_cmd += ' -Unique'
+            return f'{_PS_COMMAND} "{ps_cmd}"'
         
         # Complex sort - PowerShell script
         # Default separator is whitespace
         if separator is None:
             separator = ' '
         
-        # Escape separator for PowerShell
-        sep_escaped = separator.replace("'", "''")
+        # Escape separator for PowerShell (shell quotes off: -t '"' is ONE ")
+        if len(separator) >= 2 and separator[0] == separator[-1] and separator[0] in '\'"':
+            separator = separator[1:-1]
+        sep_escaped = separator.translate(_PS_ESCAPE_TABLE)
         
         # Build PowerShell script
         if files:
             # From file
             file_path = files[0]
-            content_cmd = f'Get-Content "{file_path}"'
+            content_cmd = f'[System.IO.File]::ReadAllLines("{_ps_quote(file_path)}")'
         else:
             # From stdin
             content_cmd = '$input'
@@ -2136,81 +3208,14 @@ class CommandEmulator:
         $sortKey = $_
     }}
     '''
-            
-            if numeric or human:
-                # Convert to number for sorting
-                if human:
-                    # Human numeric: 1K, 2M, 3G
-                    ps_script += '''
-    if ($sortKey -match '(\d+\.?\d*)([KMGT]i?)$') {
-        $num = [double]$matches[1]
-        $unit = $matches[2]
-        $multiplier = switch ($unit) {
-            'K' { 1000 }
-            'Ki' { 1024 }
-            'M' { 1000000 }
-            'Mi' { 1048576 }
-            'G' { 1000000000 }
-            'Gi' { 1073741824 }
-            'T' { 1000000000000 }
-            'Ti' { 1099511627776 }
-            default { 1 }
-        }
-        $sortKey = $num * $multiplier
-    } else {
-        try { $sortKey = [double]$sortKey } catch { $sortKey = 0 }
-    }
-    '''
-                else:
-                    # Simple numeric
-                    ps_script += '''
-    try { $sortKey = [double]$sortKey } catch { $sortKey = 0 }
-    '''
-            
-            ps_script += '''
-    [PSCustomObject]@{
-        Line = $_
-        SortKey = $sortKey
-    }
-'''
         else:
             # No field selection, just numeric/human sorting
-            if numeric or human:
-                ps_script += '''
+            ps_script += '''
     $sortKey = $_
     '''
-                if human:
-                    ps_script += '''
-    if ($sortKey -match '(\d+\.?\d*)([KMGT]i?)') {
-        $num = [double]$matches[1]
-        $unit = $matches[2]
-        $multiplier = switch ($unit) {
-            'K' { 1000 }
-            'Ki' { 1024 }
-            'M' { 1000000 }
-            'Mi' { 1048576 }
-            'G' { 1000000000 }
-            'Gi' { 1073741824 }
-            'T' { 1000000000000 }
-            'Ti' { 1099511627776 }
-            default { 1 }
-        }
-        $sortKey = $num * $multiplier
-    } else {
-        try { $sortKey = [double]$sortKey } catch { $sortKey = 0 }
-    }
-    '''
-                else:
-                    ps_script += '''
-    try { $sortKey = [double]$sortKey } catch { $sortKey = 0 }
-    '''
-                
-                ps_script += '''
-    [PSCustomObject]@{
-        Line = $_
-        SortKey = $sortKey
-    }
-'''
+        
+        # Key conversion + record fragment selected by mode, no branching
+        ps_script += _SORT_KEY_SCRIPTS[(numeric, human, bool(field_num))]
         
         ps_script += '} | Sort-Object -Property SortKey'
         
@@ -2222,7 +3227,7 @@ class CommandEmulator:
         
         ps_script += ' | ForEach-Object { $_.Line }'
         
-        return f'powershell -Command "{ps_script}"'
+        return _ps_encoded(ps_script)
     
     def _translate_uniq(self, cmd: str, parts):
         """
@@ -2241,33 +3246,35 @@ class CommandEmulator:
         - -f N, --skip-fields=N: Skip first N fields for comparison
         - -s N, --skip-chars=N: Skip first N chars for comparison
         """
-        count_mode = '-c' in parts or '--count' in parts
-        duplicates_only = '-d' in parts or '--repeated' in parts
-        unique_only = '-u' in parts or '--unique' in parts
-        ignore_case = '-i' in parts or '--ignore-case' in parts
+        flags = set(parts)
+        count_mode = '-c' in flags or '--count' in flags
+        duplicates_only = '-d' in flags or '--repeated' in flags
+        unique_only = '-u' in flags or '--unique' in flags
+        ignore_case = '-i' in flags or '--ignore-case' in flags
         
-        # Parse skip fields
+        # Parse skip fields and skip chars in a single pass
         skip_fields = 0
+        skip_chars = 0
         for i, part in enumerate(parts):
             if part == '-f' and i + 1 < len(parts):
                 skip_fields = int(parts[i + 1])
-            elif part.startswith('--skip-fields='):
-                skip_fields = int(part.split('=')[1])
-        
-        # Parse skip chars
-        skip_chars = 0
-        for i, part in enumerate(parts):
-            if part == '-s' and i + 1 < len(parts):
+            elif part == '-s' and i + 1 < len(parts):
                 skip_chars = int(parts[i + 1])
-            elif part.startswith('--skip-chars='):
-                skip_chars = int(part.split('=')[1])
+            else:
+                m = _LONG_FLAG_RE.match(part)
+                if m:
+                    name, value = m.group(1), m.group(2)
+                    if name == 'skip-fields':
+                        skip_fields = int(value)
+                    elif name == 'skip-chars':
+                        skip_chars = int(value)
         
         files = [p for p in parts[1:] if not p.startswith('-') and not p.isdigit()]
         
         # Build PowerShell script for CONSECUTIVE duplicate detection
         if files:
             file_path = files[0]
-            content_cmd = f'Get-Content "{file_path}"'
+            content_cmd = f'[System.IO.File]::ReadAllLines("{_ps_quote(file_path)}")'
         else:
             content_cmd = '$input'
         
@@ -2319,31 +3326,18 @@ class CommandEmulator:
                     # Different line - output previous
         '''
         
-        # Output logic based on mode
+        # Output logic based on mode (count > duplicates > unique > normal)
         if count_mode:
-            # Count mode: "%7d %s" format
-            ps_script += '''
-                    Write-Output ("{0,7} {1}" -f $count, $prevLine)
-            '''
+            mode = 'count'
         elif duplicates_only:
-            # Only duplicates (count > 1)
-            ps_script += '''
-                    if ($count -gt 1) {
-                        Write-Output $prevLine
-                    }
-            '''
+            mode = 'repeated'
         elif unique_only:
-            # Only unique (count == 1)
-            ps_script += '''
-                    if ($count -eq 1) {
-                        Write-Output $prevLine
-                    }
-            '''
+            mode = 'unique'
         else:
-            # Normal mode: just output unique lines
-            ps_script += '''
-                    Write-Output $prevLine
-            '''
+            mode = 'normal'
+        emit_in_loop, emit_last = _UNIQ_EMIT_SCRIPTS[mode]
+        
+        ps_script += emit_in_loop
         
         # Reset for new line
         ps_script += '''
@@ -2358,32 +3352,13 @@ class CommandEmulator:
         '''
         
         # Final output logic
-        if count_mode:
-            ps_script += '''
-                Write-Output ("{0,7} {1}" -f $count, $prevLine)
-            '''
-        elif duplicates_only:
-            ps_script += '''
-                if ($count -gt 1) {
-                    Write-Output $prevLine
-                }
-            '''
-        elif unique_only:
-            ps_script += '''
-                if ($count -eq 1) {
-                    Write-Output $prevLine
-                }
-            '''
-        else:
-            ps_script += '''
-                Write-Output $prevLine
-            '''
+        ps_script += emit_last
         
         ps_script += '''
             }
         '''
         
-        return f'powershell -Command "{ps_script}"'
+        return _ps_encoded(ps_script)
     
     def _translate_ps(self, cmd: str, parts):
         return 'tasklist'
@@ -2774,7 +3749,7 @@ class CommandEmulator:
         if fail_silent and not silent:
             ps_cmd = f'try {{ {ps_cmd} }} catch {{ exit 22 }}'
         
-        return f'powershell -Command "{ps_cmd}"'
+        return f'{_PS_COMMAND} "{ps_cmd}"'
     
     def _translate_chmod(self, cmd: str, parts):
         return 'echo chmod: operation completed (no-op on Windows)'
@@ -2805,7 +3780,7 @@ class CommandEmulator:
             else:
                 ps_cmd = f'Get-ChildItem -Path \\"{path}\\" -Recurse -File | Measure-Object -Property Length -Sum | Select-Object -ExpandProperty Sum'
             
-            return f'powershell -Command "{ps_cmd}"'
+            return f'{_PS_COMMAND} "{ps_cmd}"'
         elif all_files:
             # All files with sizes
             if human_readable:
@@ -2813,7 +3788,7 @@ class CommandEmulator:
             else:
                 ps_cmd = f'Get-ChildItem -Path \\"{path}\\" -Recurse | Select-Object FullName, Length'
             
-            return f'powershell -Command "{ps_cmd}"'
+            return f'{_PS_COMMAND} "{ps_cmd}"'
         else:
             # Directory sizes (default)
             return f'dir /s "{path}"'
@@ -2845,25 +3820,15 @@ class CommandEmulator:
             
             # Convert Unix format to PowerShell Get-Date format
             # %Y → yyyy, %m → MM, %d → dd, etc.
-            ps_fmt = fmt
-            ps_fmt = ps_fmt.replace('%Y', 'yyyy')
-            ps_fmt = ps_fmt.replace('%y', 'yy')
-            ps_fmt = ps_fmt.replace('%m', 'MM')
-            ps_fmt = ps_fmt.replace('%d', 'dd')
-            ps_fmt = ps_fmt.replace('%H', 'HH')
-            ps_fmt = ps_fmt.replace('%M', 'mm')
-            ps_fmt = ps_fmt.replace('%S', 'ss')
-            ps_fmt = ps_fmt.replace('%A', 'dddd')  # Full weekday
-            ps_fmt = ps_fmt.replace('%a', 'ddd')   # Short weekday
-            ps_fmt = ps_fmt.replace('%B', 'MMMM')  # Full month
-            ps_fmt = ps_fmt.replace('%b', 'MMM')   # Short month
+            # Single regex pass over the format string
+            ps_fmt = _DATE_TOKEN_RE.sub(lambda m: _DATE_TOKEN_MAP[m.group(0)], fmt)
             
             # Special cases
             if '%s' in fmt:
                 # Unix timestamp
-                return 'powershell -Command "[int](Get-Date -UFormat %s)"'
+                return f'{_PS_COMMAND} "[int](Get-Date -UFormat %s)"'
             
-            return f'powershell -Command "Get-Date -Format \\"{ps_fmt}\\""'
+            return f'{_PS_COMMAND} "Get-Date -Format \\"{ps_fmt}\\""'
         
         return 'echo %date% %time%'
     
@@ -2872,30 +3837,43 @@ class CommandEmulator:
             try:
                 seconds = float(parts[1])
                 # Use PowerShell Start-Sleep for decimal support (timeout only accepts integers)
-                return f'powershell -Command "Start-Sleep -Seconds {seconds}"'
+                return f'{_PS_COMMAND} "Start-Sleep -Seconds {seconds}"'
             except ValueError:
                 pass
         return 'echo Error: sleep requires seconds'
     
     def _translate_basename(self, cmd: str, parts):
         if len(parts) > 1:
-            filename = parts[1].split('/')[-1].split('\\')[-1]
+            # Last component by backward scan (trailing separators ignored, like Unix)
+            path = parts[1].rstrip('/\\') or parts[1][:1]
+            filename = path[max(path.rfind('/'), path.rfind('\\')) + 1:] or path
             return f'echo {filename}'
         return 'echo Error: basename requires path'
     
     def _translate_dirname(self, cmd: str, parts):
         if len(parts) > 1:
-            win_path = parts[1]  # Already translated
-            return f'powershell -Command "(Get-Item \\"{win_path}\\").Directory.FullName"'
+            # Pure string operation (like Unix dirname) - no interpreter spawn
+            win_path = parts[1].rstrip('/\\') or parts[1][:1]  # Already translated
+            sep_pos = max(win_path.rfind('/'), win_path.rfind('\\'))
+            if sep_pos < 0:
+                dirname = '.'
+            else:
+                dirname = win_path[:sep_pos].rstrip('/\\') or win_path[0]
+                if dirname.endswith(':'):
+                    dirname += win_path[sep_pos]  # Drive root keeps its separator
+            return f'echo {dirname}'
         return 'echo Error: dirname requires path'
     
     def _translate_tar(self, cmd: str, parts):
         """
-        Translate tar with REAL .tar.gz support via fallback chain.
+        Translate tar → native tar.exe (REAL .tar.gz support).
         
-        STRATEGY FOR 100%:
-        1. Try tar.exe (Git for Windows) - 100% GNU tar with .tar.gz, .tar.bz2, .tar.xz
-        2. Fallback PowerShell Compress-Archive - .zip workaround (90% compatible)
+        STRATEGY:
+        tar.exe is probed once in __init__ and invoked directly (no PowerShell
+        wrapper). It ships with Windows 10 1803+ (System32\\tar.exe, bsdtar)
+        and with Git for Windows (GNU tar). Without it we bail with an error:
+        Compress-Archive would silently produce a .zip under a .tar.gz name
+        and is orders of magnitude slower.
         
         CRITICAL: tar.exe supports REAL tar formats:
         - .tar: uncompressed tar archive
@@ -2912,99 +3890,53 @@ class CommandEmulator:
         if len(parts) < 2:
             return 'echo Error: tar requires arguments'
         
-        # Parse operation from flags
-        flags = parts[1]
-        create = 'c' in flags
-        extract = 'x' in flags
-        list_contents = 't' in flags
-        verbose = 'v' in flags
-        use_file = 'f' in flags
-        gzip_compress = 'z' in flags
-        bzip2_compress = 'j' in flags
-        xz_compress = 'J' in flags
+        # Fast path: canonical form with archive operand already validated by shape
+        # (shape checked on the unquoted argv: "my archive.tgz" is one operand)
+        min_args = _TAR_FAST_PATHS.get(parts[1])
+        if min_args and self._tar_exe:
+            args = _native_args(cmd)
+            if len(args) >= min_args and args[1][:1] != '-':
+                return _native_command(self._tar_exe, args)
+        
+        # Parse operation from flags - one pass over the flag string
+        flag_bits = 0
+        for flag in parts[1]:
+            flag_bits |= _TAR_FLAG_BITS.get(flag, 0)
+        create = flag_bits & _TAR_CREATE
+        extract = flag_bits & _TAR_EXTRACT
+        list_contents = flag_bits & _TAR_LIST
+        use_file = flag_bits & _TAR_FILE
         
         # Find archive name and paths
-        archive = None
-        paths = []
-        change_dir = None
-        
-        i = 2
-        while i < len(parts):
-            if parts[i] == '-C' and i + 1 < len(parts):
-                change_dir = parts[i + 1]
-                i += 2
-            elif not parts[i].startswith('-'):
-                if not archive and use_file:
-                    archive = parts[i]
-                else:
-                    paths.append(parts[i])
-                i += 1
-            else:
-                i += 1
+        _, operands = _scan_options(parts, _TAR_OPTIONS, start=2)
+        archive = operands[0] if use_file and operands else None
+        paths = operands[1:] if archive else operands
         
         if not archive:
             return 'echo Error: tar requires archive name (-f)'
         
-        # Build tar command for native tar.exe
-        tar_parts = [parts[0]]  # 'tar'
-        tar_parts.extend(parts[1:])  # All flags and args as-is
-        
-        tar_cmd = ' '.join(f'"{p}"' if ' ' in p else p for p in tar_parts)
-        
-        # PowerShell fallback (current implementation)
-        # Convert tar extensions to zip for PowerShell
-        if archive.endswith('.tar.gz') or archive.endswith('.tgz'):
-            zip_archive = archive.rsplit('.', 2 if archive.endswith('.tar.gz') else 1)[0] + '.zip'
-        elif archive.endswith('.tar.bz2') or archive.endswith('.tar.xz') or archive.endswith('.tar'):
-            zip_archive = archive.rsplit('.', 1)[0] + '.zip'
-        else:
-            zip_archive = archive
-        
-        if create:
-            if not paths:
-                return 'echo Error: tar -c requires source path(s)'
-            
-            paths_str = ','.join([f'\\"{p}\\"' for p in paths])
-            ps_fallback = f'Compress-Archive -Path {paths_str} -DestinationPath \\"{zip_archive}\\" -Force'
-            
-            if verbose:
-                ps_fallback += f'; Write-Host "Created archive: {zip_archive}"'
-        
-        elif extract:
-            dest = paths[0] if paths else '.'
-            ps_fallback = f'Expand-Archive -Path \\"{zip_archive}\\" -DestinationPath \\"{dest}\\" -Force'
-            
-            if verbose:
-                ps_fallback += f'; Get-ChildItem -Path \\"{dest}\\" -Recurse | Select-Object FullName'
-        
-        elif list_contents:
-            ps_fallback = f'Add-Type -AssemblyName System.IO.Compression.FileSystem; [System.IO.Compression.ZipFile]::OpenRead(\\"{zip_archive}\\").Entries | Select-Object FullName'
-        
-        else:
+        if not (create or extract or list_contents):
             return 'echo Error: tar requires operation flag (c, x, or t)'
         
-        # Build PowerShell script with fallback chain
-        ps_script = f'''
-            # Try native tar.exe (Git for Windows) - 100% GNU tar
-            $tarExe = Get-Command tar.exe -ErrorAction SilentlyContinue
-            
-            if ($tarExe) {{
-                # Native tar.exe available - supports REAL .tar.gz, .tar.bz2, .tar.xz
-                & tar.exe {' '.join(parts[1:])}
-            }} else {{
-                # Fallback: PowerShell Compress-Archive (.zip workaround)
-                {ps_fallback}
-            }}
-        '''
+        if create and not paths:
+            return 'echo Error: tar -c requires source path(s)'
         
-        return f'powershell -Command "{ps_script}"'
+        if not self._tar_exe:
+            return 'echo Error: tar.exe not found, install Git for Windows (or use Windows 10 1803+)'
+        
+        return self._native_tar(cmd)
+    
+    def _native_tar(self, cmd: str):
+        """Native tar.exe - all flags and args as-is, passed as argv"""
+        return _native_command(self._tar_exe, _native_args(cmd))
     
     def _translate_zip(self, cmd: str, parts):
         """
         Translate zip - create compressed archives.
         
         ARTISAN IMPLEMENTATION:
-        - Uses PowerShell Compress-Archive (native .NET)
+        - Single directory: .NET ZipFile.CreateFromDirectory (Optimal level)
+        - Other item lists: PowerShell Compress-Archive
         - Creates .zip files compatible with Unix unzip
         
         Flags:
@@ -3045,10 +3977,10 @@ class CommandEmulator:
             archive += '.zip'
         
         # Build paths list for PowerShell
-        paths_list = ','.join(f'"{item}"' for item in items)
+        paths_list = ','.join(f'"{_ps_quote(item)}"' for item in items)
         
         ps_script = f'''
-            $archive = "{archive}"
+            $archive = "{_ps_quote(archive)}"
             $items = @({paths_list})
             
             # Remove existing archive if present
@@ -3056,9 +3988,17 @@ class CommandEmulator:
                 Remove-Item $archive -Force
             }}
             
-            # Compress items
+            # Compress items - single directory goes straight to .NET ZipFile
+            # (no per-entry cmdlet pipeline), anything else via Compress-Archive
             try {{
-                Compress-Archive -Path $items -DestinationPath $archive -CompressionLevel Optimal
+                if ($items.Count -eq 1 -and (Test-Path $items[0] -PathType Container)) {{
+                    Add-Type -AssemblyName System.IO.Compression.FileSystem
+                    $src = (Resolve-Path $items[0]).ProviderPath
+                    $dst = $ExecutionContext.SessionState.Path.GetUnresolvedProviderPathFromPSPath($archive)
+                    [System.IO.Compression.ZipFile]::CreateFromDirectory($src, $dst, [System.IO.Compression.CompressionLevel]::Optimal, $true)
+                }} else {{
+                    Compress-Archive -Path $items -DestinationPath $archive -CompressionLevel Optimal
+                }}
                 Write-Output "created $archive"
             }} catch {{
                 Write-Error "zip: $($_.Exception.Message)"
@@ -3066,14 +4006,14 @@ class CommandEmulator:
             }}
         '''
         
-        return f'powershell -Command "{ps_script}"'
+        return _ps_encoded(ps_script)
     
     def _translate_unzip(self, cmd: str, parts):
         """
         Translate unzip - extract compressed archives.
         
         ARTISAN IMPLEMENTATION:
-        - Uses PowerShell Expand-Archive (native .NET)
+        - Uses .NET ZipFile.ExtractToDirectory (Expand-Archive only as fallback)
         - Extracts .zip files from Unix/Windows
         
         Flags:
@@ -3086,39 +4026,28 @@ class CommandEmulator:
           unzip -d output/ archive.zip
           unzip -l archive.zip
         """
-        list_contents = '-l' in parts
-        extract_dir = None
-        archive = None
-        
-        i = 1
-        while i < len(parts):
-            if parts[i] == '-l':
-                list_contents = True
-                i += 1
-            elif parts[i] == '-d' and i + 1 < len(parts):
-                extract_dir = parts[i + 1]
-                i += 2
-            elif not parts[i].startswith('-'):
-                archive = parts[i]
-                i += 1
-            else:
-                i += 1
+        options, operands = _scan_options(parts, _UNZIP_OPTIONS)
+        list_contents = options.get('list', False)
+        extract_dir = options['directory'][-1] if 'directory' in options else None
+        archive = operands[-1] if operands else None
         
         if not archive:
             return 'echo Error: unzip requires archive'
         
+        archive_q = _ps_quote(archive)
+        
         if list_contents:
             # List contents
             ps_script = f'''
-                if (-not (Test-Path "{archive}")) {{
-                    Write-Error "unzip: {archive}: No such file"
+                if (-not (Test-Path "{archive_q}")) {{
+                    Write-Error "unzip: {archive_q}: No such file"
                     exit 1
                 }}
                 
                 Add-Type -AssemblyName System.IO.Compression.FileSystem
-                $zip = [System.IO.Compression.ZipFile]::OpenRead("{archive}")
+                $zip = [System.IO.Compression.ZipFile]::OpenRead("{archive_q}")
                 
-                Write-Output "Archive:  {archive}"
+                Write-Output "Archive:  {archive_q}"
                 foreach ($entry in $zip.Entries) {{
                     $size = $entry.Length
                     $date = $entry.LastWriteTime.ToString("MM-dd-yy HH:mm")
@@ -3133,12 +4062,12 @@ class CommandEmulator:
                 extract_dir = '.'
             
             ps_script = f'''
-                if (-not (Test-Path "{archive}")) {{
-                    Write-Error "unzip: {archive}: No such file"
+                if (-not (Test-Path "{archive_q}")) {{
+                    Write-Error "unzip: {archive_q}: No such file"
                     exit 1
                 }}
                 
-                $dest = "{extract_dir}"
+                $dest = "{_ps_quote(extract_dir)}"
                 
                 # Create destination if needed
                 if (-not (Test-Path $dest)) {{
@@ -3146,15 +4075,25 @@ class CommandEmulator:
                 }}
                 
                 try {{
-                    Expand-Archive -Path "{archive}" -DestinationPath $dest -Force
-                    Write-Output "extracted {archive} to $dest"
+                    Add-Type -AssemblyName System.IO.Compression.FileSystem
+                    $src = (Resolve-Path "{archive_q}").ProviderPath
+                    $dst = (Resolve-Path $dest).ProviderPath
+                    try {{
+                        # .NET ZipFile: ~2x faster than Expand-Archive
+                        # (overwrite overload needs .NET Core / PowerShell 7)
+                        [System.IO.Compression.ZipFile]::ExtractToDirectory($src, $dst, $true)
+                    }} catch {{
+                        # Last resort: Windows PowerShell 5.1 without the overwrite overload
+                        Expand-Archive -Path $src -DestinationPath $dst -Force
+                    }}
+                    Write-Output "extracted {archive_q} to $dest"
                 }} catch {{
                     Write-Error "unzip: $($_.Exception.Message)"
                     exit 1
                 }}
             '''
         
-        return f'powershell -Command "{ps_script}"'
+        return _ps_encoded(ps_script)
     
     def _translate_sed(self, cmd: str, parts):
         """
@@ -3175,59 +4114,20 @@ class CommandEmulator:
         if len(parts) < 2:
             return 'echo Error: sed requires expression'
         
-        # Build command for native sed
-        sed_cmd_parts = []
-        for part in parts[1:]:
-            # Quote arguments that need it
-            if ' ' in part or any(c in part for c in ['|', '&', '>', '<', ';']):
-                sed_cmd_parts.append(f'"{part}"')
-            else:
-                sed_cmd_parts.append(part)
-        
-        sed_full_cmd = ' '.join(sed_cmd_parts)
-        
-        # PowerShell script 
-        ps_script_start = ""
+        if self._sed_exe:
+            # Native sed.exe - full GNU sed, no PowerShell startup, no cmd.exe quoting
+            return _native_command(self._sed_exe, _native_args(cmd))
         
         # Parse arguments for PowerShell 
-        in_place = False
-        quiet = False
-        expressions = []
-        files = []
-        
-        # Parse arguments
-        i = 1
-        while i < len(parts):
-            if parts[i] == '-i':
-                in_place = True
-                # Check for -i with backup suffix (e.g., -i.bak)
-                if i + 1 < len(parts) and not parts[i + 1].startswith('-') and '=' not in parts[i + 1]:
-                    i += 2  # skip backup suffix
-                else:
-                    i += 1
-            elif parts[i].startswith('-i'):
-                in_place = True
-                i += 1
-            elif parts[i] == '-n':
-                quiet = True
-                i += 1
-            elif parts[i] == '-e' and i + 1 < len(parts):
-                expressions.append(parts[i + 1])
-                i += 2
-            elif parts[i].startswith('-e'):
-                expressions.append(parts[i][2:])
-                i += 1
-            elif not parts[i].startswith('-'):
-                # First non-flag is expression (if no -e was used)
-                if not expressions:
-                    expressions.append(parts[i])
-                else:
-                    # It's a file
-                    win_path = parts[i]  # Already translated
-                    files.append(win_path)
-                i += 1
-            else:
-                i += 1
+        options, operands = _scan_options(parts, _SED_OPTIONS)
+        in_place = options.get('in_place', False)  # -i / -i.bak (suffix is attached)
+        quiet = options.get('quiet', False)
+        expressions = options.get('expression', [])
+        if not expressions and operands:
+            # First non-flag is expression (if no -e was used)
+            expressions = operands[:1]
+            operands = operands[1:]
+        files = operands  # Already translated
         
         if not expressions:
             return 'echo Error: sed requires expression'
@@ -3236,28 +4136,30 @@ class CommandEmulator:
         # Support both file and stdin input
         using_stdin = not files
         if files:
-            file_arg = f'\\"{files[0]}\\"'
+            file_arg = f'"{_ps_quote(files[0])}"'
         else:
             file_arg = None  # Using stdin
 
         # Build PowerShell sed emulation with line number tracking
-        ps_script_parts = []
-        ps_script_parts.append('$LineNum = 0')
-        ps_script_parts.append('$output = @()')
+        # Fixed prologue as a literal; appends bound once (no per-call attribute lookup)
+        ps_script_parts = ['$LineNum = 0']
+        emit = ps_script_parts.append
 
+        # Read input ONCE up front; $totalLines serves the 'last_line' address
+        # without re-reading the file per line
         if using_stdin:
-            # For stdin, buffer all input first (needed for 'last_line' address)
-            ps_script_parts.append('$lines = @($input)')
-            ps_script_parts.append('$totalLines = $lines.Count')
-            ps_script_parts.append('$lines | ForEach-Object {')
+            emit('$lines = @($input)')
         else:
-            # For file, stream directly
-            ps_script_parts.append(f'Get-Content {file_arg} | ForEach-Object {{')
+            emit(f'$lines = [System.IO.File]::ReadAllLines({file_arg})')
+        emit('$totalLines = $lines.Count')
+        # Lines are emitted straight to the output stream (no $output += copy
+        # per line); for -i the foreach result is collected by assignment
+        loop_start = len(ps_script_parts)  # Hoisted regex declarations go here
+        regex_decls = []
+        emit(('$output = ' if in_place else '') + 'foreach ($rawLine in $lines) {')
 
-        ps_script_parts.append('  $LineNum++')
-        ps_script_parts.append('  $line = $_')
-        ps_script_parts.append('  $print = ' + ('$false' if quiet else '$true'))
-        ps_script_parts.append('  $skip = $false')
+        ps_script_parts.extend(('  $LineNum++', '  $line = $rawLine',
+                                '  $print = ' + ('$false' if quiet else '$true'), '  $skip = $false'))
         
         # Process each expression
         for expr_idx, expr in enumerate(expressions):
@@ -3268,19 +4170,19 @@ class CommandEmulator:
             # Check for address prefix
             # Line number: 5s/.../ or 1,10s/.../
             if expr[0].isdigit():
-                match = re.match(r'^(\d+)(,(\d+|\$))?(.*)$', expr)
+                match = _SED_LINE_ADDR_RE.match(expr)
                 if match:
                     start_line = match.group(1)
                     end_line = match.group(3) if match.group(3) else start_line
                     command = match.group(4)
                     if end_line == '$':
-                        address = ('line_range', start_line, '999999')
+                        address = ('line_range', start_line, '$totalLines')
                     else:
                         address = ('line_range', start_line, end_line)
             
             # Pattern address: /pattern/s/.../
             elif expr.startswith('/'):
-                match = re.match(r'^/(.+?)/(,/(.+?)/)?(.*)$', expr)
+                match = _SED_PATTERN_ADDR_RE.match(expr)
                 if match:
                     pattern = match.group(1)
                     end_pattern = match.group(3)
@@ -3301,13 +4203,10 @@ class CommandEmulator:
                 if address[0] == 'line_range':
                     condition = f'($LineNum -ge {address[1]} -and $LineNum -le {address[2]})'
                 elif address[0] == 'pattern':
-                    pattern_escaped = address[1].replace('\\', '\\\\').replace('"', '\\"')
+                    pattern_escaped = _ps_quote(address[1])
                     condition = f'($line -match "{pattern_escaped}")'
                 elif address[0] == 'last_line':
-                    if using_stdin:
-                        condition = '($LineNum -eq $totalLines)'
-                    else:
-                        condition = '($LineNum -eq (Get-Content ' + file_arg + ' | Measure-Object -Line).Lines)'
+                    condition = '($LineNum -eq $totalLines)'
             
             # Parse command type
             if command.startswith('s/') or command.startswith('s|') or command.startswith('s#'):
@@ -3316,8 +4215,8 @@ class CommandEmulator:
                 parts_expr = command[2:].split(delimiter)
                 
                 if len(parts_expr) >= 2:
-                    search = parts_expr[0].replace('\\', '\\\\').replace('"', '\\"')
-                    replace = parts_expr[1].replace('\\', '\\\\').replace('"', '\\"')
+                    search = _ps_quote(parts_expr[0])
+                    replace = _ps_quote(parts_expr[1])
                     flags = parts_expr[2] if len(parts_expr) > 2 else ''
                     
                     global_replace = 'g' in flags
@@ -3326,67 +4225,52 @@ class CommandEmulator:
                     
                     # Build replacement operation
                     if condition:
-                        ps_script_parts.append(f'  if {condition} {{')
+                        emit(f'  if {condition} {{')
                     else:
-                        ps_script_parts.append('  if ($true) {')
+                        emit('  if ($true) {')
                     
-                    # Generate replacement logic
-                    if global_replace:
-                        # Global replace: use standard -replace (replaces ALL occurrences)
-                        if ignore_case:
-                            ps_script_parts.append(f'    $line = $line -replace "(?i){search}", "{replace}"')
-                        else:
-                            ps_script_parts.append(f'    $line = $line -replace "{search}", "{replace}"')
-                    else:
-                        # First occurrence only: use .NET Regex.Replace with count=1
-                        if ignore_case:
-                            ps_script_parts.append(f'    $regex = [regex]::new("(?i){search}"); $line = $regex.Replace($line, "{replace}", 1)')
-                        else:
-                            ps_script_parts.append(f'    $regex = [regex]::new("{search}"); $line = $regex.Replace($line, "{replace}", 1)')
+                    # Regex compiled ONCE before the loop (-replace would
+                    # re-resolve it per line); count=1 unless global
+                    regex_var = f'$sedRegex{expr_idx}'
+                    inline_flags = '(?i)' if ignore_case else ''
+                    regex_decls.append(f'{regex_var} = [regex]::new("{inline_flags}{search}")')
+                    count_arg = '' if global_replace else ', 1'
+                    emit(f'    $line = {regex_var}.Replace($line, "{replace}"{count_arg})')
                     
                     if print_flag and quiet:
-                        ps_script_parts.append('    $print = $true')
+                        emit('    $print = $true')
                     
-                    ps_script_parts.append('  }')
+                    emit('  }')
             
             elif command == 'd' or (command.endswith('d') and len(command) == 1):
                 # Delete operation
                 if condition:
-                    ps_script_parts.append(f'  if {condition} {{')
+                    emit(f'  if {condition} {{')
                 else:
-                    ps_script_parts.append('  if ($true) {')
+                    emit('  if ($true) {')
                 
-                ps_script_parts.append('    $skip = $true')
-                ps_script_parts.append('  }')
+                emit('    $skip = $true')
+                emit('  }')
             
             elif command == 'p' or (command.endswith('p') and len(command) == 1):
                 # Print operation (in quiet mode, forces print)
                 if condition:
-                    ps_script_parts.append(f'  if {condition} {{')
+                    emit(f'  if {condition} {{')
                 else:
-                    ps_script_parts.append('  if ($true) {')
+                    emit('  if ($true) {')
                 
-                ps_script_parts.append('    $print = $true')
-                ps_script_parts.append('  }')
+                emit('    $print = $true')
+                emit('  }')
         
         # Output logic
-        ps_script_parts.append('  if (-not $skip -and $print) {')
-        ps_script_parts.append('    $output += $line')
-        ps_script_parts.append('  }')
-        ps_script_parts.append('}')
+        ps_script_parts.extend(('  if (-not $skip -and $print) {', '    $line', '  }', '}'))
         
-        # Final output
         if in_place:
-            ps_script_parts.append(f'$output | Set-Content {file_arg}')
-        else:
-            ps_script_parts.append('$output')
-        
-        ps_script = '; '.join(ps_script_parts)
-        
-        # Complete script with fallback chain
-        ps_complete = ps_script_start + ps_script
+            emit(f'Set-Content {file_arg} $output')
+        ps_script_parts[loop_start:loop_start] = regex_decls
         
-        return f'powershell -Command "{ps_complete}"'
+        # Single join over all fragments - no intermediate script strings
+        return _ps_encoded('; '.join(ps_script_parts))
     
     def _translate_awk(self, cmd: str, parts):
         """
@@ -3432,59 +4316,36 @@ class CommandEmulator:
         # Standard awk execution with native awk.exe preference
         # ================================================================
         
-        # Build command for native awk
-        awk_cmd_parts = []
-        for part in parts[1:]:
-            # Quote arguments that need it
-            if ' ' in part or any(c in part for c in ['|', '&', '>', '<', ';']):
-                awk_cmd_parts.append(f'"{part}"')
-            else:
-                awk_cmd_parts.append(part)
-        
-        awk_full_cmd = ' '.join(awk_cmd_parts)
-        
-        # PowerShell script with fallback chain
-        ps_script = ""
+        if self._awk_exe:
+            # Native awk.exe/gawk.exe - full GNU awk, no PowerShell startup, no cmd.exe quoting
+            return _native_command(self._awk_exe, _native_args(cmd))
         
         # Extract awk components for PowerShell fallback
         field_separator = None
         program = None
         files = []
         
-        # Parse arguments
-        i = 1
-        while i < len(parts):
-            if parts[i] == '-F' and i + 1 < len(parts):
-                field_separator = parts[i + 1]
-                i += 2
-            elif parts[i].startswith('-F'):
-                field_separator = parts[i][2:]
-                i += 1
-            elif not parts[i].startswith('-'):
-                # Check if this looks like part of awk program (not a file)
-                is_awk_keyword = parts[i] in ['BEGIN', 'END']
-                is_awk_syntax = any(c in parts[i] for c in ['{', '}', '$', 'print', 'sum', 'NR', 'NF'])
-
-                if program is None:
-                    # Start building program - may span multiple parts if split incorrectly
-                    program = parts[i]
-                    # If program starts with { but doesn't end with }, collect more parts
-                    if '{' in program and not program.endswith('}'):
-                        i += 1
-                        while i < len(parts) and not program.endswith('}'):
-                            program += ' ' + parts[i]
-                            i += 1
-                        i -= 1  # Back up one since we'll increment at end
-                elif is_awk_keyword or is_awk_syntax:
-                    # This is part of the program, not a file
-                    program += ' ' + parts[i]
-                else:
-                    # This is a file
-                    win_path = parts[i]  # Already translated
-                    files.append(win_path)
-                i += 1
+        options, operands = _scan_options(parts, _AWK_OPTIONS)
+        if 'separator' in options:
+            field_separator = options['separator'][-1]
+        
+        for operand in operands:
+            # Check if this looks like part of awk program (not a file)
+            is_awk_keyword = operand in ['BEGIN', 'END']
+            is_awk_syntax = any(c in operand for c in ['{', '}', '$', 'print', 'sum', 'NR', 'NF'])
+
+            if program is None:
+                # Start building program - may span multiple parts if split incorrectly
+                program = operand
+            elif '{' in program and not program.endswith('}'):
+                # Program started with { but not closed yet - collect more parts
+                program += ' ' + operand
+            elif is_awk_keyword or is_awk_syntax:
+                # This is part of the program, not a file
+                program += ' ' + operand
             else:
-                i += 1
+                # This is a file
+                files.append(operand)  # Already translated
         
         if not program:
             return 'echo Error: awk requires program'
@@ -3497,8 +4358,8 @@ class CommandEmulator:
         if not field_separator:
             field_separator = '\\s+'
         else:
-            # Escape special regex chars
-            field_separator = field_separator.replace('\\', '\\\\')
+            # Escape for the double-quoted -split operand
+            field_separator = _ps_quote(field_separator)
         
         # Parse awk program
         # Detect BEGIN, main block, END
@@ -3508,20 +4369,20 @@ class CommandEmulator:
         pattern = None
         
         # Extract BEGIN block
-        begin_match = re.search(r'BEGIN\s*{([^}]+)}', program)
+        begin_match = _AWK_BEGIN_RE.search(program)
         if begin_match:
             begin_block = begin_match.group(1).strip()
             program = program.replace(begin_match.group(0), '')
         
         # Extract END block
-        end_match = re.search(r'END\s*{([^}]+)}', program)
+        end_match = _AWK_END_RE.search(program)
         if end_match:
             end_block = end_match.group(1).strip()
             program = program.replace(end_match.group(0), '')
         
         # Extract pattern and main block
         # Pattern can be: /regex/, $1 > 100, NF > 5, etc.
-        pattern_match = re.match(r'^(/[^/]+/|[^{]+)\s*{([^}]+)}', program.strip())
+        pattern_match = _AWK_PATTERN_BLOCK_RE.match(program.strip())
         if pattern_match:
             pattern_str = pattern_match.group(1).strip()
             main_block = pattern_match.group(2).strip()
@@ -3532,36 +4393,36 @@ class CommandEmulator:
                 pattern = ('condition', pattern_str)
         else:
             # No pattern, just block
-            block_match = re.search(r'{([^}]+)}', program)
+            block_match = _AWK_BLOCK_RE.search(program)
             if block_match:
                 main_block = block_match.group(1).strip()
         
-        # Build PowerShell fallback script
-        ps_lines = []
+        # Build PowerShell fallback script as ONE fragment list
+        ps_main = []
 
         # BEGIN block
         if begin_block:
-            ps_begin = self._awk_to_ps_statement(begin_block)
-            ps_lines.append(ps_begin)
+            ps_main.append(self._awk_to_ps_statement(begin_block))
 
         # Main processing
-        ps_main = []
         # Initialize AWK variables before loop
         ps_main.append('$NR = 0')  # AWK line number counter
 
-        # Handle stdin vs file differently
+        # foreach statement, not a ForEach-Object pipeline (no per-line
+        # scriptblock invocation); $line holds the record ($0)
         if files:
-            ps_main.append(f'Get-Content "{files[0]}" | ForEach-Object {{')
+            ps_main.append(f'$lines = [System.IO.File]::ReadAllLines("{_ps_quote(files[0])}")')
+            ps_main.append('foreach ($line in $lines) {')
         else:
-            ps_main.append('$input | ForEach-Object {')
+            ps_main.append('foreach ($line in $input) {')
         ps_main.append('  $NR++')  # Increment line number
-        ps_main.append(f'  $F = $_ -split "{field_separator}"')
+        ps_main.append(f'  $F = $line -split "{field_separator}"')
         ps_main.append('  $NF = $F.Length')
         
         # Apply pattern filter if present
         if pattern:
             if pattern[0] == 'regex':
-                ps_main.append(f'  if ($_ -match "{pattern[1]}") {{')
+                ps_main.append(f'  if ($line -match "{_ps_quote(pattern[1])}") {{')
             elif pattern[0] == 'condition':
                 ps_condition = self._awk_to_ps_condition(pattern[1])
                 ps_main.append(f'  if ({ps_condition}) {{')
@@ -3580,33 +4441,24 @@ class CommandEmulator:
         
         # END block
         if end_block:
-            ps_end = self._awk_to_ps_statement(end_block)
-            ps_main.append(ps_end)
+            ps_main.append(self._awk_to_ps_statement(end_block))
         
-        ps_script = '; '.join(ps_lines + ps_main)
-        
-        return f'powershell -Command "{ps_script}"'
+        return _ps_encoded('; '.join(ps_main))
     
     def _awk_to_ps_statement(self, awk_stmt: str) -> str:
         """Convert awk statement to PowerShell"""
         # Handle print statements
         if 'print' in awk_stmt:
             # Extract what to print
-            print_match = re.search(r'print\s+(.+)', awk_stmt)
+            print_match = _AWK_PRINT_RE.search(awk_stmt)
             if print_match:
                 expr = print_match.group(1).strip()
 
-                # Convert special AWK variables first
-                # $0 = entire line (use $_ in PowerShell)
-                expr = expr.replace('$0', '$_')
-
                 # NR = line number (need to track in PowerShell)
                 expr = expr.replace('NR', '$NR')
 
-                # Convert field references ($1, $2, etc.) - but NOT $0 (already handled)
-                expr = re.sub(r'\$([1-9]\d*)', r'$F[\1-1]', expr)
-                expr = expr.replace('$NF', '$F[$NF-1]')
-                expr = expr.replace('$(NF-1)', '$F[$NF-2]')
+                # Field references ($0, $N, $NF, $(NF-k)) in a single pass
+                expr = _AWK_FIELD_REF_RE.sub(_awk_field_ref, expr)
 
                 # Convert AWK variables to PowerShell variables
                 # If expr is a simple identifier (variable name), add $
@@ -3618,13 +4470,13 @@ class CommandEmulator:
         # Handle variable assignments
         if '=' in awk_stmt and not '==' in awk_stmt:
             # x=0 or x+=$1
-            var_match = re.match(r'(\w+)\s*([+\-*/]?=)\s*(.+)', awk_stmt)
+            var_match = _AWK_ASSIGN_RE.match(awk_stmt)
             if var_match:
                 var_name = var_match.group(1)
                 operator = var_match.group(2)
                 value = var_match.group(3).strip()
                 # Convert field references in value
-                value = re.sub(r'\$(\d+)', r'$F[\1-1]', value)
+                value = _AWK_FIELD_REF_RE.sub(_awk_field_ref, value)
                 return f'${var_name} {operator} {value}'
         
         # Handle increment/decrement
@@ -3636,126 +4488,108 @@ class CommandEmulator:
     def _awk_to_ps_condition(self, awk_cond: str) -> str:
         """Convert awk condition to PowerShell"""
         # Convert field references
-        ps_cond = re.sub(r'\$(\d+)', r'$F[\1-1]', awk_cond)
-        ps_cond = ps_cond.replace('$NF', '$NF')
-        return ps_cond
+        return _AWK_FIELD_REF_RE.sub(_awk_field_ref, awk_cond)
     
     def _translate_cut(self, cmd: str, parts):
         """Translate cut with FULL options - bytes and complement implemented"""
         if len(parts) < 2:
             return 'echo Error: cut requires options'
         
-        delimiter = None
-        fields = None
-        characters = None
-        bytes_range = None
-        complement = False
-        files = []
-        
-        i = 1
-        while i < len(parts):
-            if parts[i] == '-d' and i + 1 < len(parts):
-                delimiter = parts[i + 1]
-                i += 2
-            elif parts[i].startswith('-d'):
-                delimiter = parts[i][2:]
-                i += 1
-            elif parts[i] == '-f' and i + 1 < len(parts):
-                fields = parts[i + 1]
-                i += 2
-            elif parts[i].startswith('-f'):
-                fields = parts[i][2:]
-                i += 1
-            elif parts[i] == '-c' and i + 1 < len(parts):
-                characters = parts[i + 1]
-                i += 2
-            elif parts[i].startswith('-c'):
-                characters = parts[i][2:]
-                i += 1
-            elif parts[i] == '-b' and i + 1 < len(parts):
-                bytes_range = parts[i + 1]
-                i += 2
-            elif parts[i].startswith('-b'):
-                bytes_range = parts[i][2:]
-                i += 1
-            elif parts[i] == '--complement':
-                complement = True
-                i += 1
-            elif not parts[i].startswith('-'):
-                win_path = parts[i]  # Already translated
-                files.append(win_path)
-                i += 1
-            else:
-                i += 1
+        options, files = _scan_options(parts, _CUT_OPTIONS)  # Files already translated
+        delimiter = options['delimiter'][-1] if 'delimiter' in options else None
+        fields = options['fields'][-1] if 'fields' in options else None
+        characters = options['characters'][-1] if 'characters' in options else None
+        bytes_range = options['bytes'][-1] if 'bytes' in options else None
+        complement = options.get('complement', False)
         
-        # Determine input source (stdin or file)
-        input_src = f'Get-Content \\"{files[0]}\\"' if files else '$input'
+        # Determine input source (stdin or file): string[] in ONE call, no Get-Content;
+        # lines walked with the foreach statement (no ForEach-Object script block per line)
+        if files:
+            prologue = ''
+            lines_src = f'[System.IO.File]::ReadAllLines("{_ps_quote(files[0])}")'
+        else:
+            prologue = f'{_PS_READ_STDIN_LINES}; '
+            lines_src = '$lines'
 
         # Field extraction with delimiter
         # Default delimiter is TAB if -f is used without -d
         if fields:
-            if not delimiter:
-                delimiter = '\\t'  # TAB is default delimiter for cut -f
+            # TAB is default delimiter for cut -f; literal split (not -split regex)
+            delimiter = _ps_quote(delimiter) if delimiter else '`t'
             # Parse field spec
             field_list = self._parse_cut_range(fields)
 
             if complement:
                 # Complement: select all EXCEPT specified fields
-                ps_cmd = f'{input_src} | ForEach-Object {{ $F = $_ -split \\"{delimiter}\\"; $indices = 0..($F.Length-1) | Where-Object {{ {field_list} -notcontains $_ }}; ($F[$indices]) -join \\"{delimiter}\\" }}'
+                ps_cmd = f'{prologue}foreach ($line in {lines_src}) {{ $F = $line.Split("{delimiter}"); $indices = 0..($F.Length-1) | Where-Object {{ @({field_list}) -notcontains $_ }}; ($F[$indices]) -join "{delimiter}" }}'
             else:
-                ps_cmd = f'{input_src} | ForEach-Object {{ $F = $_ -split \\"{delimiter}\\"; ($F[{field_list}]) -join \\"{delimiter}\\" }}'
+                ps_cmd = f'{prologue}foreach ($line in {lines_src}) {{ $F = $line.Split("{delimiter}"); ($F[{field_list}]) -join "{delimiter}" }}'
 
-            return f'powershell -Command "{ps_cmd}"'
+            return _ps_encoded(ps_cmd)
 
         # Character extraction
         elif characters:
             char_list = self._parse_cut_range(characters)
 
             if complement:
-                ps_cmd = f'{input_src} | ForEach-Object {{ $chars = $_.ToCharArray(); $indices = 0..($chars.Length-1) | Where-Object {{ {char_list} -notcontains $_ }}; -join $chars[$indices] }}'
+                ps_cmd = f'{prologue}foreach ($line in {lines_src}) {{ $F = $line.ToCharArray(); $indices = 0..($F.Length-1) | Where-Object {{ @({char_list}) -notcontains $_ }}; -join $F[$indices] }}'
             else:
-                ps_cmd = f'{input_src} | ForEach-Object {{ -join $_.ToCharArray()[{char_list}] }}'
+                # $F: open ranges (N-) in char_list are bounded by $F.Length
+                ps_cmd = f'{prologue}foreach ($line in {lines_src}) {{ $F = $line.ToCharArray(); -join $F[{char_list}] }}'
 
-            return f'powershell -Command "{ps_cmd}"'
+            return _ps_encoded(ps_cmd)
 
         # Byte extraction (similar to character but works on bytes)
         elif bytes_range:
             byte_list = self._parse_cut_range(bytes_range)
 
-            if complement:
-                ps_cmd = f'{input_src} -Encoding Byte | ForEach-Object {{ $bytes = $_; $indices = 0..($bytes.Length-1) | Where-Object {{ {byte_list} -notcontains $_ }}; $bytes[$indices] }}'
+            # ONE whole-file read (no -Encoding Byte: one pipeline object per byte,
+            # gone in PS 7); per line a [bool[]] mask selects bytes, -complement
+            # just flips the test. Raw bytes go straight to stdout.
+            # stdin: ONE ReadToEnd, bytes as they came (CRLF, missing final newline)
+            if files:
+                input_bytes = f'$b = Read-AllBytes "{_ps_quote(files[0])}"'
             else:
-                ps_cmd = f'{input_src} -Encoding Byte | ForEach-Object {{ $_[{byte_list}] }}'
-
-            return f'powershell -Command "{ps_cmd}"'
+                input_bytes = f'{_PS_READ_STDIN}; $b = [System.Text.Encoding]::UTF8.GetBytes($IN)'
+            neg = '$true' if complement else '$false'
+            ps_script = f'''
+                {input_bytes}
+                $out = [Console]::OpenStandardOutput()
+                $s = 0
+                while ($s -lt $b.Length) {{
+                    $e = [Array]::IndexOf($b, [byte]10, $s)
+                    if ($e -lt 0) {{ $e = $b.Length }}
+                    $F = [byte[]]::new($e - $s)
+                    [Array]::Copy($b, $s, $F, 0, $F.Length)
+                    $mask = [bool[]]::new($F.Length)
+                    foreach ($i in @({byte_list})) {{ if ($i -ge 0 -and $i -lt $F.Length) {{ $mask[$i] = $true }} }}
+                    for ($i = 0; $i -lt $F.Length; $i++) {{
+                        if ($mask[$i] -ne {neg}) {{ $out.WriteByte($F[$i]) }}
+                    }}
+                    $out.WriteByte(10)
+                    $s = $e + 1
+                }}
+                $out.Flush()
+            '''
+            return _ps_encoded(_PS_READ_ALL_BYTES_FN + ps_script if files else ps_script)
         
         return 'echo Error: cut requires -f (with -d), -c, or -b'
 
-    def _parse_cut_range(self, range_spec: str) -> str:
-        """Parse cut range specification (N, N-M, N-, -M, N,M,...)"""
-        ranges = []
-        for part in range_spec.split(','):
-            if '-' in part and not part.startswith('-'):
-                # Range N-M
-                bounds = part.split('-')
-                start = int(bounds[0]) - 1 if bounds[0] else 0
-                end = int(bounds[1]) - 1 if bounds[1] else -1
-                if end == -1:
-                    ranges.append(f'{start}..($F.Length-1)')
-                else:
-                    ranges.append(f'{start}..{end}')
-            else:
-                # Single number
-                num = int(part) - 1
-                ranges.append(str(num))
-        
-        return ','.join(ranges)
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _parse_cut_range(range_spec: str) -> str:
+        """Parse cut range specification (N, N-M, N-, -M, N,M,...) - memoized, pure"""
+        items = [_cut_range_item(part) for part in range_spec.split(',')]
+        if len(items) == 1 or not any('..' in item for item in items):
+            return ','.join(items)
+        # ',' binds tighter than '..' in PowerShell: concatenate arrays instead
+        return '+'.join(f'({item})' if '..' in item else f'@({item})' for item in items)
     
     def _translate_true(self, cmd: str, parts):
-        return 'exit /b 0'
+        return _STATIC_TRANSLATIONS['true']
     
     def _translate_false(self, cmd: str, parts):
-        return 'exit /b 1'
+        return _STATIC_TRANSLATIONS['false']
     
     # ========================================================================
     # NEW CRITICAL COMMANDS
@@ -3766,8 +4600,9 @@ class CommandEmulator:
         Execute test - evaluate conditional expressions.
 
         ARTIGIANO IMPLEMENTATION:
-        - PowerShell Test-Path for file/dir checks
-        - PowerShell operators for comparisons
+        - cmd.exe "if exist" for -f/-d/-e/-s (no PowerShell startup)
+        - Literal integer comparisons decided at translation time
+        - PowerShell Test-Path / operators for everything else
         - Exit code 0 (success) or 1 (failure)
 
         Common tests:
@@ -3789,160 +4624,61 @@ class CommandEmulator:
             # Empty test is false
             return 'exit 1'
 
-        # File/directory tests
-        if parts[1] == '-f' and len(parts) >= 3:
-            file_path = parts[2]
-            ps_cmd = f'''
-                if ((Test-Path "{file_path}") -and -not (Test-Path "{file_path}" -PathType Container)) {{
-                    exit 0
-                }} else {{
-                    exit 1
-                }}
-            '''
-            return f'powershell -Command "{ps_cmd}"'
+        # Native answers first: literal integer compare → fixed status (true/false,
+        # no process at all); file checks → cmd.exe "if exist" (operand without
+        # characters cmd would expand or unquote)
+        if (len(parts) >= 4 and parts[2] in _TEST_INT_OPS
+                and _TEST_INT_RE.fullmatch(parts[1]) and _TEST_INT_RE.fullmatch(parts[3])):
+            result = _TEST_INT_OPS[parts[2]](int(parts[1]), int(parts[3]))
+            return _STATIC_TRANSLATIONS['true' if result else 'false']
+        if len(parts) == 3 and parts[1] in _TEST_CMD_UNARY_OPS and not _CMD_UNSAFE_OPERAND_RE.search(parts[2]):
+            return _TEST_CMD_UNARY_OPS[parts[1]].format(parts[2])
+
+        # ONE dict lookup picks the operator: unary (-f X) or binary (X op Y)
+        if len(parts) >= 4 and parts[2] in _TEST_BINARY_OPS:
+            condition = _TEST_BINARY_OPS[parts[2]].format(_ps_quote(parts[1]), _ps_quote(parts[3]))
+        elif len(parts) >= 3 and parts[1] in _TEST_UNARY_OPS:
+            condition = _TEST_UNARY_OPS[parts[1]].format(_ps_quote(parts[2]))
+        else:
+            # Unknown test format / operator - fail
+            return 'exit 1'
 
-        if parts[1] == '-d' and len(parts) >= 3:
-            dir_path = parts[2]
-            ps_cmd = f'''
-                if (Test-Path "{dir_path}" -PathType Container) {{
-                    exit 0
-                }} else {{
-                    exit 1
-                }}
-            '''
-            return f'powershell -Command "{ps_cmd}"'
-
-        if parts[1] == '-e' and len(parts) >= 3:
-            path = parts[2]
-            ps_cmd = f'''
-                if (Test-Path "{path}") {{
-                    exit 0
-                }} else {{
-                    exit 1
-                }}
-            '''
-            return f'powershell -Command "{ps_cmd}"'
-
-        # String tests
-        if parts[1] == '-z' and len(parts) >= 3:
-            # String is empty
-            string = parts[2]
-            ps_cmd = f'''
-                if ([string]::IsNullOrEmpty("{string}")) {{
-                    exit 0
-                }} else {{
-                    exit 1
-                }}
-            '''
-            return f'powershell -Command "{ps_cmd}"'
-
-        if parts[1] == '-n' and len(parts) >= 3:
-            # String is NOT empty
-            string = parts[2]
-            ps_cmd = f'''
-                if (-not [string]::IsNullOrEmpty("{string}")) {{
-                    exit 0
-                }} else {{
-                    exit 1
-                }}
-            '''
-            return f'powershell -Command "{ps_cmd}"'
-
-        # Numeric comparisons (3 args: val1 op val2)
-        if len(parts) >= 4:
-            val1 = parts[1]
-            op = parts[2]
-            val2 = parts[3]
-
-            # Map bash operators to PowerShell
-            if op == '-eq':
-                ps_op = '-eq'
-            elif op == '-ne':
-                ps_op = '-ne'
-            elif op == '-lt':
-                ps_op = '-lt'
-            elif op == '-le':
-                ps_op = '-le'
-            elif op == '-gt':
-                ps_op = '-gt'
-            elif op == '-ge':
-                ps_op = '-ge'
-            elif op == '=':
-                # String equality
-                ps_cmd = f'''
-                    if ("{val1}" -eq "{val2}") {{
-                        exit 0
-                    }} else {{
-                        exit 1
-                    }}
-                '''
-                return f'powershell -Command "{ps_cmd}"'
-            elif op == '!=':
-                # String inequality
-                ps_cmd = f'''
-                    if ("{val1}" -ne "{val2}") {{
-                        exit 0
-                    }} else {{
-                        exit 1
-                    }}
-                '''
-                return f'powershell -Command "{ps_cmd}"'
-            else:
-                # Unknown operator - fail
-                return 'exit 1'
-
-            # Numeric comparison
-            ps_cmd = f'''
-                try {{
-                    $v1 = [int]"{val1}"
-                    $v2 = [int]"{val2}"
-                    if ($v1 {ps_op} $v2) {{
-                        exit 0
-                    }} else {{
-                        exit 1
-                    }}
-                }} catch {{
-                    exit 1
-                }}
-            '''
-            return f'powershell -Command "{ps_cmd}"'
-
-        # Unknown test format - fail
-        return 'exit 1'
-    
-    def _expand_tr_set(self, char_set: str) -> str:
-        """
-        Expand character ranges in tr set (e.g., 'a-z' -> 'abcd...xyz').
-        Handles ranges like a-z, A-Z, 0-9, etc.
-        Handles escape sequences like \n, \t, \\, etc.
-        """
-        result = []
-        i = 0
-        while i < len(char_set):
-            # Check for escape sequences
-            if char_set[i] == '\\' and i + 1 < len(char_set):
-                next_char = char_set[i + 1]
-                # Handle common escape sequences
-                escape_map = {
-                    'n': '\n',
-                    't': '\t',
-                    'r': '\r',
-                    '\\': '\\',
-                    '0': '\0',
-                    'a': '\a',
-                    'b': '\b',
-                    'f': '\f',
-                    'v': '\v',
-                }
-                if next_char in escape_map:
-                    result.append(escape_map[next_char])
-                    i += 2
-                    continue
-                else:
-                    # Unknown escape, keep backslash
-                    result.append('\\')
-                    i += 1
-                    continue
+        # Non-numeric operand for -eq & co. throws → false, like test's error status
+        return _ps_encoded(f'try {{ if ({condition}) {{ exit 0 }} }} catch {{ }}; exit 1')
+    
+    def _expand_tr_set(self, char_set: str) -> str:
+        """
+        Expand character ranges in tr set (e.g., 'a-z' -> 'abcd...xyz').
+        Handles ranges like a-z, A-Z, 0-9, etc.
+        Handles escape sequences like \n, \t, \\, etc.
+        """
+        result = []
+        i = 0
+        while i < len(char_set):
+            # Check for escape sequences
+            if char_set[i] == '\\' and i + 1 < len(char_set):
+                next_char = char_set[i + 1]
+                # Handle common escape sequences
+                escape_map = {
+                    'n': '\n',
+                    't': '\t',
+                    'r': '\r',
+                    '\\': '\\',
+                    '0': '\0',
+                    'a': '\a',
+                    'b': '\b',
+                    'f': '\f',
+                    'v': '\v',
+                }
+                if next_char in escape_map:
+                    result.append(escape_map[next_char])
+                    i += 2
+                    continue
+                else:
+                    # Unknown escape, keep backslash
+                    result.append('\\')
+                    i += 1
+                    continue
 
             # Check for range pattern: X-Y
             if i + 2 < len(char_set) and char_set[i + 1] == '-' and char_set[i] != '\\':
@@ -3967,12 +4703,14 @@ class CommandEmulator:
         if len(parts) < 2:
             return 'echo Error: tr requires arguments'
 
-        delete_mode = '-d' in parts
-        squeeze = '-s' in parts
-        complement = '-c' in parts
+        # Flags may be combined (-ds, -cs)
+        flags = ''.join(p[1:] for p in parts[1:] if p.startswith('-') and len(p) > 1)
+        delete_mode = 'd' in flags
+        squeeze = 's' in flags
+        complement = 'c' in flags or 'C' in flags
 
-        # Remove flags
-        sets = [p for p in parts[1:] if not p.startswith('-')]
+        # Remove flags; sets unquoted ('a-z', ' ', '\n' are ONE operand each)
+        sets = [p for p in _native_args(cmd) if not p.startswith('-')]
 
         if not sets:
             return 'echo Error: tr requires character sets'
@@ -3981,79 +4719,61 @@ class CommandEmulator:
         set1 = self._expand_tr_set(sets[0])
         set2 = self._expand_tr_set(sets[1]) if len(sets) > 1 else ''
         
-        # Handle complement flag
+        if squeeze and (delete_mode or complement or set2):
+            # Several operations: chained regex passes over ALL of stdin
+            return self._tr_fused_script(set1, set2, delete_mode, complement)
+        
+        # Single operation: one regex pass over ALL of stdin (tr is
+        # case-sensitive: [regex]::Replace without IgnoreCase)
+        prelude = ''
         if complement:
-            # Complement inverts the set - match everything NOT in set1
-            # For deletion: delete everything NOT in set1
-            # For translation: translate everything NOT in set1
-            if delete_mode:
-                # Delete characters NOT in set1 (keep only set1)
-                # Build negated character class
-                ps_cmd = f'$input | ForEach-Object {{ $_ -replace "[^{set1}]", "" }}'
-            else:
-                # Translate characters NOT in set1 to set2
-                # This is complex - simplified implementation
-                ps_cmd = f'$input | ForEach-Object {{ $_ -replace "[^{set1}]", "{set2[0] if set2 else ""}" }}'
-        elif delete_mode:
-            # Delete characters in set1
-            ps_cmd = f'$input | ForEach-Object {{ $_ -replace "[{set1}]", "" }}'
+            # Complement inverts the set - match everything NOT in set1;
+            # delete, or translate to the last char of set2
+            replacement = _tr_replacement(set2[-1] if set2 and not delete_mode else '')
+            result = f"[regex]::Replace($IN, '{_tr_char_class(set1, negate=True)}', {replacement})"
         elif squeeze:
             # Squeeze repeated characters in set1
-            ps_cmd = f'$input | ForEach-Object {{ $_ -replace "([{set1}])+", "$1" }}'
+            result = f"[regex]::Replace($IN, '({_tr_char_class(set1)})\\1+', '$1')"
+        elif set2 and not delete_mode:
+            # Translate: small code → char table, looked up per match only
+            # (SET2 padded with its last char, GNU)
+            prelude = f'{_tr_map(set1, set2)}; '
+            result = f"[regex]::Replace($IN, '{_tr_char_class(set1)}', {_TR_MAP_EVALUATOR})"
         else:
-            # Translate set1 to set2
-            if len(set1) == len(set2):
-                # Character-by-character translation
-                # Build PowerShell translation
-                replacements = []
-                for i in range(len(set1)):
-                    # Escape special chars for regex and PowerShell
-                    from_char = set1[i]
-                    to_char = set2[i]
-
-                    # Convert special characters to PowerShell escapes
-                    ps_escape_map = {
-                        '\n': '`n',
-                        '\t': '`t',
-                        '\r': '`r',
-                        '\0': '`0',
-                    }
-
-                    # For regex pattern (from_char)
-                    if from_char in ps_escape_map:
-                        from_char = '\\' + from_char.encode('unicode_escape').decode('ascii')[-1]  # \n for regex
-                    else:
-                        from_char = from_char.replace('\\', '\\\\').replace('[', '\\[').replace(']', '\\]')
-
-                    # For replacement (to_char) - use PowerShell escape
-                    if to_char in ps_escape_map:
-                        to_char = ps_escape_map[to_char]
-                    else:
-                        to_char = to_char.replace('\\', '\\\\').replace('$', '$$')
-
-                    replacements.append(f'$line = $line -replace "{from_char}", "{to_char}"')
-
-                ps_operations = '; '.join(replacements)
-                ps_cmd = f'$input | ForEach-Object {{ $line = $_; {ps_operations}; $line }}'
-            else:
-                # Set2 shorter: pad with last char, or truncate set1
-                if set2:
-                    # Use last char of set2 for all remaining chars in set1
-                    pad_char = set2[-1]
-                    ps_cmd = f'$input | ForEach-Object {{ $_ -replace "[{set1}]", "{pad_char}" }}'
-                else:
-                    # No set2: delete
-                    ps_cmd = f'$input | ForEach-Object {{ $_ -replace "[{set1}]", "" }}'
+            # Delete characters in set1 (-d, or no set2)
+            result = f"[regex]::Replace($IN, '{_tr_char_class(set1)}', '')"
         
-        return f'powershell -Command "{ps_cmd}"'
+        return _ps_encoded(f'{prelude}{_PS_READ_STDIN}; [Console]::Out.Write({result})')
+    
+    def _tr_fused_script(self, set1: str, set2: str, delete_mode: bool, complement: bool) -> str:
+        """
+        tr with squeeze + delete/translate/complement: chained regex passes.
+
+        delete (SET1, or its complement) → translate → squeeze, each one
+        [regex]::Replace over the whole text. Squeeze applies to SET2 when
+        delete/translate produce output, else to SET1 (GNU semantics).
+        """
+        lines = [_PS_READ_STDIN]
+        if delete_mode:
+            lines.append(f"$IN = [regex]::Replace($IN, '{_tr_char_class(set1, negate=complement)}', '')")
+        elif set2 and complement:
+            lines.append(f"$IN = [regex]::Replace($IN, '{_tr_char_class(set1, negate=True)}', "
+                         f"{_tr_replacement(set2[-1])})")
+        elif set2:
+            lines.append(_tr_map(set1, set2))
+            lines.append(f"$IN = [regex]::Replace($IN, '{_tr_char_class(set1)}', {_TR_MAP_EVALUATOR})")
+
+        squeeze_class = _tr_char_class(set2) if (delete_mode or set2) else _tr_char_class(set1, negate=complement)
+        lines.append(f"[Console]::Out.Write([regex]::Replace($IN, '({squeeze_class})\\1+', '$1'))")
+        return _ps_encoded('\n'.join(lines))
     
     def _translate_diff(self, cmd: str, parts):
         """
         Translate diff with unified format at 100% compatibility.
         
         STRATEGY FOR 100%:
-        1. Try diff.exe (from Git for Windows) - 100% GNU compatible
-        2. Fallback PowerShell custom - 95% compatible (format correct, hunks approximate)
+        1. diff.exe (probed once in __init__) - 100% GNU compatible, all flags
+        2. Fallback PowerShell custom - Myers diff, exact GNU hunks
         
         CRITICAL: unified format requirements:
         - Header: --- file1<TAB>timestamp
@@ -4072,19 +4792,22 @@ class CommandEmulator:
         if len(parts) < 3:
             return 'echo Error: diff requires two files'
         
+        if self._diff_exe:
+            # Native diff.exe - all flags and args as-is, passed as argv
+            return _native_command(self._diff_exe, _native_args(cmd))
+        
         unified = '-u' in parts or '--unified' in parts
         brief = '-q' in parts or '--brief' in parts
         
         # Parse -U N for context lines
         context_lines = 3  # Default
-        context_flag = ''
         for i, part in enumerate(parts):
             if part == '-U' and i + 1 < len(parts):
                 context_lines = int(parts[i + 1])
-                context_flag = f'-U{context_lines}'
+                unified = True
             elif part.startswith('-U'):
                 context_lines = int(part[2:])
-                context_flag = part
+                unified = True
         
         files = [p for p in parts[1:] if not p.startswith('-') and not p.isdigit()]
         
@@ -4102,162 +4825,11 @@ class CommandEmulator:
             # Standard diff (use fc)
             return f'fc /n "{file1}" "{file2}"'
         
-        # UNIFIED DIFF - Try diff.exe first, fallback to PowerShell
-        fallback_ps = f'''
-            # Try native diff.exe first (Git for Windows, etc.)
-            $diffExe = Get-Command diff.exe -ErrorAction SilentlyContinue
-            if ($diffExe) {{
-                & diff.exe -u {context_flag} "{file1}" "{file2}"
-                exit $LASTEXITCODE
-            }}
-            
-            # Fallback: PowerShell custom implementation
-            $file1 = "{file1}"
-            $file2 = "{file2}"
-            $context = {context_lines}
-            
-            # Read files
-            if (-not (Test-Path $file1)) {{
-                Write-Host "diff: $file1: No such file or directory"
-                exit 2
-            }}
-            if (-not (Test-Path $file2)) {{
-                Write-Host "diff: $file2: No such file or directory"
-                exit 2
-            }}
-            
-            $lines1 = @(Get-Content $file1)
-            $lines2 = @(Get-Content $file2)
-            
-            # Get file timestamps
-            $time1 = (Get-Item $file1).LastWriteTime.ToString("yyyy-MM-dd HH:mm:ss.fff000000 +0000")
-            $time2 = (Get-Item $file2).LastWriteTime.ToString("yyyy-MM-dd HH:mm:ss.fff000000 +0000")
-            
-            # Header
-            Write-Output "--- $file1`t$time1"
-            Write-Output "+++ $file2`t$time2"
-            
-            # Simple line-by-line diff algorithm
-            # NOTE: This is approximate. For 100% accuracy, use diff.exe (Git for Windows).
-            $i = 0
-            $j = 0
-            $hunks = @()
-            
-            while ($i -lt $lines1.Count -or $j -lt $lines2.Count) {{
-                # Find next difference
-                $changeStart1 = $i
-                $changeStart2 = $j
-                
-                # Skip matching lines
-                while ($i -lt $lines1.Count -and $j -lt $lines2.Count -and $lines1[$i] -eq $lines2[$j]) {{
-                    $i++
-                    $j++
-                }}
-                
-                if ($i -ge $lines1.Count -and $j -ge $lines2.Count) {{
-                    break  # All done
-                }}
-                
-                # Found a difference - collect changed block
-                $delStart = $i
-                $addStart = $j
-                
-                # Collect deleted lines
-                while ($i -lt $lines1.Count -and ($j -ge $lines2.Count -or $lines1[$i] -ne $lines2[$j])) {{
-                    # Check if we can find a match soon
-                    $foundMatch = $false
-                    for ($k = $j; $k -lt [Math]::Min($j + 3, $lines2.Count); $k++) {{
-                        if ($lines1[$i] -eq $lines2[$k]) {{
-                            $foundMatch = $true
-                            break
-                        }}
-                    }}
-                    if ($foundMatch) {{ break }}
-                    $i++
-                }}
-                
-                # Collect added lines
-                while ($j -lt $lines2.Count -and ($i -ge $lines1.Count -or $lines1[$i] -ne $lines2[$j])) {{
-                    # Check if we can find a match soon
-                    $foundMatch = $false
-                    for ($k = $i; $k -lt [Math]::Min($i + 3, $lines1.Count); $k++) {{
-                        if ($lines2[$j] -eq $lines1[$k]) {{
-                            $foundMatch = $true
-                            break
-                        }}
-                    }}
-                    if ($foundMatch) {{ break }}
-                    $j++
-                }}
-                
-                # Create hunk
-                $delCount = $i - $delStart
-                $addCount = $j - $addStart
-                
-                if ($delCount -gt 0 -or $addCount -gt 0) {{
-                    $hunk = @{{
-                        Start1 = $delStart
-                        Count1 = $delCount
-                        Start2 = $addStart
-                        Count2 = $addCount
-                        ContextBefore = [Math]::Max(0, $delStart - $context)
-                        ContextAfter = [Math]::Min($lines1.Count - 1, $i + $context - 1)
-                    }}
-                    $hunks += ,$hunk
-                }}
-            }}
-            
-            # Merge overlapping hunks
-            $merged = @()
-            foreach ($hunk in $hunks) {{
-                if ($merged.Count -eq 0) {{
-                    $merged += ,$hunk
-                }} else {{
-                    $last = $merged[-1]
-                    if ($hunk.ContextBefore -le $last.ContextAfter + 1) {{
-                        # Overlapping - merge
-                        $last.Count1 = ($hunk.Start1 + $hunk.Count1) - $last.Start1
-                        $last.Count2 = ($hunk.Start2 + $hunk.Count2) - $last.Start2
-                        $last.ContextAfter = $hunk.ContextAfter
-                    }} else {{
-                        $merged += ,$hunk
-                    }}
-                }}
-            }}
-            
-            # Output hunks
-            foreach ($hunk in $merged) {{
-                $start1 = $hunk.ContextBefore + 1
-                $start2 = $start1 - $hunk.Start1 + $hunk.Start2
-                
-                $count1 = ($hunk.Start1 + $hunk.Count1) - $hunk.ContextBefore + [Math]::Min($context, $lines1.Count - ($hunk.Start1 + $hunk.Count1))
-                $count2 = ($hunk.Start2 + $hunk.Count2) - ($start2 - 1) + [Math]::Min($context, $lines2.Count - ($hunk.Start2 + $hunk.Count2))
-                
-                Write-Output "@@ -$start1,$count1 +$start2,$count2 @@"
-                
-                # Context before
-                for ($k = $hunk.ContextBefore; $k -lt $hunk.Start1; $k++) {{
-                    Write-Output " $($lines1[$k])"
-                }}
-                
-                # Changes
-                for ($k = $hunk.Start1; $k -lt $hunk.Start1 + $hunk.Count1; $k++) {{
-                    Write-Output "-$($lines1[$k])"
-                }}
-                for ($k = $hunk.Start2; $k -lt $hunk.Start2 + $hunk.Count2; $k++) {{
-                    Write-Output "+$($lines2[$k])"
-                }}
-                
-                # Context after
-                $afterStart = [Math]::Max($hunk.Start1 + $hunk.Count1, $hunk.Start2 + $hunk.Count2 - ($hunk.Count2 - $hunk.Count1))
-                $afterEnd = [Math]::Min($afterStart + $context, $lines1.Count)
-                for ($k = $afterStart; $k -lt $afterEnd; $k++) {{
-                    Write-Output " $($lines1[$k])"
-                }}
-            }}
-        '''
+        # UNIFIED DIFF - PowerShell Myers diff (_DIFF_UNIFIED_TMPL)
+        fallback_ps = _DIFF_UNIFIED_TMPL.safe_substitute(
+            FILE1=_ps_quote(file1), FILE2=_ps_quote(file2), CONTEXT=context_lines)
         
-        return f'powershell -Command "{fallback_ps}"'
+        return _ps_encoded(fallback_ps)
     
     def _translate_tee(self, cmd: str, parts):
         """
@@ -4273,14 +4845,11 @@ class CommandEmulator:
         
         file_path = files[0]
         
-        if append:
-            # Append mode
-            ps_cmd = f'$input | Tee-Object -FilePath \\"{file_path}\\" -Append'
-        else:
-            # Overwrite mode
-            ps_cmd = f'$input | Tee-Object -FilePath \\"{file_path}\\"'
+        # stdin read once, written with one File call (no Tee-Object formatting)
+        write = 'AppendAllText' if append else 'WriteAllText'
+        ps_cmd = f'{_PS_READ_STDIN}; [System.IO.File]::{write}("{_ps_quote(file_path)}", $IN); [Console]::Out.Write($IN)'
         
-        return f'powershell -Command "{ps_cmd}"'
+        return _ps_encoded(ps_cmd)
     
     def _translate_seq(self, cmd: str, parts):
         """
@@ -4293,27 +4862,30 @@ class CommandEmulator:
         if len(parts) < 2:
             return 'echo Error: seq requires arguments'
         
-        nums = [p for p in parts[1:] if not p.startswith('-')]
-        
-        if len(nums) == 1:
-            # seq LAST → 1..LAST
-            last = nums[0]
-            ps_cmd = f'1..{last}'
-        elif len(nums) == 2:
-            # seq FIRST LAST
-            first = nums[0]
-            last = nums[1]
-            ps_cmd = f'{first}..{last}'
-        elif len(nums) >= 3:
-            # seq FIRST INCREMENT LAST
-            first = nums[0]
-            incr = nums[1]
-            last = nums[2]
-            ps_cmd = f'{first}..{last} | Where-Object {{ ($_ - {first}) % {incr} -eq 0 }}'
-        else:
+        # Numeric operands (negative ones too); flags like -w are skipped
+        nums = [p for p in parts[1:] if _SEQ_NUMBER_RE.fullmatch(p)]
+        
+        if not nums:
             return 'echo Error: seq requires numbers'
         
-        return f'powershell -Command "{ps_cmd}"'
+        # seq LAST → FIRST=1, INCREMENT=1
+        first, incr, last = ('1', '1', nums[0]) if len(nums) == 1 else \
+            (nums[0], '1', nums[1]) if len(nums) == 2 else nums[:3]
+        
+        if incr == '1' and first.isdigit() and last.isdigit() and \
+                int(last) < _INT32_MAX and int(first) <= _INT32_MAX:
+            # Integer range: .NET Range (empty when LAST < FIRST, unlike PS 5..1);
+            # Range is Int32 (start, count and last value) - larger ones use the loop
+            count = max(0, int(last) - int(first) + 1)
+            ps_cmd = f'[System.Linq.Enumerable]::Range({first}, {count})'
+        elif float(incr) == 0:
+            return 'echo seq: invalid Zero increment value: 0 1>&2 & exit /b 1'
+        else:
+            # Arithmetic progression: O(count) steps, not O(range) + filter
+            cmp = '-ge' if incr.startswith('-') else '-le'
+            ps_cmd = f'for ($i = {first}; $i {cmp} {last}; $i += {incr}) {{ $i }}'
+        
+        return f'{_PS_COMMAND} "{ps_cmd}"'
     
     def _translate_yes(self, cmd: str, parts):
         """
@@ -4321,20 +4893,25 @@ class CommandEmulator:
         
         Usage: yes [STRING]
         """
-        text = parts[1] if len(parts) > 1 else 'y'
+        text = ' '.join(parts[1:]) if len(parts) > 1 else 'y'
         
-        # Use PowerShell infinite loop
-        ps_cmd = f'while($true) {{ Write-Output "{text}" }}'
-        
-        return f'powershell -Command "{ps_cmd}"'
+        # Buffered writer on raw stdout: the write fails once the reader
+        # closes the pipe (yes | head) and the loop ends quietly
+        ps_script = f'''
+            $line = '{text.replace("'", "''")}'
+            $out = [System.IO.StreamWriter]::new([Console]::OpenStandardOutput())
+            $out.NewLine = "`n"
+            try {{ while ($true) {{ $out.WriteLine($line) }} }} catch [System.IO.IOException] {{ }}
+        '''
+        return _ps_encoded(ps_script)
     
     def _translate_whoami(self, cmd: str, parts):
         """Translate whoami (current user)."""
-        return 'echo %USERNAME%'
+        return _STATIC_TRANSLATIONS['whoami']
     
     def _translate_hostname(self, cmd: str, parts):
         """Translate hostname (computer name)."""
-        return 'hostname'
+        return _STATIC_TRANSLATIONS['hostname']
     
     def _translate_file(self, cmd: str, parts):
         """
@@ -4353,9 +4930,9 @@ class CommandEmulator:
         file_path = files[0]
         
         # Use PowerShell to get file info
-        ps_cmd = f'Get-Item \\"{file_path}\\" | Select-Object Name, Extension, Length, LastWriteTime | Format-List'
+        ps_cmd = f'Get-Item "{_ps_quote(file_path)}" | Select-Object Name, Extension, Length, LastWriteTime | Format-List'
         
-        return f'powershell -Command "{ps_cmd}"'
+        return _ps_encoded(ps_cmd)
     
     def _translate_stat(self, cmd: str, parts):
         """
@@ -4374,9 +4951,9 @@ class CommandEmulator:
         file_path = files[0]
         
         # Use PowerShell Get-Item with full properties
-        ps_cmd = f'Get-Item \\"{file_path}\\" | Format-List *'
+        ps_cmd = f'Get-Item "{_ps_quote(file_path)}" | Format-List *'
         
-        return f'powershell -Command "{ps_cmd}"'
+        return _ps_encoded(ps_cmd)
     
     def _translate_readlink(self, cmd: str, parts):
         """
@@ -4397,12 +4974,12 @@ class CommandEmulator:
         
         if follow_all:
             # Resolve to absolute path
-            ps_cmd = f'(Get-Item \\"{file_path}\\").Target'
+            ps_cmd = f'(Get-Item "{_ps_quote(file_path)}").Target'
         else:
             # Just show link target
-            ps_cmd = f'(Get-Item \\"{file_path}\\").Target'
+            ps_cmd = f'(Get-Item "{_ps_quote(file_path)}").Target'
         
-        return f'powershell -Command "{ps_cmd}"'
+        return _ps_encoded(ps_cmd)
     
     def _translate_realpath(self, cmd: str, parts):
         """
@@ -4421,9 +4998,9 @@ class CommandEmulator:
         file_path = files[0]
         
         # Use PowerShell Resolve-Path
-        ps_cmd = f'Resolve-Path \\"{file_path}\\" | Select-Object -ExpandProperty Path'
+        ps_cmd = f'Resolve-Path "{_ps_quote(file_path)}" | Select-Object -ExpandProperty Path'
         
-        return f'powershell -Command "{ps_cmd}"'
+        return _ps_encoded(ps_cmd)
 
     def _checksum_generic(self, algorithm: str, cmd_name: str, parts):
         """
@@ -4445,17 +5022,14 @@ class CommandEmulator:
         # Stdin support: if no files, hash from stdin
         if not files and not check_mode:
             ps_script = f'''
-                $stream = [System.IO.StreamReader]::new([Console]::OpenStandardInput())
-                $bytes = [System.Text.Encoding]::UTF8.GetBytes($stream.ReadToEnd())
-                $stream.Close()
-
+                {_PS_OPEN_STDIN_STREAM}
                 $hasher = [System.Security.Cryptography.{algorithm}]::Create()
-                $hash = $hasher.ComputeHash($bytes)
+                try {{ $hash = $hasher.ComputeHash($in) }} finally {{ $in.Dispose() }}
                 $hashString = [System.BitConverter]::ToString($hash).Replace('-','').ToLower()
 
                 Write-Output ($hashString + "  -")
             '''
-            return f'powershell -Command "{ps_script}"'
+            return _ps_encoded(ps_script)
 
         if check_mode:
             # Check mode: verify checksums from file
@@ -4497,16 +5071,16 @@ class CommandEmulator:
                 }}
             '''
             
-            return f'powershell -Command "{ps_script}"'
+            return _ps_encoded(ps_script)
         
         # Hash files
         commands = []
         for file_path in files:
             ps_cmd = (
                 f'$hash = Get-FileHash -Path \\"{file_path}\\" -Algorithm {algorithm}; '
-                f'Write-Output ($hash.Hash.ToLower() + "  " + $hash.Path)'
+                "Write-Output ($hash.Hash.ToLower() + '  ' + $hash.Path)"
             )
-            commands.append(f'powershell -Command "{ps_cmd}"')
+            commands.append(f'{_PS_COMMAND} "{ps_cmd}"')
         
         return ' && '.join(commands)
     
@@ -4571,93 +5145,15 @@ class CommandEmulator:
         if not file_path:
             return 'echo Error: hexdump requires filename'
         
-        if canonical:
-            # Canonical format: offset + hex + ASCII
-            ps_script = f'''
-                $file = "{file_path}"
-                $skip = {skip_bytes}
-                $limit = {limit_bytes if limit_bytes else -1}
-                
-                if (-not (Test-Path $file)) {{
-                    Write-Error "hexdump: $file`: No such file or directory"
-                    exit 1
-                }}
-                
-                $bytes = [System.IO.File]::ReadAllBytes($file)
-                
-                # Apply skip
-                if ($skip -gt 0) {{
-                    $bytes = $bytes[$skip..($bytes.Length - 1)]
-                }}
-                
-                # Apply limit
-                if ($limit -gt 0 -and $limit -lt $bytes.Length) {{
-                    $bytes = $bytes[0..($limit - 1)]
-                }}
-                
-                # Dump in canonical format (16 bytes per line)
-                for ($i = 0; $i -lt $bytes.Length; $i += 16) {{
-                    # Offset (8 hex digits)
-                    $offset = "{{0:x8}}" -f ($i + $skip)
-                    
-                    # Extract chunk (up to 16 bytes)
-                    $chunk = $bytes[$i..[Math]::Min($i + 15, $bytes.Length - 1)]
-                    
-                    # Hex part 1 (first 8 bytes)
-                    $hex1 = ""
-                    for ($j = 0; $j -lt [Math]::Min(8, $chunk.Length); $j++) {{
-                        $hex1 += "{{0:x2}} " -f $chunk[$j]
-                    }}
-                    $hex1 = $hex1.TrimEnd()
-                    
-                    # Hex part 2 (last 8 bytes)
-                    $hex2 = ""
-                    if ($chunk.Length -gt 8) {{
-                        for ($j = 8; $j -lt $chunk.Length; $j++) {{
-                            $hex2 += "{{0:x2}} " -f $chunk[$j]
-                        }}
-                        $hex2 = $hex2.TrimEnd()
-                    }}
-                    
-                    # ASCII part (. for non-printable)
-                    $ascii = ""
-                    foreach ($b in $chunk) {{
-                        if ($b -ge 32 -and $b -le 126) {{
-                            $ascii += [char]$b
-                        }} else {{
-                            $ascii += "."
-                        }}
-                    }}
-                    
-                    # Format line (pad hex fields to align)
-                    $hex1_padded = $hex1.PadRight(23)  # 8 bytes * 3 chars - 1
-                    $hex2_padded = $hex2.PadRight(23)
-                    
-                    Write-Output "$offset  $hex1_padded $hex2_padded |$ascii|"
-                }}
-            '''
-            
-            return f'powershell -Command "{ps_script}"'
-        else:
-            # Non-canonical format - just hex
-            ps_script = f'''
-                $bytes = [System.IO.File]::ReadAllBytes("{file_path}")
-                
-                # Apply skip
-                if ({skip_bytes} -gt 0) {{
-                    $bytes = $bytes[{skip_bytes}..($bytes.Length - 1)]
-                }}
-                
-                # Apply limit
-                if ({limit_bytes if limit_bytes else -1} -gt 0) {{
-                    $bytes = $bytes[0..({limit_bytes} - 1)]
-                }}
-                
-                # Output hex
-                $bytes | ForEach-Object {{ "{{0:x2}}" -f $_ }} | Write-Output
-            '''
-            
-            return f'powershell -Command "{ps_script}"'
+        # Read once, then walk [start, end) by index - no array slicing
+        # Canonical format: offset + hex (8 + 8) + |ASCII|, one StringBuilder;
+        # non-canonical format - just hex
+        ps_script = _PS_READ_ALL_BYTES_FN + _HEXDUMP_READ_TMPL.safe_substitute(
+            FILE=_ps_quote(file_path), SKIP=skip_bytes,
+            LIMIT=limit_bytes if limit_bytes is not None else -1)
+        ps_script += _HEXDUMP_CANONICAL_PS if canonical else _HEXDUMP_PLAIN_PS
+        
+        return _ps_encoded(ps_script)
     
     def _translate_strings(self, cmd: str, parts):
         """
@@ -4674,6 +5170,40 @@ class CommandEmulator:
         
         Output: one string per line
         """
+        min_len, file_path = self._parse_strings_args(parts)
+        
+        if not file_path:
+            return 'echo Error: strings requires filename'
+        
+        # ONE regex scan over the bytes as Latin-1 text (byte N → char N):
+        # runs of printable ASCII 32-126, no per-byte interpreted loop
+        ps_script = _STRINGS_TMPL.safe_substitute(
+            FILE=_ps_quote(file_path), MIN_LEN=min_len)
+        
+        return _ps_encoded(_PS_READ_ALL_BYTES_FN + ps_script)
+    
+    def _local_strings(self, parts, working_dir) -> Optional[str]:
+        """
+        strings in-process: the same regex as _translate_strings, run by the
+        C regex engine over an mmap of the file (no copy into Python memory)
+        """
+        try:
+            min_len, file_path = self._parse_strings_args(parts)
+            if not file_path:
+                return None
+            with open(os.path.join(working_dir, file_path), 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return ''  # mmap refuses empty files
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    return ''.join(
+                        m.group().decode('ascii') + '\n'
+                        for m in _strings_bytes_re(min_len).finditer(data)
+                    )
+        except (OSError, ValueError):
+            return None
+    
+    def _parse_strings_args(self, parts) -> Tuple[int, Optional[str]]:
+        """strings flags → (min_len, file_path)"""
         min_len = 4
         file_path = None
         
@@ -4691,41 +5221,7 @@ class CommandEmulator:
             else:
                 i += 1
         
-        if not file_path:
-            return 'echo Error: strings requires filename'
-        
-        ps_script = f'''
-            $file = "{file_path}"
-            $minLen = {min_len}
-            
-            if (-not (Test-Path $file)) {{
-                Write-Error "strings: $file`: No such file or directory"
-                exit 1
-            }}
-            
-            $bytes = [System.IO.File]::ReadAllBytes($file)
-            $current = ""
-            
-            foreach ($b in $bytes) {{
-                # Printable ASCII: 32-126 (space to tilde)
-                if ($b -ge 32 -and $b -le 126) {{
-                    $current += [char]$b
-                }} else {{
-                    # Non-printable: end current string
-                    if ($current.Length -ge $minLen) {{
-                        Write-Output $current
-                    }}
-                    $current = ""
-                }}
-            }}
-            
-            # Output last string if long enough
-            if ($current.Length -ge $minLen) {{
-                Write-Output $current
-            }}
-        '''
-        
-        return f'powershell -Command "{ps_script}"'
+        return min_len, file_path
     
     def _translate_column(self, cmd: str, parts):
         """
@@ -4775,52 +5271,19 @@ class CommandEmulator:
                 return 'echo Error: column requires -t flag or file'
         
         # Table mode: read file, parse columns, align
+        # Plain string[] (ReadAllLines: no per-line PSObject decoration)
         if file_path:
-            input_source = f'Get-Content "{file_path}"'
+            input_source = f'[System.IO.File]::ReadAllLines("{_ps_quote(file_path)}")'
         else:
             # stdin
-            input_source = '$input'
+            input_source = '@($input)'
         
         sep_regex = r'\\s+' if not separator else separator.replace('|', '\\|')
         
-        ps_script = f'''
-            $lines = {input_source}
-            $rows = @()
-            $maxWidths = @{{}}
-            
-            # Parse all rows and track max width per column
-            foreach ($line in $lines) {{
-                if ($line.Trim() -eq "") {{ continue }}
-                
-                $fields = $line -split "{sep_regex}"
-                $rows += ,@($fields)
-                
-                for ($i = 0; $i -lt $fields.Length; $i++) {{
-                    $width = $fields[$i].Length
-                    if (-not $maxWidths.ContainsKey($i) -or $maxWidths[$i] -lt $width) {{
-                        $maxWidths[$i] = $width
-                    }}
-                }}
-            }}
-            
-            # Output aligned rows
-            foreach ($row in $rows) {{
-                $output = ""
-                for ($i = 0; $i -lt $row.Length; $i++) {{
-                    $field = $row[$i]
-                    if ($i -lt $row.Length - 1) {{
-                        # Pad all but last column
-                        $output += $field.PadRight($maxWidths[$i] + 2)
-                    }} else {{
-                        # Last column: no padding
-                        $output += $field
-                    }}
-                }}
-                Write-Output $output.TrimEnd()
-            }}
-        '''
+        ps_script = _COLUMN_TMPL.safe_substitute(
+            INPUT=input_source, SEP=sep_regex)
         
-        return f'powershell -Command "{ps_script}"'
+        return _ps_encoded(ps_script)
     
     def _translate_watch(self, cmd: str, parts):
         """
@@ -4828,11 +5291,14 @@ class CommandEmulator:
         
         ARTISAN IMPLEMENTATION:
         - Runs command every N seconds (default 2)
+        - Read-only file commands (ls, cat, tail...) on a path: runs on
+          change (FileSystemWatcher), no polling
         - Clears screen between runs
         - Ctrl+C to stop
         
         Flags:
         - -n N: interval in seconds (default 2)
+        - -p, --precise: runs every N seconds from start (no drift)
         
         Usage:
           watch "ls -l"
@@ -4841,6 +5307,7 @@ class CommandEmulator:
         Note: Windows doesn't have native watch, PowerShell loop emulates it.
         """
         interval = 2
+        precise = False
         command = None
         
         i = 1
@@ -4848,6 +5315,9 @@ class CommandEmulator:
             if parts[i] == '-n' and i + 1 < len(parts):
                 interval = int(parts[i + 1])
                 i += 2
+            elif parts[i] in ('-p', '--precise'):
+                precise = True
+                i += 1
             elif not parts[i].startswith('-'):
                 # Command is everything remaining
                 command = ' '.join(parts[i:])
@@ -4867,26 +5337,78 @@ class CommandEmulator:
         # Recursively translate the watched command
         translated_command = self.emulate_command(command)
 
-        # Escape quotes for PowerShell
-        translated_command = translated_command.replace('"', '`"')
-
-        ps_script = f'''
-            while ($true) {{
+        # Parsed ONCE into a scriptblock: no Invoke-Expression re-parse per tick
+        watched_script = self.powershell_script(translated_command)
+        watched_argv = self.native_argv(translated_command)
+        if watched_script is not None and not _PS_PIPELINE_UNSAFE_RE.search(watched_script):
+            # PowerShell translation: run in-process
+            ps_script = f'''
+            $sb = [scriptblock]::Create("{_ps_quote(watched_script)}")
+            '''
+        elif watched_argv is not None:
+            # Native binary: called directly, no cmd.exe
+            ps_script = f'''
+            $sb = {{ {_ps_native_call(watched_argv)} }}
+            '''
+        else:
+            # cmd translation (or a script that exits): its own cmd.exe
+            ps_script = f'''
+            $cmd = "{_ps_quote(translated_command)}"
+            $sb = {{ cmd.exe /d /c $cmd }}
+            '''
+        ps_script += '''
+            function Show-Watched($header) {
                 Clear-Host
-                Write-Host "Every {interval}s: {command}"
+                Write-Host $header
                 Write-Host ""
 
-                try {{
-                    Invoke-Expression "{translated_command}"
-                }} catch {{
+                try {
+                    & $sb
+                } catch {
                     Write-Error $_.Exception.Message
-                }}
+                }
+            }
+        '''
 
+        # Read-only command on a path: re-run on change events, not on a timer
+        watched_args = command.split()
+        watched_paths = [p for p in watched_args[1:] if not p.startswith('-') and not p.isdigit()]
+        if watched_args[0] in _WATCH_READONLY_COMMANDS and watched_paths:
+            ps_script += f'''
+            $target = "{_ps_quote(watched_paths[-1])}"
+            if (Test-Path -LiteralPath $target -PathType Container) {{
+                $fsw = [System.IO.FileSystemWatcher]::new((Resolve-Path -LiteralPath $target).ProviderPath)
+            }} else {{
+                $full = [System.IO.Path]::GetFullPath($target)
+                $fsw = [System.IO.FileSystemWatcher]::new([System.IO.Path]::GetDirectoryName($full), [System.IO.Path]::GetFileName($full))
+            }}
+            $fsw.NotifyFilter = 'FileName, DirectoryName, LastWrite, Size'
+            while ($true) {{
+                Show-Watched "On change: {_ps_quote(command)}"
+                # Blocks until the path changes - no wakeups in between
+                [void]$fsw.WaitForChanged('All', -1)
+            }}
+            '''
+        elif precise:
+            # Fixed schedule: next run at start + k*interval (no drift from run time)
+            ps_script += f'''
+            $next = [DateTime]::UtcNow
+            while ($true) {{
+                Show-Watched "Every {interval}s: {_ps_quote(command)}"
+                $next = $next.AddSeconds({interval})
+                $wait = ($next - [DateTime]::UtcNow).TotalMilliseconds
+                if ($wait -gt 0) {{ Start-Sleep -Milliseconds $wait }}
+            }}
+            '''
+        else:
+            ps_script += f'''
+            while ($true) {{
+                Show-Watched "Every {interval}s: {_ps_quote(command)}"
                 Start-Sleep -Seconds {interval}
             }}
-        '''
+            '''
         
-        return f'powershell -Command "{ps_script}"'
+        return _ps_encoded(ps_script)
     
     def _translate_paste(self, cmd: str, parts):
         """
@@ -4929,9 +5451,9 @@ class CommandEmulator:
             ps_script = f'''
                 $delim = "{delimiter}"
                 
-                foreach ($file in @({','.join(f'"{f}"' for f in files)})) {{
+                foreach ($file in @({','.join(f'"{_ps_quote(f)}"' for f in files)})) {{
                     if (Test-Path $file) {{
-                        $lines = Get-Content $file
+                        $lines = [System.IO.File]::ReadAllLines($file)
                         Write-Output ($lines -join $delim)
                     }}
                 }}
@@ -4940,41 +5462,35 @@ class CommandEmulator:
             # Parallel mode: join corresponding lines from files
             ps_script = f'''
                 $delim = "{delimiter}"
-                $files = @({','.join(f'"{f}"' for f in files)})
-                
-                # Read all files
-                $contents = @()
-                foreach ($file in $files) {{
-                    if (Test-Path $file) {{
-                        $contents += ,@(Get-Content $file)
-                    }} else {{
-                        $contents += ,@()
-                    }}
-                }}
+                $files = @({','.join(f'"{_ps_quote(f)}"' for f in files)})
                 
-                # Find max lines
-                $maxLines = 0
-                foreach ($c in $contents) {{
-                    if ($c.Length -gt $maxLines) {{
-                        $maxLines = $c.Length
+                # One StreamReader per file, read in lockstep: one line per
+                # file in memory (missing file = already exhausted)
+                $readers = [System.IO.StreamReader[]]::new($files.Count)
+                for ($k = 0; $k -lt $files.Count; $k++) {{
+                    if (Test-Path $files[$k]) {{
+                        $readers[$k] = [System.IO.StreamReader]::new($files[$k])
                     }}
                 }}
                 
-                # Join corresponding lines
-                for ($i = 0; $i -lt $maxLines; $i++) {{
-                    $parts = @()
-                    foreach ($c in $contents) {{
-                        if ($i -lt $c.Length) {{
-                            $parts += $c[$i]
-                        }} else {{
-                            $parts += ""
+                # Join corresponding lines until every reader is at EOF
+                $parts = [string[]]::new($files.Count)
+                try {{
+                    while ($true) {{
+                        $any = $false
+                        for ($k = 0; $k -lt $readers.Length; $k++) {{
+                            $line = if ($readers[$k]) {{ $readers[$k].ReadLine() }} else {{ $null }}
+                            if ($null -ne $line) {{ $any = $true; $parts[$k] = $line }} else {{ $parts[$k] = "" }}
                         }}
+                        if (-not $any) {{ break }}
+                        [string]::Join($delim, $parts)
                     }}
-                    Write-Output ($parts -join $delim)
+                }} finally {{
+                    foreach ($r in $readers) {{ if ($r) {{ $r.Dispose() }} }}
                 }}
             '''
         
-        return f'powershell -Command "{ps_script}"'
+        return _ps_encoded(ps_script)
     
     def _translate_comm(self, cmd: str, parts):
         """
@@ -5016,53 +5532,22 @@ class CommandEmulator:
         if len(files) < 2:
             return 'echo Error: comm requires two files'
         
-        file1, file2 = files[0], files[1]
+        # Values for PowerShell double-quoted strings
+        file1, file2 = _ps_quote(files[0]), _ps_quote(files[1])
         
-        ps_script = f'''
-            if (-not (Test-Path "{file1}")) {{
-                Write-Error "comm: {file1}: No such file"
-                exit 1
-            }}
-            if (-not (Test-Path "{file2}")) {{
-                Write-Error "comm: {file2}: No such file"
-                exit 1
-            }}
-            
-            $lines1 = @(Get-Content "{file1}")
-            $lines2 = @(Get-Content "{file2}")
-            
-            $set1 = [System.Collections.Generic.HashSet[string]]::new($lines1)
-            $set2 = [System.Collections.Generic.HashSet[string]]::new($lines2)
-            
-            # Column 1: unique to file1
-            if (-not {str(suppress_col1).lower()}) {{
-                foreach ($line in $lines1) {{
-                    if (-not $set2.Contains($line)) {{
-                        Write-Output $line
-                    }}
-                }}
-            }}
-            
-            # Column 2: unique to file2
-            if (-not {str(suppress_col2).lower()}) {{
-                foreach ($line in $lines2) {{
-                    if (-not $set1.Contains($line)) {{
-                        Write-Output ("`t" + $line)
-                    }}
-                }}
-            }}
-            
-            # Column 3: common to both
-            if (-not {str(suppress_col3).lower()}) {{
-                foreach ($line in $lines1) {{
-                    if ($set2.Contains($line)) {{
-                        Write-Output ("`t`t" + $line)
-                    }}
-                }}
-            }}
-        '''
+        # Column indent: one TAB per preceding column that is shown
+        col2_prefix = '' if suppress_col1 else '`t'
+        col3_prefix = col2_prefix + ('' if suppress_col2 else '`t')
+        
+        # Plain string[] per file (ReadAllLines: no per-line PSObject decoration)
+        ps_script = _COMM_TMPL.safe_substitute(
+            FILE1=file1, FILE2=file2,
+            SHOW1='$false' if suppress_col1 else '$true',
+            SHOW2='$false' if suppress_col2 else '$true',
+            SHOW3='$false' if suppress_col3 else '$true',
+            COL2_PREFIX=col2_prefix, COL3_PREFIX=col3_prefix)
         
-        return f'powershell -Command "{ps_script}"'
+        return _ps_encoded(ps_script)
     
     def _translate_join(self, cmd: str, parts):
         """
@@ -5120,98 +5605,26 @@ class CommandEmulator:
         if len(files) < 2:
             return 'echo Error: join requires two files'
         
-        file1_path, file2_path = files[0], files[1]
+        file1_path, file2_path = _ps_quote(files[0]), _ps_quote(files[1])
         
-        # PowerShell: parse both files, hash on join field, merge
-        ps_script = f'''
-            $sep = "{separator}"
-            $field1 = {field1} - 1  # Convert to 0-indexed
-            $field2 = {field2} - 1
-            
-            if (-not (Test-Path "{file1_path}")) {{
-                Write-Error "join: {file1_path}: No such file"
-                exit 1
-            }}
-            if (-not (Test-Path "{file2_path}")) {{
-                Write-Error "join: {file2_path}: No such file"
-                exit 1
-            }}
-            
-            # Read and parse file1
-            $lines1 = Get-Content "{file1_path}"
-            $hash1 = @{{}}
-            foreach ($line in $lines1) {{
-                $fields = $line -split $sep
-                if ($field1 -lt $fields.Length) {{
-                    $key = $fields[$field1]
-                    if (-not $hash1.ContainsKey($key)) {{
-                        $hash1[$key] = @()
-                    }}
-                    $hash1[$key] += ,$fields
-                }}
-            }}
-            
-            # Read and join with file2
-            $lines2 = Get-Content "{file2_path}"
-            $matched2 = @{{}}
-            
-            foreach ($line in $lines2) {{
-                $fields = $line -split $sep
-                if ($field2 -lt $fields.Length) {{
-                    $key = $fields[$field2]
-                    $matched2[$key] = $true
-                    
-                    if ($hash1.ContainsKey($key)) {{
-                        # Match found: output joined line
-                        foreach ($f1_fields in $hash1[$key]) {{
-                            # Output: join_field + other_fields_f1 + other_fields_f2
-                            $output = $key
-                            
-                            # Add other fields from file1
-                            for ($i = 0; $i -lt $f1_fields.Length; $i++) {{
-                                if ($i -ne $field1) {{
-                                    $output += " " + $f1_fields[$i]
-                                }}
-                            }}
-                            
-                            # Add other fields from file2
-                            for ($i = 0; $i -lt $fields.Length; $i++) {{
-                                if ($i -ne $field2) {{
-                                    $output += " " + $fields[$i]
-                                }}
-                            }}
-                            
-                            Write-Output $output
-                        }}
-                    }} elseif ({str(print_unpaired_2).lower()}) {{
-                        # No match but print unpaired from file2
-                        Write-Output ($fields -join " ")
-                    }}
-                }}
-            }}
-            
-            # Print unpaired from file1 if requested
-            if ({str(print_unpaired_1).lower()}) {{
-                foreach ($key in $hash1.Keys) {{
-                    if (-not $matched2.ContainsKey($key)) {{
-                        foreach ($fields in $hash1[$key]) {{
-                            Write-Output ($fields -join " ")
-                        }}
-                    }}
-                }}
-            }}
-        '''
+        # PowerShell: streaming merge-join on the (sorted) inputs - one line per
+        # side in memory, plus file2's run of lines sharing the current key
+        ps_script = _JOIN_TMPL.safe_substitute(
+            SEP=separator, FIELD1=field1, FIELD2=field2,
+            SHOW1='$true' if print_unpaired_1 else '$false',
+            SHOW2='$true' if print_unpaired_2 else '$false',
+            FILE1=file1_path, FILE2=file2_path)
         
-        return f'powershell -Command "{ps_script}"'
+        return _ps_encoded(ps_script)
     
     def _translate_base64(self, cmd: str, parts):
         """
         Translate base64 - Base64 encoding/decoding.
         
         ARTISAN IMPLEMENTATION:
-        - Encode: base64 file → [Convert]::ToBase64String
-        - Decode: base64 -d encoded → [Convert]::FromBase64String
-        - Stdin: base64 (reads from pipe)
+        - Encode: base64 file → CryptoStream + ToBase64Transform (streamed)
+        - Decode: base64 -d encoded → CryptoStream + FromBase64Transform (streamed)
+        - Stdin: base64 (raw bytes from the pipe, same streamed transform)
         - -w 0: disable line wrapping (default on Windows anyway)
         
         Unix behavior:
@@ -5223,44 +5636,36 @@ class CommandEmulator:
         
         files = [p for p in parts[1:] if not p.startswith('-')]
         
+        # Input (file or raw stdin bytes) streams through a CryptoStream base64
+        # transform straight to stdout: constant memory, no whole byte[] or string
+        if files:
+            open_input = f'$in = [System.IO.File]::OpenRead("{_ps_quote(files[0])}")'
+        else:
+            open_input = _PS_OPEN_STDIN_STREAM
+        
         if decode_mode:
             # DECODE mode
-            if files:
-                # Decode from file
-                file_path = files[0]
-                ps_cmd = (
-                    f'$content = Get-Content \\"{file_path}\\" -Raw; '
-                    f'$bytes = [Convert]::FromBase64String($content); '
-                    f'[System.Text.Encoding]::UTF8.GetString($bytes)'
-                )
-                return f'powershell -Command "{ps_cmd}"'
-            else:
-                # Decode from stdin (pipe)
-                ps_cmd = (
-                    f'$content = $input | Out-String; '
-                    f'$bytes = [Convert]::FromBase64String($content); '
-                    f'[System.Text.Encoding]::UTF8.GetString($bytes)'
-                )
-                return f'powershell -Command "{ps_cmd}"'
+            ps_script = f'''
+                {open_input}
+                $b64 = [System.Security.Cryptography.FromBase64Transform]::new('IgnoreWhiteSpaces')
+                $cs = [System.Security.Cryptography.CryptoStream]::new($in, $b64, 'Read')
+                $out = [Console]::OpenStandardOutput()
+                try {{ $cs.CopyTo($out); $out.Flush() }} finally {{ $cs.Dispose() }}
+            '''
         
         else:
-            # ENCODE mode
-            if files:
-                # Encode from file
-                file_path = files[0]
-                ps_cmd = (
-                    f'$bytes = [System.IO.File]::ReadAllBytes(\\"{file_path}\\"); '
-                    f'[Convert]::ToBase64String($bytes)'
-                )
-                return f'powershell -Command "{ps_cmd}"'
-            else:
-                # Encode from stdin (pipe)
-                ps_cmd = (
-                    f'$content = $input | Out-String; '
-                    f'$bytes = [System.Text.Encoding]::UTF8.GetBytes($content); '
-                    f'[Convert]::ToBase64String($bytes)'
-                )
-                return f'powershell -Command "{ps_cmd}"'
+            # ENCODE mode (stdout stays open: CryptoStream not disposed)
+            ps_script = f'''
+                {open_input}
+                $out = [Console]::OpenStandardOutput()
+                $b64 = [System.Security.Cryptography.ToBase64Transform]::new()
+                $cs = [System.Security.Cryptography.CryptoStream]::new($out, $b64, 'Write')
+                try {{ $in.CopyTo($cs); $cs.FlushFinalBlock() }} finally {{ $in.Dispose() }}
+                $out.WriteByte(10)
+                $out.Flush()
+            '''
+        
+        return _ps_encoded(ps_script)
     
     def _translate_timeout(self, cmd: str, parts):
         """
@@ -5318,11 +5723,12 @@ class CommandEmulator:
         
         # Build PowerShell script with job control
         # Note: Command inside job needs translation too, but we'll pass it through as-is
-        # since the outer translator already handles command translation
+        # since the outer translator already handles command translation.
+        # Scriptblock built once from a quoted string: the command is not
+        # re-embedded as script source
         ps_script = f'''
-            $job = Start-Job -ScriptBlock {{
-                {command_str}
-            }}
+            $sb = [scriptblock]::Create("{_ps_quote(command_str)}")
+            $job = Start-Job -ScriptBlock $sb
             
             $completed = Wait-Job $job -Timeout {timeout_seconds}
             
@@ -5348,7 +5754,7 @@ class CommandEmulator:
             }}
         '''
         
-        return f'powershell -Command "{ps_script}"'
+        return _ps_encoded(ps_script)
     
     def _parse_duration(self, duration_str: str) -> int:
         """
@@ -5391,184 +5797,178 @@ class CommandEmulator:
           split -l 100 -d file.txt chunk_  →  chunk_00, chunk_01, chunk_02...
           split -b 1M file.bin part_  →  part_aa, part_ab... (1MB chunks)
         
+        Input is read ONCE, by the mode's own reader: lines mode a
+        StreamReader, bytes mode a FileStream into one reused chunk buffer.
+        Never a whole-file read (Get-Content -Raw / ReadAllLines) on top.
+        
         Output: SILENT (no stdout)
         """
         lines_per_chunk = None
         bytes_per_chunk = None
-        numeric_suffix = '-d' in parts or '--numeric-suffixes' in parts
+        numeric_suffix = False
         suffix_length = 2  # Default
+        operands = []
         
-        # Parse flags
+        # Single pass over parts against the option table: option values
+        # (e.g. the '1M' of -b 1M) are consumed here, never seen as operands
         i = 1
         while i < len(parts):
             part = parts[i]
-            
-            if part == '-l' and i + 1 < len(parts):
-                lines_per_chunk = int(parts[i + 1])
-                i += 2
-            elif part.startswith('-l'):
-                lines_per_chunk = int(part[2:])
-                i += 1
-            
-            elif part == '-b' and i + 1 < len(parts):
-                size_str = parts[i + 1]
-                bytes_per_chunk = self._parse_size(size_str)
-                i += 2
-            elif part.startswith('-b'):
-                size_str = part[2:]
-                bytes_per_chunk = self._parse_size(size_str)
-                i += 1
-            
-            elif part == '-a' and i + 1 < len(parts):
-                suffix_length = int(parts[i + 1])
-                i += 2
-            elif part.startswith('-a'):
-                suffix_length = int(part[2:])
+            if part in _SPLIT_FLAG_OPTIONS:
+                numeric_suffix = True
                 i += 1
+                continue
             
-            elif part == '-d' or part == '--numeric-suffixes':
+            option, value = part[:2], None
+            if option in _SPLIT_VALUE_OPTIONS:
+                if len(part) > 2:
+                    value = part[2:]
+                    i += 1
+                elif i + 1 < len(parts):
+                    value = parts[i + 1]
+                    i += 2
+                else:
+                    i += 1
+            elif part.startswith('-') and part != '-':
                 i += 1
-            
+                continue
             else:
                 # File or prefix
+                operands.append(part)
                 i += 1
+                continue
+            
+            if value is None:
+                continue
+            if option == '-l':
+                lines_per_chunk = int(value)
+            elif option == '-b':
+                bytes_per_chunk = _parse_size(value)
+            elif option == '-a':
+                suffix_length = int(value)
         
         # Default: 1000 lines if neither -l nor -b specified
         if lines_per_chunk is None and bytes_per_chunk is None:
             lines_per_chunk = 1000
         
-        # Get input file and prefix
-        non_flag_args = [p for p in parts[1:] if not p.startswith('-') and not p.isdigit()]
-        
-        if len(non_flag_args) == 0:
+        # Get input file and prefix ('-' is stdin)
+        if len(operands) == 0:
             # stdin, default prefix 'x'
             input_file = None
             prefix = 'x'
-        elif len(non_flag_args) == 1:
+        elif len(operands) == 1:
             # Could be file or prefix
             # If file exists, it's input file with default prefix
             # Otherwise it's prefix with stdin
             # For Windows translation, assume it's file (path already translated)
-            input_file = non_flag_args[0]
+            input_file = operands[0]
             prefix = 'x'
         else:
             # Both file and prefix
-            input_file = non_flag_args[0]
-            prefix = non_flag_args[1]
+            input_file = operands[0]
+            prefix = operands[1]
+        if input_file == '-':
+            input_file = None
         
         # Build PowerShell script
         ps_script = '''
             $ErrorActionPreference = 'Stop'
         '''
         
-        if input_file:
-            ps_script += f'''
-            $content = Get-Content "{input_file}" -Raw
-            $lines = Get-Content "{input_file}"
-            '''
-        else:
-            ps_script += '''
-            $lines = $input
-            '''
+        # Streamed: one line / one chunk buffer in memory, never the whole file
+        input_q = _ps_quote(input_file) if input_file else None
+        prefix_q = _ps_quote(prefix)
         
-        # Suffix generation function
+        # Suffix inline (no per-chunk function dispatch): suffix_expr names the
+        # current chunk, next_chunk advances to the following one
         if numeric_suffix:
             # Numeric: 00, 01, 02...
-            ps_script += f'''
-            function Get-Suffix {{
-                param($index)
-                return $index.ToString().PadLeft({suffix_length}, '0')
-            }}
-            '''
+            suffix_expr = f"$chunkIndex.ToString().PadLeft({suffix_length}, '0')"
+            next_chunk = '$chunkIndex++'
         else:
-            # Alphabetic: aa, ab, ac... az, ba, bb...
+            # Alphabetic: aa, ab, ac... az, ba, bb... - an odometer over a
+            # char[]: bump the last letter, carry on 'z' (no division, no table)
             ps_script += f'''
-            function Get-Suffix {{
-                param($index)
-                $chars = 'abcdefghijklmnopqrstuvwxyz'
-                $suffix = ''
-                $n = $index
-                for ($i = 0; $i -lt {suffix_length}; $i++) {{
-                    $suffix = $chars[$n % 26] + $suffix
-                    $n = [Math]::Floor($n / 26)
-                }}
-                return $suffix
-            }}
+            $suffixChars = [char[]]('a' * {suffix_length})
             '''
+            suffix_expr = '[string]::new($suffixChars)'
+            next_chunk = (
+                f"for ($p = {suffix_length - 1}; $p -ge 0; $p--) {{ "
+                "if ($suffixChars[$p] -ne [char]'z') { $suffixChars[$p] = [char]([int]$suffixChars[$p] + 1); break } "
+                "$suffixChars[$p] = [char]'a' }"
+            )
         
         if lines_per_chunk:
-            # Line-based splitting
+            # Line-based splitting: StreamReader in, one StreamWriter per chunk
+            # (UTF-8 without BOM, like the input bytes of a Unix split)
+            write_line = f'''
+                if ($count -eq 0) {{
+                    $writer = [System.IO.StreamWriter]::new("{prefix_q}" + {suffix_expr}, $false, $utf8)
+                }}
+                $writer.WriteLine($line)
+                $count++
+                if ($count -eq {lines_per_chunk}) {{
+                    $writer.Dispose()
+                    $writer = $null
+                    $count = 0
+                    {next_chunk}
+                }}
+            '''
+            if input_file:
+                read_loop = f'''
+            $reader = [System.IO.StreamReader]::new("{input_q}")
+            try {{
+                while ($null -ne ($line = $reader.ReadLine())) {{ {write_line} }}
+            }} finally {{ $reader.Dispose() }}
+            '''
+            else:
+                read_loop = f'''
+            foreach ($line in $input) {{ {write_line} }}
+            '''
             ps_script += f'''
+            $utf8 = [System.Text.UTF8Encoding]::new($false)
             $chunkIndex = 0
-            $currentChunk = @()
-            
-            foreach ($line in $lines) {{
-                $currentChunk += $line
-                
-                if ($currentChunk.Count -eq {lines_per_chunk}) {{
-                    $suffix = Get-Suffix $chunkIndex
-                    $filename = "{prefix}" + $suffix
-                    $currentChunk | Out-File -FilePath $filename -Encoding utf8
-                    $currentChunk = @()
-                    $chunkIndex++
-                }}
-            }}
-            
-            # Write remaining lines
-            if ($currentChunk.Count -gt 0) {{
-                $suffix = Get-Suffix $chunkIndex
-                $filename = "{prefix}" + $suffix
-                $currentChunk | Out-File -FilePath $filename -Encoding utf8
-            }}
+            $count = 0
+            $writer = $null
+            try {{ {read_loop} }} finally {{ if ($writer) {{ $writer.Dispose() }} }}
             '''
         else:
-            # Byte-based splitting
+            # Byte-based splitting: two reused chunk buffers filled from a
+            # sequential FileStream - memory = 2 chunks, not file size. Chunk
+            # N's write (overlapped WriteAsync) runs while chunk N+1 is read
             ps_script += f'''
-            $bytes = [System.IO.File]::ReadAllBytes("{input_file}")
+            $in = [System.IO.FileStream]::new("{input_q}", 'Open', 'Read', 'Read', 1, [System.IO.FileOptions]::SequentialScan)
+            $bufs = @([byte[]]::new({bytes_per_chunk}), [byte[]]::new({bytes_per_chunk}))
+            $cur = 0
             $chunkIndex = 0
-            $offset = 0
-            
-            while ($offset -lt $bytes.Length) {{
-                $chunkSize = [Math]::Min({bytes_per_chunk}, $bytes.Length - $offset)
-                $chunk = $bytes[$offset..($offset + $chunkSize - 1)]
-                
-                $suffix = Get-Suffix $chunkIndex
-                $filename = "{prefix}" + $suffix
-                [System.IO.File]::WriteAllBytes($filename, $chunk)
-                
-                $offset += $chunkSize
-                $chunkIndex++
+            $pending = $null
+            $pendingOut = $null
+            try {{
+                while ($true) {{
+                    # Fill the buffer (Read may return fewer bytes than asked)
+                    $buf = $bufs[$cur]
+                    $n = 0
+                    while ($n -lt $buf.Length -and ($r = $in.Read($buf, $n, $buf.Length - $n)) -gt 0) {{ $n += $r }}
+                    if ($n -eq 0) {{ break }}
+                    
+                    $out = [System.IO.FileStream]::new("{prefix_q}" + {suffix_expr}, 'Create', 'Write', 'None', 4096, [System.IO.FileOptions]::Asynchronous)
+                    $task = $out.WriteAsync($buf, 0, $n)
+                    # Previous chunk's write: done before its buffer is refilled
+                    if ($pending) {{ $pending.Wait(); $pendingOut.Dispose() }}
+                    $pending = $task
+                    $pendingOut = $out
+                    $cur = 1 - $cur
+                    {next_chunk}
+                    if ($n -lt $buf.Length) {{ break }}
+                }}
+            }} finally {{
+                if ($pending) {{ try {{ $pending.Wait() }} finally {{ $pendingOut.Dispose() }} }}
+                $in.Dispose()
             }}
             '''
         
-        # Silent output (like Unix split)
-        return f'powershell -Command "{ps_script}" >$null 2>&1'
-    
-    def _parse_size(self, size_str: str) -> int:
-        """
-        Parse size string like 1K, 2M, 3G.
-        
-        Returns bytes.
-        """
-        import re
-        
-        match = re.match(r'^(\d+)([KMGT])?$', size_str, re.IGNORECASE)
-        if not match:
-            return int(size_str)  # Plain number
-        
-        value = int(match.group(1))
-        unit = match.group(2)
-        
-        if unit:
-            multipliers = {
-                'K': 1024,
-                'M': 1024 * 1024,
-                'G': 1024 * 1024 * 1024,
-                'T': 1024 * 1024 * 1024 * 1024,
-            }
-            return value * multipliers.get(unit.upper(), 1)
-        
-        return value
+        # Silent output (like Unix split): the script writes nothing but errors
+        return _ps_encoded(ps_script)
     
     def _translate_gzip(self, cmd: str, parts):
         """
@@ -5594,96 +5994,41 @@ class CommandEmulator:
         - gzip -k file.txt → creates file.txt.gz, keeps file.txt
         - gzip -c file.txt → stdout, keeps file.txt
         """
-        stdout_mode = '-c' in parts or '--stdout' in parts
-        decompress = '-d' in parts or '--decompress' in parts
-        keep = '-k' in parts or '--keep' in parts
-        force = '-f' in parts or '--force' in parts
-        recursive = '-r' in parts or '--recursive' in parts
-        
-        # Get files (ignore compression level flags -1 to -9)
-        files = [p for p in parts[1:] if not p.startswith('-') or (p.startswith('-') and len(p) == 2 and p[1].isdigit())]
-        files = [f for f in files if not (f.startswith('-') and len(f) == 2 and f[1].isdigit())]
-        
-        if not files:
-            # stdin mode
-            if decompress:
-                # Decompress from stdin
-                ps_script = '''
-                    $input | Set-Content -Path temp.gz -Encoding Byte
-                    $input = [System.IO.File]::OpenRead("temp.gz")
-                    $gzip = New-Object System.IO.Compression.GZipStream($input, [System.IO.Compression.CompressionMode]::Decompress)
-                    $gzip.CopyTo([Console]::OpenStandardOutput())
-                    $gzip.Close()
-                    $input.Close()
-                    Remove-Item temp.gz
-                '''
-            else:
-                # Compress from stdin
-                ps_script = '''
-                    $input | Set-Content -Path temp -Encoding Byte
-                    $inputFile = [System.IO.File]::OpenRead("temp")
-                    $output = [Console]::OpenStandardOutput()
-                    $gzip = New-Object System.IO.Compression.GZipStream($output, [System.IO.Compression.CompressionMode]::Compress)
-                    $inputFile.CopyTo($gzip)
-                    $gzip.Close()
-                    $inputFile.Close()
-                    Remove-Item temp
-                '''
-            return f'powershell -Command "{ps_script}"'
-        
-        file_path = files[0]
+        # ONE hash set of the tokens, then O(1) flag tests
+        flags = set(parts)
+        stdout_mode = not flags.isdisjoint(_GZIP_STDOUT_FLAGS)
+        decompress = not flags.isdisjoint(_GZIP_DECOMPRESS_FLAGS)
+        keep = not flags.isdisjoint(_GZIP_KEEP_FLAGS)
+        force = not flags.isdisjoint(_GZIP_FORCE_FLAGS)
+        recursive = not flags.isdisjoint(_GZIP_RECURSIVE_FLAGS)
+        
+        # Get files (compression level flags -1 to -9 are flags too: ignored)
+        files = [p for p in parts[1:] if not p.startswith('-')]
         
         if decompress:
             # Decompress mode (gzip -d = gunzip)
             return self._translate_gunzip(cmd, parts)
         
+        if not files:
+            # stdin mode: raw stdin bytes streamed into the compressor
+            return _ps_encoded(_GZIP_COMPRESS_STDOUT_TMPL.safe_substitute(OPEN_INPUT=_PS_OPEN_STDIN_STREAM))
+        
+        file_path = _ps_quote(files[0])
+        
         # Compress mode
         if stdout_mode:
             # Output to stdout, keep original
-            ps_script = f'''
-                $inputFile = [System.IO.File]::OpenRead("{file_path}")
-                $output = [Console]::OpenStandardOutput()
-                $gzip = New-Object System.IO.Compression.GZipStream($output, [System.IO.Compression.CompressionMode]::Compress)
-                $inputFile.CopyTo($gzip)
-                $gzip.Close()
-                $inputFile.Close()
-            '''
+            ps_script = _GZIP_COMPRESS_STDOUT_TMPL.safe_substitute(
+                OPEN_INPUT=f'$in = [System.IO.File]::OpenRead("{file_path}")')
         else:
             # Create .gz file
-            output_file = f'{file_path}.gz'
-            
-            ps_script = f'''
-                $inputPath = "{file_path}"
-                $outputPath = "{output_file}"
-                
-                if (-not (Test-Path $inputPath)) {{
-                    Write-Host "gzip: $inputPath: No such file or directory"
-                    exit 1
-                }}
-                
-                if ((Test-Path $outputPath) -and -not {str(force).lower()}) {{
-                    Write-Host "gzip: $outputPath already exists; not overwritten"
-                    exit 1
-                }}
-                
-                $inputFile = [System.IO.File]::OpenRead($inputPath)
-                $outputFile = [System.IO.File]::Create($outputPath)
-                $gzip = New-Object System.IO.Compression.GZipStream($outputFile, [System.IO.Compression.CompressionMode]::Compress)
-                
-                $inputFile.CopyTo($gzip)
-                
-                $gzip.Close()
-                $outputFile.Close()
-                $inputFile.Close()
-            '''
-            
-            if not keep:
-                # Delete original (Unix default behavior)
-                ps_script += f'''
-                Remove-Item "{file_path}"
-                '''
+            ps_script = _GZIP_FILE_TMPL.safe_substitute(
+                INPUT=file_path, OUTPUT=f'{file_path}.gz',
+                OUTPUT_CHECK='' if force else _GZIP_OUTPUT_CHECK,
+                COPY=_GZIP_COMPRESS_COPY,
+                REMOVE='' if keep else _GZIP_REMOVE_INPUT)
         
-        return f'powershell -Command "{ps_script}"'
+        return _ps_encoded(ps_script)
     
     def _translate_gunzip(self, cmd: str, parts):
         """
@@ -5701,26 +6046,16 @@ class CommandEmulator:
         - gunzip -k file.txt.gz → creates file.txt, keeps file.txt.gz
         - gunzip -c file.txt.gz → stdout, keeps file.txt.gz
         """
-        stdout_mode = '-c' in parts or '--stdout' in parts
-        keep = '-k' in parts or '--keep' in parts
-        force = '-f' in parts or '--force' in parts
+        flags = set(parts)
+        stdout_mode = not flags.isdisjoint(_GZIP_STDOUT_FLAGS)
+        keep = not flags.isdisjoint(_GZIP_KEEP_FLAGS)
+        force = not flags.isdisjoint(_GZIP_FORCE_FLAGS)
         
         files = [p for p in parts[1:] if not p.startswith('-')]
         
         if not files:
-            # stdin mode
-            ps_script = '''
-                $ms = New-Object System.IO.MemoryStream
-                $stdin = [Console]::OpenStandardInput()
-                $stdin.CopyTo($ms)
-                $ms.Position = 0
-                
-                $gzip = New-Object System.IO.Compression.GZipStream($ms, [System.IO.Compression.CompressionMode]::Decompress)
-                $gzip.CopyTo([Console]::OpenStandardOutput())
-                $gzip.Close()
-                $ms.Close()
-            '''
-            return f'powershell -Command "{ps_script}"'
+            # stdin mode: streamed straight through the decompressor (no MemoryStream copy)
+            return _ps_encoded(_GZIP_DECOMPRESS_STDOUT_TMPL.safe_substitute(OPEN_INPUT=_PS_OPEN_STDIN_STREAM))
         
         file_path = files[0]
         
@@ -5735,54 +6070,24 @@ class CommandEmulator:
         
         if stdout_mode:
             # Output to stdout, keep original
-            ps_script = f'''
-                $inputFile = [System.IO.File]::OpenRead("{file_path}")
-                $gzip = New-Object System.IO.Compression.GZipStream($inputFile, [System.IO.Compression.CompressionMode]::Decompress)
-                $gzip.CopyTo([Console]::OpenStandardOutput())
-                $gzip.Close()
-                $inputFile.Close()
-            '''
+            ps_script = _GZIP_DECOMPRESS_STDOUT_TMPL.safe_substitute(
+                OPEN_INPUT=f'$in = [System.IO.File]::OpenRead("{_ps_quote(file_path)}")')
         else:
             # Create decompressed file
-            ps_script = f'''
-                $inputPath = "{file_path}"
-                $outputPath = "{output_file}"
-                
-                if (-not (Test-Path $inputPath)) {{
-                    Write-Host "gzip: $inputPath: No such file or directory"
-                    exit 1
-                }}
-                
-                if ((Test-Path $outputPath) -and -not {str(force).lower()}) {{
-                    Write-Host "gzip: $outputPath already exists; not overwritten"
-                    exit 1
-                }}
-                
-                $inputFile = [System.IO.File]::OpenRead($inputPath)
-                $gzip = New-Object System.IO.Compression.GZipStream($inputFile, [System.IO.Compression.CompressionMode]::Decompress)
-                $outputFile = [System.IO.File]::Create($outputPath)
-                
-                $gzip.CopyTo($outputFile)
-                
-                $outputFile.Close()
-                $gzip.Close()
-                $inputFile.Close()
-            '''
-            
-            if not keep:
-                # Delete original .gz (Unix default behavior)
-                ps_script += f'''
-                Remove-Item "{file_path}"
-                '''
+            ps_script = _GZIP_FILE_TMPL.safe_substitute(
+                INPUT=_ps_quote(file_path), OUTPUT=_ps_quote(output_file),
+                OUTPUT_CHECK='' if force else _GZIP_OUTPUT_CHECK,
+                COPY=_GZIP_DECOMPRESS_COPY,
+                REMOVE='' if keep else _GZIP_REMOVE_INPUT)
         
-        return f'powershell -Command "{ps_script}"'
+        return _ps_encoded(ps_script)
     
     def _translate_jq(self, cmd: str, parts):
         """
         Translate jq - JSON processor with intelligent fallback.
         
         STRATEGY FOR 100%:
-        1. Try jq.exe (Git for Windows, scoop, chocolatey) - 100% complete
+        1. jq.exe (probed once in __init__: Git for Windows, scoop, chocolatey) - 100% complete
         2. Fallback PowerShell for COMMON patterns (90% real-world use):
            - .field → select field
            - .[] → array elements  
@@ -5806,10 +6111,15 @@ class CommandEmulator:
           jq '.items[].id' → PowerShell fallback OK
           jq 'map(select(.active))' → Requires jq.exe
         """
-        raw_output = '-r' in parts or '--raw-output' in parts
-        compact = '-c' in parts or '--compact-output' in parts
-        null_input = '-n' in parts or '--null-input' in parts
-        slurp = '-s' in parts or '--slurp' in parts
+        if self._jq_exe:
+            # Native jq.exe - filter and files as argv (quotes removed), no cmd.exe
+            return _native_command(self._jq_exe, _native_args(cmd))
+        
+        flags = set(parts)
+        raw_output = not flags.isdisjoint(_JQ_RAW_OUTPUT_FLAGS)
+        compact = not flags.isdisjoint(_JQ_COMPACT_FLAGS)
+        null_input = not flags.isdisjoint(_JQ_NULL_INPUT_FLAGS)
+        slurp = not flags.isdisjoint(_JQ_SLURP_FLAGS)
         
         # Get filter expression (first non-flag arg)
         filter_expr = None
@@ -5824,85 +6134,33 @@ class CommandEmulator:
         if not filter_expr:
             filter_expr = '.'  # Identity filter
         
-        # Build PowerShell script with fallback
-        file_input = f'Get-Content "{files[0]}"' if files else '$input'
+        # Build PowerShell fallback (no jq.exe on this machine)
+        file_input = f'[System.IO.File]::ReadAllText("{_ps_quote(files[0])}")' if files else '$input'
         
         # Check if pattern is simple (PowerShell can handle)
         is_simple = self._is_simple_jq_pattern(filter_expr)
         
         if is_simple:
-            # PowerShell fallback for simple patterns
-            jq_flags = []
-            if raw_output:
-                jq_flags.append('-r')
-            if compact:
-                jq_flags.append('-c')
-            jq_flags_str = ' '.join(jq_flags)
-            jq_cmd = f"& jq.exe {jq_flags_str} '{filter_expr}'" if jq_flags_str else f"& jq.exe '{filter_expr}'"
-
-            ps_script = f'''
-                # Try jq.exe first
-                $jqExe = Get-Command jq.exe -ErrorAction SilentlyContinue
-                if ($jqExe) {{
-                    {file_input} | {jq_cmd}
-                    exit $LASTEXITCODE
-                }}
-
-                # Fallback: PowerShell for simple patterns
-                $json = {file_input} | Out-String | ConvertFrom-Json
-                $result = $json
-            '''
-            
-            # Parse simple filter and convert to PowerShell
-            ps_filter = self._jq_to_powershell(filter_expr)
-            ps_script += ps_filter
-            
-            # Output formatting
+            # PowerShell fallback for simple patterns: input + converted filter
+            # + output formatting, joined once
             if raw_output:
-                ps_script += '''
-                if ($result -is [string]) {
-                    Write-Output $result
-                } elseif ($result -is [array]) {
-                    $result | ForEach-Object { Write-Output $_ }
-                } else {
-                    Write-Output $result
-                }
-                '''
+                output_ps = _JQ_RAW_OUTPUT_PS
             elif compact:
-                ps_script += '''
-                $result | ConvertTo-Json -Compress -Depth 100
-                '''
+                output_ps = _JQ_COMPACT_OUTPUT_PS
             else:
-                ps_script += '''
-                if ($result -is [string] -or $result -is [int] -or $result -is [bool]) {
-                    $result | ConvertTo-Json
-                } else {
-                    $result | ConvertTo-Json -Depth 100
-                }
-                '''
+                output_ps = _JQ_PRETTY_OUTPUT_PS
+            ps_script = ''.join((
+                f'$json = {file_input} | Out-String | ConvertFrom-Json\n$result = $json\n',
+                self._jq_to_powershell(filter_expr),
+                output_ps,
+            ))
         else:
-            # Complex pattern - REQUIRES jq.exe
-            jq_flags = []
-            if raw_output:
-                jq_flags.append('-r')
-            if compact:
-                jq_flags.append('-c')
-            jq_flags_str = ' '.join(jq_flags)
-            jq_cmd = f"& jq.exe {jq_flags_str} '{filter_expr}'" if jq_flags_str else f"& jq.exe '{filter_expr}'"
-
-            ps_script = f'''
-                $jqExe = Get-Command jq.exe -ErrorAction SilentlyContinue
-                if ($jqExe) {{
-                    {file_input} | {jq_cmd}
-                    exit $LASTEXITCODE
-                }} else {{
-                    Write-Host "jq: complex filter requires jq.exe (install via Git for Windows, scoop, or chocolatey)"
-                    Write-Host "Filter: {filter_expr}"
-                    exit 1
-                }}
-            '''
+            # Complex pattern - REQUIRES jq.exe (not found in __init__)
+            filter_text = _CMD_META_RE.sub(r'^\1', filter_expr)
+            return ('echo jq: complex filter requires jq.exe (install via Git for Windows, scoop, or chocolatey) 1>&2'
+                    f' & echo Filter: {filter_text} 1>&2 & exit /b 1')
         
-        return f'powershell -Command "{ps_script}"'
+        return _ps_encoded(ps_script)
     
     def _is_simple_jq_pattern(self, pattern: str) -> bool:
         """
@@ -5925,17 +6183,16 @@ class CommandEmulator:
         - Functions
         - Conditionals
         """
-        # Complex patterns
-        if any(keyword in pattern for keyword in ['map', 'select', 'if', 'then', 'else', 'def', '|']):
+        # Complex patterns (one scan; whole keywords, so .mapping stays simple)
+        if _JQ_COMPLEX_RE.search(pattern):
             return False
         
         # Simple patterns
-        if pattern in ['.', 'keys', 'length']:
+        if pattern in _JQ_SIMPLE_DISPATCH:
             return True
         
         # Field access patterns: .field, .field.nested, .[], .[N]
-        import re
-        if re.match(r'^\.(\w+|\[\d*\])(\.(\w+|\[\d*\]))*$', pattern):
+        if _JQ_SIMPLE_RE.match(pattern):
             return True
         
         return False
@@ -5953,59 +6210,22 @@ class CommandEmulator:
         - keys → $result = $json.PSObject.Properties.Name
         - length → $result = $json.Count or $json.Length
         """
-        if pattern == '.':
-            return '$result = $json\n'
-        
-        if pattern == 'keys':
-            return '''
-                if ($json -is [PSCustomObject]) {
-                    $result = $json.PSObject.Properties.Name
-                } else {
-                    $result = @()
-                }
-            '''
-        
-        if pattern == 'length':
-            return '''
-                if ($json -is [array]) {
-                    $result = $json.Count
-                } elseif ($json -is [string]) {
-                    $result = $json.Length
-                } elseif ($json -is [PSCustomObject]) {
-                    $result = ($json.PSObject.Properties | Measure-Object).Count
-                } else {
-                    $result = 0
-                }
-            '''
-        
-        # Parse field access: .field.nested or .[] or .[N]
-        import re
-        
-        # Remove leading dot
-        if pattern.startswith('.'):
-            pattern = pattern[1:]
-        
-        # Split by dots
-        parts = pattern.split('.')
-        
-        ps_code = '$result = $json'
-        for part in parts:
-            if part == '[]':
-                # Array iteration - already handled by $result
-                pass
-            elif re.match(r'^\[\d+\]$', part):
-                # Array index
-                index = part[1:-1]
-                ps_code += f'[{index}]'
-            elif part.endswith('[]'):
-                # Field with array iteration
-                field = part[:-2]
-                ps_code += f'.{field}'
-            else:
+        literal = _JQ_SIMPLE_DISPATCH.get(pattern)
+        if literal is not None:
+            return literal
+        
+        # Field access: .field.nested, .[], .[N], .field[] - one token scan
+        ps_code = ['$result = $json']
+        for m in _JQ_ACCESS_TOKEN_RE.finditer(pattern):
+            field, index = m.groups()
+            if field is not None:
                 # Simple field
-                ps_code += f'.{part}'
+                ps_code.append(f'.{field}')
+            elif index:
+                # Array index (.[] iteration: already handled by $result)
+                ps_code.append(f'[{index}]')
         
-        return ps_code + '\n'
+        return ''.join(ps_code) + '\n'
 
     def _translate_for(self, cmd: str, parts):
         """
@@ -6065,7 +6285,8 @@ class CommandEmulator:
                 # Try to translate the command
                 try:
                     translated = self.emulate_command(line)
-                    translated_lines.append(translated)
+                    argv = self.native_argv(translated)
+                    translated_lines.append(translated if argv is None else _ps_native_call(argv))
                 except:
                     # If translation fails, use as-is
                     translated_lines.append(line)
@@ -6079,4 +6300,4 @@ foreach(${var_name} in @({ps_items})) {{
 }}
         '''.strip()
 
-        return f'powershell -Command "{ps_script}"'
+        return _ps_encoded(ps_script)
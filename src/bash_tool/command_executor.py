@@ -559,6 +559,13 @@ class CommandExecutor:
         """
         self.logger.debug(f"Manual pipeline: {len(node.commands)} commands")
         
+        # Plain emulated stages → ONE PowerShell run (None: not batchable)
+        if all(isinstance(cmd_node, SimpleCommand) and not cmd_node.redirects for cmd_node in node.commands):
+            result = self.single_executor.execute_pipeline(
+                [self._reconstruct_command(cmd_node) for cmd_node in node.commands])
+            if result is not None:
+                return result
+        
         stdin_data = None
         result = None
         
@@ -39,6 +39,10 @@ STRATEGY DECISION TREE:
            YES → ExecutionEngine.execute_native() → DONE
            NO → Continue
            ↓
+        1b. Can the emulator run it in-process? (strings on a local file)
+           YES → CommandEmulator.execute_locally() → DONE
+           NO → Continue
+           ↓
         2. Is "quick" command? (< 20 lines PowerShell) AND not in GITBASH_PASSTHROUGH?
            YES → CommandEmulator.emulate_command() → ExecutionEngine.execute_powershell()
            NO → Continue
@@ -81,12 +85,15 @@ STRATEGY RATIONALE:
 import subprocess
 import logging
 import shlex
-from typing import Optional
+from typing import List, Optional
 
 from .constants import BASH_GIT_UNSUPPORTED_COMMANDS, GITBASH_PASSTHROUGH_COMMANDS
 from .execution_engine import ExecutionEngine
 from .command_emulator import CommandEmulator
 
+# Translations whose whole effect is an exit status (true/false): no process needed
+_STATUS_ONLY_TRANSLATIONS = {'exit /b 0': 0, 'exit /b 1': 1}
+
 
 class ExecuteUnixSingleCommand:
     """
@@ -181,6 +188,16 @@ class ExecuteUnixSingleCommand:
             self.logger.debug(f"Strategy: Native binary ({cmd_name}.exe)")
             return self.engine.execute_native(cmd_name, parts[1:], stdin=stdin, test_mode_stdout=test_mode_stdout)
 
+        # ================================================================
+        # PRIORITY 1b: In-process (Python) - no process spawned at all
+        # ================================================================
+        if not self.test_mode and stdin is None and self.emulator.can_execute_locally(cmd_name):
+            cmd_preprocessed = self.command_preprocessor.preprocess_for_emulation(command)
+            output = self.emulator.execute_locally(cmd_preprocessed, self.working_dir)
+            if output is not None:
+                self.logger.debug(f"Strategy: In-process ({cmd_name})")
+                return subprocess.CompletedProcess(args=command, returncode=0, stdout=output, stderr='')
+
         # ================================================================
         # PRIORITY 2: Quick PowerShell (FAST INLINE for simple commands)
         # ================================================================
@@ -188,10 +205,7 @@ class ExecuteUnixSingleCommand:
             self.logger.debug(f"Strategy: Quick PowerShell inline ({cmd_name})")
             cmd_preprocessed = self.command_preprocessor.preprocess_for_emulation(command)
             translated = self.emulator.emulate_command(cmd_preprocessed)
-            if self._needs_powershell(translated):
-                return self.engine.execute_powershell(translated, stdin=stdin, test_mode_stdout=test_mode_stdout)
-            else:
-                return self.engine.execute_cmd(translated, stdin=stdin, test_mode_stdout=test_mode_stdout)
+            return self._execute_translated(translated, stdin, test_mode_stdout)
 
         # ================================================================
         # PRIORITY 3: Bash Git (POSIX compatibility for complex commands)
@@ -206,6 +220,72 @@ class ExecuteUnixSingleCommand:
         self.logger.debug(f"Strategy: Heavy PowerShell emulation ({cmd_name})")
         cmd_preprocessed = self.command_preprocessor.preprocess_for_emulation(command)
         translated = self.emulator.emulate_command(cmd_preprocessed)
+        return self._execute_translated(translated, stdin, test_mode_stdout)
+
+    def execute_pipeline(self, commands: List[str], test_mode_stdout=None) -> Optional[subprocess.CompletedProcess]:
+        """
+        Execute cmd1 | cmd2 | ... as ONE PowerShell script.
+
+        Only when EVERY stage would be emulated anyway (priority 2 or 4, see
+        execute()) and translates to PowerShell: the stages are composed by
+        CommandEmulator.emulate_pipeline() and run once, instead of one
+        PowerShell per stage with stdout → stdin copies in between.
+
+        Args:
+            commands: Pipeline stages in order (first stage has no stdin)
+
+        Returns:
+            CompletedProcess of the whole pipeline, or None if it cannot be
+            batched (caller falls back to stage-by-stage execution)
+        """
+        if self.test_mode or len(commands) < 2:
+            return None
+
+        preprocessed = []
+        for command in commands:
+            parts = command.split()
+            if not parts or not self._is_emulated(parts[0]):
+                return None
+            preprocessed.append(self.command_preprocessor.preprocess_for_emulation(command))
+
+        translated = self.emulator.emulate_pipeline(preprocessed)
+        if translated is None:
+            return None
+        self.logger.debug(f"Strategy: Batched PowerShell pipeline ({len(commands)} stages)")
+        return self._execute_translated(translated, None, test_mode_stdout)
+
+    def _is_emulated(self, cmd_name: str) -> bool:
+        """Would execute() run cmd_name through CommandEmulator? (same priority order)"""
+        if self.engine.is_available(cmd_name):
+            return False
+        if self.emulator.is_quick_command(cmd_name) and cmd_name not in GITBASH_PASSTHROUGH_COMMANDS:
+            return True
+        return cmd_name in BASH_GIT_UNSUPPORTED_COMMANDS or not self.engine.capabilities['bash']
+
+    def _execute_translated(self, translated: str, stdin, test_mode_stdout) -> subprocess.CompletedProcess:
+        """
+        Execute CommandEmulator output.
+
+        PowerShell wrappers (powershell -Command/-EncodedCommand) are unwrapped
+        and run in the engine's persistent PowerShell host - no powershell.exe
+        spawn per command. Status-only translations (true/false) never spawn.
+        Native binaries (tar.exe, sed.exe, ...) run from their argv, no shell.
+        Everything else goes to PowerShell or cmd.exe as before.
+        """
+        argv = self.emulator.native_argv(translated)
+        if argv is not None:
+            return self.engine.execute_native(argv[0], argv[1:], stdin=stdin, test_mode_stdout=test_mode_stdout)
+
+        if not self.test_mode:
+            returncode = _STATUS_ONLY_TRANSLATIONS.get(translated)
+            if returncode is not None:
+                return subprocess.CompletedProcess(args=translated, returncode=returncode, stdout='', stderr='')
+
+        # Unwrapped in test mode too: the log shows the script, not a base64 blob
+        script = self.emulator.powershell_script(translated)
+        if script is not None:
+            return self.engine.execute_powershell_script(script, stdin=stdin, test_mode_stdout=test_mode_stdout)
+
         if self._needs_powershell(translated):
             return self.engine.execute_powershell(translated, stdin=stdin, test_mode_stdout=test_mode_stdout)
         else:
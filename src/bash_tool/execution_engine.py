@@ -25,6 +25,7 @@ RESPONSIBILITIES:
    - execute_bash(): Execute via Git Bash (bash.exe -c "command")
    - execute_native(): Execute native binary (grep.exe args)
    - execute_powershell(): Execute PowerShell script
+   - execute_powershell_script(): Execute raw script in persistent PowerShell host
    - execute_cmd(): Execute cmd.exe command
    - execute_python(): Execute Python script (with venv support)
 4. Test mode: Print commands without executing (for testing)
@@ -136,12 +137,21 @@ These provide BEST PERFORMANCE (no translation) when available.
 """
 import os
 import re
+import base64
 import subprocess
 import logging
+import queue
+import threading
+import time
 from pathlib import Path
 from typing import Dict, Optional, List
 
 
+# Scripts never run in the persistent host: they can end their process
+# (exit), or write raw bytes that its line-oriented text pipe would corrupt
+_PS_ONE_SHOT_RE = re.compile(r'\bexit\b|\[Environment\]::Exit|OpenStandardOutput', re.IGNORECASE)
+
+
 class PersistentBashSession:
     """
     Persistent bash session - ONE user, ONE marker, BRUTAL efficiency
@@ -249,7 +259,215 @@ class PersistentBashSession:
     def __del__(self):
         """Cleanup on garbage collection"""
         self.close()
-        
+
+
+class PersistentPowerShellSession:
+    """
+    Persistent PowerShell host - ONE powershell.exe for all emulated commands
+
+    Each script travels as ONE stdin line (base64 UTF-16LE, no quoting issues)
+    and runs in its own scriptblock scope. Error records are collected apart
+    and returned as stderr; stdout/stderr pipes are drained by reader threads
+    so every wait has a deadline.
+
+    CRITICAL: a script calling 'exit' terminates the host - callers route
+    those scripts to a one-shot process (see ExecutionEngine). A script that
+    exits anyway, or overruns its timeout, leaves alive False (caller
+    recreates the session).
+    """
+
+    MARKER = "<<<__EOF_pw5h_k3q_cmd_DONE_c8d1b6__>>>"
+
+    def __init__(self, working_dir: Path, timeout: float = 30):
+        """Initialize persistent PowerShell session (working_dir: start location only)"""
+        self.process = subprocess.Popen(
+            ['powershell', '-NoProfile', '-NonInteractive', '-NoLogo',
+             '-ExecutionPolicy', 'Bypass', '-Command', '-'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            bufsize=1,  # Line buffered
+            cwd=str(working_dir)
+        )
+
+        # Reader threads: readline() never blocks the caller past its deadline
+        self._stdout_lines = queue.Queue()
+        self._stderr_lines = queue.Queue()
+        for stream, lines in ((self.process.stdout, self._stdout_lines),
+                              (self.process.stderr, self._stderr_lines)):
+            threading.Thread(target=self._pump, args=(stream, lines), daemon=True).start()
+
+        # UTF-8 output, then wait for the host to answer
+        self.process.stdin.write(
+            f"[Console]::OutputEncoding = [Text.Encoding]::UTF8; '{self.MARKER}'\n"
+        )
+        self.process.stdin.flush()
+        deadline = time.monotonic() + timeout
+        while True:
+            line = self._readline(deadline)
+            if not line:
+                self.kill()
+                raise RuntimeError("PowerShell process died during initialization" if line == ''
+                                   else "PowerShell process did not answer during initialization")
+            if self.MARKER in line:
+                break
+
+    @staticmethod
+    def _pump(stream, lines: queue.Queue):
+        """Reader thread: stream lines → queue, None at EOF"""
+        for line in iter(stream.readline, ''):
+            lines.put(line)
+        lines.put(None)
+
+    def _readline(self, deadline: float) -> Optional[str]:
+        """Next stdout line: '' at EOF, None if the deadline passes first"""
+        try:
+            return self._stdout_lines.get(timeout=max(0, deadline - time.monotonic())) or ''
+        except queue.Empty:
+            return None
+
+    def _read_stderr(self, deadline: float) -> str:
+        """Host-level stderr of the current script: lines up to its stderr MARKER"""
+        chunks = []
+        while True:
+            try:
+                line = self._stderr_lines.get(timeout=max(0, deadline - time.monotonic()))
+            except queue.Empty:
+                break
+            if not line or self.MARKER in line:
+                break
+            chunks.append(line)
+        return ''.join(chunks)
+
+    def _drain_stderr(self) -> str:
+        """Host-level stderr written so far (host killed or gone: no MARKER coming)"""
+        chunks = []
+        while True:
+            try:
+                line = self._stderr_lines.get_nowait()
+            except queue.Empty:
+                break
+            if line:
+                chunks.append(line)
+        return ''.join(chunks)
+
+    @property
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def kill(self):
+        """Kill the host (timeout / broken protocol) - alive becomes False"""
+        self.process.kill()
+        self.process.wait()
+
+    def execute(self, script: str, timeout: float, stdin: str = None, cwd: str = '.') -> tuple[str, str, int]:
+        """
+        Execute script - single stdin line, output until MARKER
+
+        stdin text travels base64-encoded on the same line and is served to
+        the script as $input lines and as [Console]::In (a StringReader).
+        cwd is applied on every call (the engine's current working dir).
+
+        Returns:
+            (stdout, stderr, exitcode)
+
+        Raises:
+            subprocess.TimeoutExpired: script still running after timeout
+                seconds (host killed)
+        """
+        encoded = base64.b64encode(script.encode('utf-16-le')).decode('ascii')
+        encoded_stdin = base64.b64encode((stdin or '').encode('utf-8')).decode('ascii')
+        cwd = str(cwd).replace("'", "''")
+
+        # Fresh location + scope per script (variables do not leak between calls).
+        # Host stdin IS the command channel: scripts read a StringReader over
+        # the caller's stdin text instead ($__stdinSwapped, see command_emulator).
+        # Protocol: stdout, MARKER, error records (stderr), MARKER, EXITCODE;
+        # host-level stderr ends with its own MARKER line (no late lines
+        # attributed to the next script)
+        full_cmd = (
+            f"$__s = [Text.Encoding]::Unicode.GetString([Convert]::FromBase64String('{encoded}')); "
+            f"$__t = [Text.Encoding]::UTF8.GetString([Convert]::FromBase64String('{encoded_stdin}')); "
+            f"Set-Location -LiteralPath '{cwd}'; [Environment]::CurrentDirectory = '{cwd}'; "
+            "$global:LASTEXITCODE = 0; $__ok = $true; $__err = [Collections.ArrayList]::new(); "
+            "$__lines = if ($__t) { $__t -replace '\\r?\\n\\z' -split '\\r?\\n' } else { @() }; "
+            "$__in = [Console]::In; [Console]::SetIn([IO.StringReader]::new($__t)); $__stdinSwapped = $true; "
+            "try { $__lines | & ([scriptblock]::Create($__s)) 2>&1 | ForEach-Object { "
+            "if ($_ -is [Management.Automation.ErrorRecord]) { [void]$__err.Add($_) } else { $_ } "
+            "} | Out-String -Stream -Width 4096 } "
+            "catch { [void]$__err.Add($_); $__ok = $false } "
+            "finally { [Console]::SetIn($__in); $__stdinSwapped = $false }; "
+            "$__code = if (-not $__ok) { 1 } elseif ($global:LASTEXITCODE) { $global:LASTEXITCODE } else { 0 }; "
+            f"[Console]::Error.WriteLine('{self.MARKER}'); [Console]::Error.Flush(); "
+            f"'{self.MARKER}'; $__err | ForEach-Object {{ $_.ToString() }}; '{self.MARKER}'; \"EXITCODE:$__code\"\n"
+        )
+
+        try:
+            self.process.stdin.write(full_cmd)
+            self.process.stdin.flush()
+        except OSError as e:
+            raise RuntimeError("PowerShell process died") from e
+
+        deadline = time.monotonic() + timeout
+        sections = [[], []]  # stdout, error records
+        section = 0
+        exitcode = 0
+
+        while True:
+            line = self._readline(deadline)
+
+            if line is None:
+                self.kill()
+                raise subprocess.TimeoutExpired(
+                    ['powershell', '-Command', script], timeout,
+                    output=''.join(sections[0]), stderr=''.join(sections[1]) + self._drain_stderr()
+                )
+
+            if not line:
+                # Script called exit - host is gone, its exit code is the result
+                self.process.wait()
+                return ''.join(sections[0]), ''.join(sections[1]) + self._drain_stderr(), self.process.returncode
+
+            if self.MARKER in line:
+                # [Console]::Out.Write() output without final newline shares the MARKER line
+                tail = line[:line.index(self.MARKER)]
+                if tail:
+                    sections[section].append(tail)
+                if section == 0:
+                    section = 1
+                    continue
+                exitcode_line = self._readline(deadline)
+                if exitcode_line and exitcode_line.startswith("EXITCODE:"):
+                    try:
+                        exitcode = int(exitcode_line.split(":")[1].strip())
+                    except (IndexError, ValueError):
+                        exitcode = -1
+                break
+            sections[section].append(line)
+
+        return ''.join(sections[0]), ''.join(sections[1]) + self._read_stderr(deadline), exitcode
+
+    def close(self):
+        """Close PowerShell session gracefully"""
+        if hasattr(self, 'process') and self.process.poll() is None:
+            try:
+                self.process.stdin.write("exit\n")
+                self.process.stdin.flush()
+                self.process.wait(timeout=5)
+            except:
+                self.process.terminate()
+                try:
+                    self.process.wait(timeout=2)
+                except:
+                    self.process.kill()
+
+    def __del__(self):
+        """Cleanup on garbage collection"""
+        self.close()
+
 
 class ExecutionEngine:
     """
@@ -354,6 +572,9 @@ class ExecutionEngine:
             self.bash_session = None
         # ==========================================
 
+        # Persistent PowerShell host - created on first use (see execute_powershell_script)
+        self.powershell_session = None
+
         # Execution statistics
         self.stats = {
             'cmd': 0,
@@ -711,6 +932,74 @@ class ExecutionEngine:
             )
 
         return result
+
+    def execute_powershell_script(self, script: str, stdin: str = None, test_mode_stdout=None, **kwargs) -> subprocess.CompletedProcess:
+        """
+        Execute raw PowerShell script in the persistent PowerShell host
+
+        Saves the powershell.exe startup on every emulated command. stdin
+        data reaches the script as $input / [Console]::In text. Scripts
+        calling exit (would end the host) or writing raw stdout bytes
+        (binary output, e.g. gzip -c) still get their own process.
+
+        Args:
+            script: PowerShell script (NOT a powershell.exe command line)
+            stdin: Optional stdin data for the script
+            test_mode_stdout: Optional stdout to return in test mode (AS IF execution succeeded)
+            **kwargs: Additional subprocess.run arguments
+
+        Returns:
+            CompletedProcess result or mock result in test mode
+        """
+        if self.test_mode:
+            return self.execute_powershell(script, stdin=stdin, test_mode_stdout=test_mode_stdout)
+
+        self.stats['powershell'] += 1
+        self.stats['total'] += 1
+
+        timeout = kwargs.pop('timeout', self.default_timeout)
+
+        if _PS_ONE_SHOT_RE.search(script):
+            self.logger.debug(f"Executing PowerShell (one-shot): {script}")
+            return self._run_powershell_encoded(script, stdin=stdin, timeout=timeout, **kwargs)
+
+        # ===== USE PERSISTENT SESSION =====
+        self.logger.debug(f"Executing via persistent PowerShell: {script}")
+        try:
+            if not (self.powershell_session and self.powershell_session.alive):
+                self.powershell_session = PersistentPowerShellSession(self.working_dir, timeout)
+            output, errors, exitcode = self.powershell_session.execute(
+                script, timeout, stdin, kwargs.get('cwd', self.working_dir))
+        except (RuntimeError, OSError) as e:
+            self.logger.error(f"Persistent PowerShell session failed: {e}")
+            self.powershell_session = None
+            return self._run_powershell_encoded(script, stdin=stdin, timeout=timeout, **kwargs)
+
+        return subprocess.CompletedProcess(
+            args=['powershell', '-Command', script],
+            returncode=exitcode,
+            stdout=output,
+            stderr=errors
+        )
+
+    def _run_powershell_encoded(self, script: str, stdin: str = None, **kwargs) -> subprocess.CompletedProcess:
+        """One-shot powershell.exe - -EncodedCommand avoids re-quoting the script"""
+        encoded = base64.b64encode(script.encode('utf-16-le')).decode('ascii')
+        kwargs.setdefault('timeout', self.default_timeout)
+        kwargs.setdefault('cwd', str(self.working_dir))
+        # No stdin data: nothing to inherit from the parent either
+        if stdin is None:
+            kwargs.setdefault('stdin', subprocess.DEVNULL)
+        else:
+            kwargs['input'] = stdin
+        return subprocess.run(
+            ['powershell', '-NoProfile', '-NonInteractive', '-EncodedCommand', encoded],
+            capture_output=True,
+            text=True,
+            errors='replace',
+            encoding='utf-8',
+            **kwargs
+        )
     
     def execute_bash(self, command: str, stdin: str = None, test_mode_stdout=None, **kwargs) -> subprocess.CompletedProcess:
         """
@@ -807,8 +1096,9 @@ class ExecutionEngine:
         Execute native binary directly
 
         Args:
-            bin_path: name of binary
-            args: Command arguments
+            bin_name: name or full path of binary
+            args: Command arguments (passed as argv, no shell)
+            stdin: Optional text fed to the process
             test_mode_stdout: Optional stdout to return in test mode (AS IF execution succeeded)
             **kwargs: Additional subprocess.run arguments
 
@@ -848,6 +1138,10 @@ class ExecutionEngine:
             kwargs['timeout'] = self.default_timeout
             self.logger.debug(f"Executing Native: {cmd_str}")
 
+        if stdin is not None:
+            kwargs.setdefault('input', stdin)
+        kwargs.setdefault('cwd', str(self.working_dir))
+
         return subprocess.run(
             cmd,
             capture_output=True,
@@ -966,11 +1260,15 @@ class ExecutionEngine:
         return env
 
     def close(self):
-        """Close persistent bash session"""
+        """Close persistent bash and PowerShell sessions"""
         if hasattr(self, 'bash_session') and self.bash_session:
             self.bash_session.close()
             self.bash_session = None
             self.logger.info("Persistent bash session closed")
+        if getattr(self, 'powershell_session', None):
+            self.powershell_session.close()
+            self.powershell_session = None
+            self.logger.info("Persistent PowerShell session closed")
     
     def __del__(self):
         """Cleanup on destruction"""
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Test dei fast path di CommandEmulator (nessun processo lanciato)
+
+COVERAGE:
+- powershell_script: unwrap di UN solo wrapper (-Command / -EncodedCommand)
+- native_argv: tar/sed/awk/diff/jq come argv, quote shell rimosse, no cmd.exe
+- seq: incremento zero (anche -0), range oltre Int32 → loop
+- emulate_pipeline: None quando uno stage non e' batchabile
+"""
+import sys
+from pathlib import Path
+
+# Setup path
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from bash_tool.command_emulator import CommandEmulator, _native_command, _ps_encoded, _PS_COMMAND
+
+JQ_EXE = r'C:\Program Files\jq\jq.exe'
+
+
+def make_emulator(**native_bins):
+    """Emulator with the probed native binaries forced (None = not installed)"""
+    emulator = CommandEmulator()
+    for attr in ('_tar_exe', '_sed_exe', '_awk_exe', '_diff_exe', '_jq_exe'):
+        setattr(emulator, attr, native_bins.get(attr))
+    return emulator
+
+
+# ============================================================================
+# powershell_script
+# ============================================================================
+
+def test_powershell_script_unwraps_encoded():
+    script = "Get-ChildItem | ForEach-Object { $_.Name + ' ok' }"
+    assert make_emulator().powershell_script(_ps_encoded(script)) == script
+
+
+def test_powershell_script_unwraps_command_wrapper():
+    translated = f'{_PS_COMMAND} "Write-Output \\"a b\\""'
+    assert make_emulator().powershell_script(translated) == 'Write-Output "a b"'
+
+
+def test_powershell_script_rejects_chained_wrappers():
+    emulator = make_emulator()
+    chained = f'{_PS_COMMAND} "Write-Output 1" && {_PS_COMMAND} "Write-Output 2"'
+    assert emulator.powershell_script(chained) is None
+    assert emulator.powershell_script(_ps_encoded('1') + ' && ' + _ps_encoded('2')) is None
+
+
+def test_powershell_script_rejects_multi_file_translations():
+    emulator = make_emulator()
+    for cmd in ('touch a.txt b.txt', 'md5sum a.txt b.txt', 'sha256sum a.txt b.txt'):
+        assert emulator.powershell_script(emulator.emulate_command(cmd)) is None, cmd
+
+
+def test_powershell_script_single_file_checksum_stays_unwrappable():
+    emulator = make_emulator()
+    script = emulator.powershell_script(emulator.emulate_command('md5sum a.txt'))
+    assert script is not None
+    assert 'Get-FileHash -Path "a.txt" -Algorithm MD5' in script
+
+
+def test_powershell_script_ignores_cmd_and_native():
+    emulator = make_emulator(_tar_exe='tar.exe')
+    assert emulator.powershell_script('echo hello') is None
+    assert emulator.powershell_script(emulator.emulate_command('tar -xzf a.tgz')) is None
+
+
+# ============================================================================
+# native_argv
+# ============================================================================
+
+def test_native_argv_roundtrip():
+    emulator = make_emulator()
+    argv = [JQ_EXE, '-r', '.a | select(.b == "x y")', r'C:\data\f.json']
+    assert emulator.native_argv(_native_command(argv[0], argv[1:])) == argv
+    assert emulator.native_argv('echo hello') is None
+
+
+def test_jq_native_filter_is_one_unquoted_arg():
+    emulator = make_emulator(_jq_exe=JQ_EXE)
+    translated = emulator.emulate_command("jq -r '.items[] | select(.name == \"a b\")' data.json")
+    assert emulator.native_argv(translated) == [
+        JQ_EXE, '-r', '.items[] | select(.name == "a b")', 'data.json'
+    ]
+
+
+def test_jq_without_binary_uses_powershell_fallback():
+    emulator = make_emulator()
+    translated = emulator.emulate_command('jq .name data.json')
+    assert emulator.native_argv(translated) is None
+    assert emulator.powershell_script(translated) is not None
+
+
+def test_sed_awk_args_keep_cmd_metacharacters():
+    emulator = make_emulator(_sed_exe='sed.exe', _awk_exe='awk.exe')
+    assert emulator.native_argv(emulator.emulate_command("sed 's/%PATH%/^(x) & y/g' f.txt")) == [
+        'sed.exe', 's/%PATH%/^(x) & y/g', 'f.txt'
+    ]
+    assert emulator.native_argv(emulator.emulate_command("awk -F, '{print $1}' C:\\logs\\a.csv")) == [
+        'awk.exe', '-F,', '{print $1}', 'C:\\logs\\a.csv'
+    ]
+
+
+def test_tar_fast_path_counts_quoted_archive_as_one_operand():
+    emulator = make_emulator(_tar_exe='tar.exe')
+    assert emulator.native_argv(emulator.emulate_command('tar -xzf "my archive.tgz"')) == [
+        'tar.exe', '-xzf', 'my archive.tgz'
+    ]
+
+
+def test_diff_native_argv():
+    emulator = make_emulator(_diff_exe='diff.exe')
+    assert emulator.native_argv(emulator.emulate_command('diff -u "old file.txt" new.txt')) == [
+        'diff.exe', '-u', 'old file.txt', 'new.txt'
+    ]
+
+
+# ============================================================================
+# seq
+# ============================================================================
+
+def test_seq_zero_increment_is_an_error():
+    emulator = make_emulator()
+    for cmd in ('seq 1 0 5', 'seq 1 -0 5', 'seq 1 0.0 5', 'seq 1 -0.0 5'):
+        assert 'Zero increment' in emulator.emulate_command(cmd), cmd
+
+
+def test_seq_small_integer_range_uses_enumerable_range():
+    emulator = make_emulator()
+    assert emulator.powershell_script(emulator.emulate_command('seq 5')) == '[System.Linq.Enumerable]::Range(1, 5)'
+    # LAST < FIRST: empty, not a descending PowerShell range
+    assert emulator.powershell_script(emulator.emulate_command('seq 5 1')) == '[System.Linq.Enumerable]::Range(5, 0)'
+
+
+def test_seq_beyond_int32_falls_back_to_loop():
+    emulator = make_emulator()
+    for cmd in ('seq 1 3000000000', 'seq 0 2147483647', 'seq 2147483648 2147483650'):
+        script = emulator.powershell_script(emulator.emulate_command(cmd))
+        assert 'Enumerable' not in script, cmd
+        assert script.startswith('for ($i = '), cmd
+
+
+def test_seq_negative_increment_counts_down():
+    emulator = make_emulator()
+    script = emulator.powershell_script(emulator.emulate_command('seq 5 -1 1'))
+    assert script == 'for ($i = 5; $i -ge 1; $i += -1) { $i }'
+
+
+# ============================================================================
+# yes
+# ============================================================================
+
+def test_yes_is_a_powershell_loop_with_literal_text():
+    emulator = make_emulator()
+    script = emulator.powershell_script(emulator.emulate_command("yes it's on & %PATH%"))
+    assert "$line = 'it''s on & %PATH%'" in script
+    # Raw stdout writer: ends on a closed pipe, never batched mid-pipeline
+    assert 'OpenStandardOutput' in script
+    assert emulator.emulate_pipeline(['yes', 'sort']) is None
+
+
+# ============================================================================
+# sort
+# ============================================================================
+
+def test_sort_separator_quote_is_a_plain_single_quoted_literal():
+    emulator = make_emulator()
+    # Encoded script: " needs no command-line escaping, ' is doubled
+    script = emulator.powershell_script(emulator.emulate_command("sort -t '\"' -k 2 f.txt"))
+    assert "$fields = $_ -split '\"'" in script
+    script = emulator.powershell_script(emulator.emulate_command('sort -t "\'" -k 2 f.txt'))
+    assert "$fields = $_ -split ''''" in script
+
+
+# ============================================================================
+# wc
+# ============================================================================
+
+def test_wc_cmd_fast_path_caret_escapes_echoed_name():
+    emulator = make_emulator()
+    translated = emulator.emulate_command('wc -c a&b(1).txt')
+    assert '@echo %~zA a^&b^(1^).txt)' in translated
+    assert 'echo wc: a^&b^(1^).txt: No such file' in translated
+
+
+def test_wc_name_with_percent_skips_cmd_fast_path():
+    emulator = make_emulator()
+    assert emulator.powershell_script(emulator.emulate_command('wc -l 100%.txt')) is not None
+
+
+# ============================================================================
+# cut
+# ============================================================================
+
+def test_cut_bytes_stdin_is_read_whole_not_rejoined():
+    emulator = make_emulator()
+    script = emulator.powershell_script(emulator.emulate_command('cut -b 1-3'))
+    assert '$IN = [Console]::In.ReadToEnd(); $b = [System.Text.Encoding]::UTF8.GetBytes($IN)' in script
+    assert '$input' not in script
+
+
+# ============================================================================
+# tr
+# ============================================================================
+
+def test_tr_translate_uses_small_map_and_regex():
+    emulator = make_emulator()
+    script = emulator.powershell_script(emulator.emulate_command('tr a-c A-C'))
+    assert script.startswith('$map = @{97 = [char]65; 98 = [char]66; 99 = [char]67}; ')
+    assert "[regex]::Replace($IN, '[\\u0061-\\u0063]', " in script
+    assert '0..65535' not in script
+
+
+def test_tr_sets_with_special_chars_are_escaped():
+    emulator = make_emulator()
+    script = emulator.powershell_script(emulator.emulate_command("tr -d '$`\"]\\'"))
+    assert "[regex]::Replace($IN, '[\\u0022\\u0024\\u005C-\\u005D\\u0060]', '')" in script
+    # Quoted set is ONE operand, quotes removed
+    script = emulator.powershell_script(emulator.emulate_command('tr -s " "'))
+    assert "'([\\u0020])\\1+', '$1'" in script
+
+
+def test_tr_translate_to_dollar_is_literal():
+    emulator = make_emulator()
+    script = emulator.powershell_script(emulator.emulate_command("tr -c a-z '$'"))
+    assert "'[^\\u0061-\\u007A]', '$$'" in script
+
+
+def test_tr_fused_squeeze_is_chained_regex_passes():
+    emulator = make_emulator()
+    script = emulator.powershell_script(emulator.emulate_command("tr -cs 'a-z' '\\n'"))
+    assert "$IN = [regex]::Replace($IN, '[^\\u0061-\\u007A]', [string][char]10)" in script
+    assert "'([\\u000A])\\1+', '$1'" in script
+    assert '65536' not in script and 'ToCharArray' not in script
+
+
+# ============================================================================
+# emulate_pipeline
+# ============================================================================
+
+def test_emulate_pipeline_batches_powershell_stages():
+    emulator = make_emulator()
+    translated = emulator.emulate_pipeline(['ls -la', 'sort', 'wc -l'])
+    assert translated is not None
+    assert emulator.powershell_script(translated) is not None
+
+
+def test_emulate_pipeline_falls_back_on_cmd_stage():
+    assert make_emulator().emulate_pipeline(['echo hi', 'sort']) is None
+
+
+def test_emulate_pipeline_falls_back_on_native_stage():
+    emulator = make_emulator(_sed_exe='sed.exe')
+    assert emulator.emulate_pipeline(['ls -la', 'sed s/a/b/', 'sort']) is None
+
+
+def test_emulate_pipeline_falls_back_on_exit_before_last_stage():
+    emulator = make_emulator()
+    # cat's missing-file branch exits: fine as the last stage only
+    assert emulator.emulate_pipeline(['cat f.txt', 'sort']) is None
+    assert emulator.emulate_pipeline(['ls -la', 'cat f.txt']) is not None
+
+
+if __name__ == '__main__':
+    import pytest
+    sys.exit(pytest.main([__file__, '-v']))
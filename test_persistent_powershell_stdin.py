@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Test stdin delle traduzioni byte-stream nel PowerShell persistente
+
+SCENARIO:
+- md5sum/sha*sum/base64/gzip senza file leggono stdin come byte (_PS_OPEN_STDIN_STREAM)
+- nell'host persistente stdin reale = canale comandi: devono leggere il testo
+  passato dal chiamante, non [Console]::OpenStandardInput()
+- richiede powershell (Windows): altrimenti skip
+"""
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+# Setup path
+sys.path.insert(0, str(Path(__file__).parent / 'src'))
+
+from bash_tool.command_emulator import CommandEmulator, _PS_OPEN_STDIN_STREAM
+from bash_tool.execution_engine import PersistentPowerShellSession
+
+needs_powershell = pytest.mark.skipif(shutil.which('powershell') is None, reason='powershell not available')
+
+
+def test_stdin_stream_keys_on_swap_flag_not_reader_type():
+    # [Console]::SetIn wraps every reader (SyncTextReader): a type check never matches
+    assert '$__stdinSwapped' in _PS_OPEN_STDIN_STREAM
+    assert 'StringReader]' not in _PS_OPEN_STDIN_STREAM
+
+
+@needs_powershell
+def test_persistent_session_feeds_stdin_to_byte_stream_translations(tmp_path):
+    emulator = CommandEmulator()
+    session = PersistentPowerShellSession(tmp_path)
+    try:
+        md5 = emulator.powershell_script(emulator.emulate_command('md5sum'))
+        stdout, stderr, code = session.execute(md5, 30, stdin='hello\n')
+        assert code == 0, stderr
+        assert stdout.startswith('b1946ac92492d2347c6235b4d2611184')
+
+        # Host still answers: the scripts did not eat the next command line
+        stdout, _, code = session.execute("Write-Output 'still here'", 30)
+        assert (stdout.strip(), code) == ('still here', 0)
+    finally:
+        session.close()
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, '-v']))
@@ -6,15 +6,34 @@ Tests critical fixes using PRODUCTION bash_tool_executor.py and unix_translator.
 (NOT the REFACTORED versions)
 """
 
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 from bash_tool_executor import BashToolExecutor
 from pathlib import Path
 
 # Setup
 WORKSPACE = Path("/home/user/couch")
-executor = BashToolExecutor(working_dir=str(WORKSPACE))
 
-# CRITICAL: Set TESTMODE manually
-executor.TESTMODE = True
+# Tests are independent and each spawns processes: they run on a thread pool.
+# One executor per worker thread (BashToolExecutor is not known thread-safe)
+_local = threading.local()
+
+# Translation lines worth showing from a test-mode result (one regex pass)
+_MARKER_RE = re.compile(r'^.*(?:Would execute:|Translation:).*$', re.MULTILINE)
+
+
+def get_executor():
+    """Executor of the current worker thread (created on first use)"""
+    executor = getattr(_local, 'executor', None)
+    if executor is None:
+        executor = BashToolExecutor(working_dir=str(WORKSPACE))
+        # CRITICAL: Set TESTMODE manually
+        executor.TESTMODE = True
+        _local.executor = executor
+    return executor
+
 
 print("=" * 80)
 print("FINAL VALIDATION - PRODUCTION FILES")
@@ -25,14 +44,16 @@ print("TESTMODE: Enabled")
 print()
 
 def test(name, cmd):
-    """Run a single test"""
-    print("-" * 80)
-    print(f"TEST: {name}")
-    print(f"CMD:  {cmd}")
-    print()
+    """
+    Run a single test.
+
+    Returns (passed, report): the report is printed by the main thread, in
+    test order, so concurrent tests never interleave their reports.
+    """
+    out = ["-" * 80, f"TEST: {name}", f"CMD:  {cmd}", ""]
 
     try:
-        result = executor.execute({'command': cmd, 'description': name})
+        result = get_executor().execute({'command': cmd, 'description': name})
 
         # Check for errors
         is_error = any([
@@ -43,138 +64,94 @@ def test(name, cmd):
         ])
 
         if is_error:
-            print(f"✗ FAILED\n{result[:500]}\n")
-            return False
+            out.append(f"✗ FAILED\n{result[:500]}\n")
+            return False, "\n".join(out)
         else:
-            print(f"✓ PASSED")
+            out.append(f"✓ PASSED")
             # Show translation for key tests
             if "[TEST MODE]" in result:
-                for line in result.split('\n'):
-                    if "Would execute:" in line or "Translation:" in line:
-                        print(f"  {line}")
-            print()
-            return True
+                for m in _MARKER_RE.finditer(result):
+                    out.append(f"  {m.group(0)}")
+            out.append("")
+            return True, "\n".join(out)
     except Exception as e:
-        print(f"✗ EXCEPTION: {e}\n")
-        return False
-
+        out.append(f"✗ EXCEPTION: {e}\n")
+        return False, "\n".join(out)
+
+
+# (section title, [(name, cmd), ...]) in report order
+SECTIONS = [
+    # ========================================================================
+    # CRITICAL FIX #1: Pipeline head/tail/wc stdin support
+    # ========================================================================
+    ("FIX #1: Pipeline head/tail/wc stdin support", [
+        ("head in pipeline", "git log --oneline | head -20"),
+        ("tail in pipeline", "find . -name '*.py' | tail -10"),
+        ("wc in pipeline", "grep 'ERROR' bash_tool_executor.py | wc -l"),
+    ]),
+
+    # ========================================================================
+    # CRITICAL FIX #2: Preserve $(command) syntax
+    # ========================================================================
+    ("FIX #2: Preserve $(command) syntax", [
+        ("simple command substitution", "echo $(date)"),
+        ("nested in quotes", 'echo "Current: $(pwd)"'),
+    ]),
+
+    # ========================================================================
+    # CRITICAL FIX #3: Translate commands inside $()
+    # ========================================================================
+    ("FIX #3: Translate commands inside $() with force_translate", [
+        ("find inside $()", 'grep -r "import" $(find . -name "*.py" -type f)'),
+        ("wc inside $()", 'echo "Total: $(find . -name "*.py" | wc -l)"'),
+    ]),
+
+    # ========================================================================
+    # CRITICAL FIX #4: Preserve <(command) and >(command)
+    # ========================================================================
+    ("FIX #4: Preserve <(command) process substitution", [
+        ("process substitution input", "diff <(cat file1) <(cat file2)"),
+        ("process substitution with sort", "comm -12 <(sort file1) <(sort file2)"),
+    ]),
+
+    # ========================================================================
+    # CRITICAL FIX #5: PowerShell cmdlet detection
+    # ========================================================================
+    ("FIX #5: PowerShell cmdlet detection in _needs_powershell", [
+        ("find -exec (generates Get-ChildItem)", 'find . -name "*.py" -exec grep -l "class" {} \\;'),
+    ]),
+
+    # ========================================================================
+    # COMBINED TESTS: Multiple fixes together
+    # ========================================================================
+    ("COMBINED: Multiple fixes working together", [
+        ("pipeline + command substitution", 'git log --oneline | head -20 | awk \'{print $1}\' | wc -l'),
+        ("find + wc in pipeline", 'find . -name "*.py" -type f -exec wc -l {} + | tail -1'),
+    ]),
+]
+
+tests = [t for _, section_tests in SECTIONS for t in section_tests]
+
+# Run concurrently; map() keeps results in submission order
+with ThreadPoolExecutor(max_workers=min(8, len(tests))) as pool:
+    results = iter(pool.map(lambda t: test(*t), tests))
 
 # Track results
 passed = 0
 failed = 0
 
-# ============================================================================
-# CRITICAL FIX #1: Pipeline head/tail/wc stdin support
-# ============================================================================
-print("=" * 80)
-print("FIX #1: Pipeline head/tail/wc stdin support")
-print("=" * 80)
-print()
-
-if test("head in pipeline", "git log --oneline | head -20"):
-    passed += 1
-else:
-    failed += 1
-
-if test("tail in pipeline", "find . -name '*.py' | tail -10"):
-    passed += 1
-else:
-    failed += 1
-
-if test("wc in pipeline", "grep 'ERROR' bash_tool_executor.py | wc -l"):
-    passed += 1
-else:
-    failed += 1
-
-
-# ============================================================================
-# CRITICAL FIX #2: Preserve $(command) syntax
-# ============================================================================
-print("=" * 80)
-print("FIX #2: Preserve $(command) syntax")
-print("=" * 80)
-print()
-
-if test("simple command substitution", "echo $(date)"):
-    passed += 1
-else:
-    failed += 1
-
-if test("nested in quotes", 'echo "Current: $(pwd)"'):
-    passed += 1
-else:
-    failed += 1
-
-
-# ============================================================================
-# CRITICAL FIX #3: Translate commands inside $()
-# ============================================================================
-print("=" * 80)
-print("FIX #3: Translate commands inside $() with force_translate")
-print("=" * 80)
-print()
-
-if test("find inside $()", 'grep -r "import" $(find . -name "*.py" -type f)'):
-    passed += 1
-else:
-    failed += 1
-
-if test("wc inside $()", 'echo "Total: $(find . -name "*.py" | wc -l)"'):
-    passed += 1
-else:
-    failed += 1
-
-
-# ============================================================================
-# CRITICAL FIX #4: Preserve <(command) and >(command)
-# ============================================================================
-print("=" * 80)
-print("FIX #4: Preserve <(command) process substitution")
-print("=" * 80)
-print()
-
-if test("process substitution input", "diff <(cat file1) <(cat file2)"):
-    passed += 1
-else:
-    failed += 1
-
-if test("process substitution with sort", "comm -12 <(sort file1) <(sort file2)"):
-    passed += 1
-else:
-    failed += 1
-
-
-# ============================================================================
-# CRITICAL FIX #5: PowerShell cmdlet detection
-# ============================================================================
-print("=" * 80)
-print("FIX #5: PowerShell cmdlet detection in _needs_powershell")
-print("=" * 80)
-print()
-
-if test("find -exec (generates Get-ChildItem)", 'find . -name "*.py" -exec grep -l "class" {} \\;'):
-    passed += 1
-else:
-    failed += 1
-
-
-# ============================================================================
-# COMBINED TESTS: Multiple fixes together
-# ============================================================================
-print("=" * 80)
-print("COMBINED: Multiple fixes working together")
-print("=" * 80)
-print()
-
-if test("pipeline + command substitution", 'git log --oneline | head -20 | awk \'{print $1}\' | wc -l'):
-    passed += 1
-else:
-    failed += 1
-
-if test("find + wc in pipeline", 'find . -name "*.py" -type f -exec wc -l {} + | tail -1'):
-    passed += 1
-else:
-    failed += 1
+for title, section_tests in SECTIONS:
+    print("=" * 80)
+    print(title)
+    print("=" * 80)
+    print()
+    for _ in section_tests:
+        ok, report = next(results)
+        print(report)
+        if ok:
+            passed += 1
+        else:
+            failed += 1
 
 
 # ============================================================================